@@ -2,6 +2,7 @@ from ape import plugins
 from ape.api.networks import LOCAL_NETWORK_NAME, NetworkAPI, create_network_type
 
 from .ecosystem import NETWORKS, Beacon, BeaconConfig
+from .query import BeaconQueryEngine
 
 
 @plugins.register(plugins.Config)
@@ -14,6 +15,11 @@ def ecosystems():
     yield Beacon
 
 
+@plugins.register(plugins.QueryPlugin)
+def query_engines():
+    yield BeaconQueryEngine
+
+
 @plugins.register(plugins.NetworkPlugin)
 def networks():
     for network_name, network_params in NETWORKS.items():
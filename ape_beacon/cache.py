@@ -0,0 +1,203 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Union
+
+from ape.api.providers import BlockAPI
+from pydantic import BaseModel
+
+BlockCacheKey = Union[int, str]
+"""
+A slot number or a (lowercase, ``0x``-prefixed) block root.
+"""
+
+
+class BlockCacheSettings(BaseModel):
+    """
+    Settings for :class:`~ape_beacon.cache.BlockCache`, read from the provider settings.
+    """
+
+    block_cache_size: int = 1024  # max number of blocks kept in memory
+    block_cache_ttl: float = 12.0  # seconds a non-finalized block stays valid (one slot)
+
+
+class BlockCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class _CacheEntry(NamedTuple):
+    block: BlockAPI
+    roots: Set[str]
+    expires_at: Optional[float]  # NOTE: `None` for finalized blocks
+
+
+class BlockCache:
+    """
+    A thread-safe LRU cache of decoded beacon blocks, keyed by slot and by block root.
+
+    Blocks not known to be canonical are cached under their root only, so they never
+    shadow the canonical block at their slot. Finalized blocks never expire and are
+    only dropped when evicted by size.
+    Non-finalized blocks expire after ``ttl`` seconds or when
+    :meth:`~ape_beacon.cache.BlockCache.invalidate_unfinalized` is called on a new head.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 12.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # NOTE: Keyed by slot, or by root for blocks not known to be canonical
+        self._blocks: "OrderedDict[BlockCacheKey, _CacheEntry]" = OrderedDict()
+        self._roots: Dict[str, BlockCacheKey] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    @property
+    def stats(self) -> BlockCacheStats:
+        return BlockCacheStats(hits=self.hits, misses=self.misses, size=len(self))
+
+    def get(self, key: BlockCacheKey) -> Optional[BlockAPI]:
+        """
+        Returns the cached block for slot or root ``key``, if present and not expired.
+        """
+        with self._lock:
+            entry_key = self._roots.get(key) if isinstance(key, str) else key
+            if entry_key is None:
+                self.misses += 1
+                return None
+
+            entry = self._blocks.get(entry_key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= time.monotonic():
+                    self._remove(entry_key)
+                    entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._blocks.move_to_end(entry_key)
+            self.hits += 1
+            return entry.block
+
+    def count(self, start: int, stop: int, step: int = 1) -> int:
+        """
+        Returns the number of unexpired cached blocks for every ``step`` slots from
+        ``start`` through ``stop`` (inclusive), without touching the LRU order or stats.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sum(
+                isinstance(slot, int)
+                and start <= slot <= stop
+                and (slot - start) % step == 0
+                and (entry.expires_at is None or entry.expires_at > now)
+                for slot, entry in self._blocks.items()
+            )
+
+    def put(
+        self, block: BlockAPI, finalized: bool, root: Optional[str] = None, canonical: bool = True
+    ):
+        """
+        Caches ``block`` under its slot and, if given, its block ``root``. A block not
+        known to be ``canonical``, e.g. fetched by root, is cached under ``root`` only.
+        """
+        if self.max_size <= 0 or block.number is None:
+            return
+
+        slot = block.number
+        expires_at = None if finalized else time.monotonic() + self.ttl
+        with self._lock:
+            if not canonical:
+                self._put_by_root(block, root, expires_at)
+                return
+
+            if root is not None and root in self._blocks:
+                self._remove(root)  # NOTE: Now known to be canonical
+
+            existing = self._blocks.pop(slot, None)
+            roots: Set[str] = set()
+            if existing is not None and _is_same_block(existing.block, block):
+                roots = set(existing.roots)
+            elif existing is not None:
+                # NOTE: e.g. reorged out, so its roots must not resolve to the new block
+                for old_root in existing.roots:
+                    self._roots.pop(old_root, None)
+
+            if root is not None:
+                roots.add(root)
+                self._roots[root] = slot
+
+            self._blocks[slot] = _CacheEntry(block=block, roots=roots, expires_at=expires_at)
+            self._evict()
+
+    def _put_by_root(self, block: BlockAPI, root: Optional[str], expires_at: Optional[float]):
+        if root is None:
+            return
+
+        slot = block.number
+        entry = self._blocks.get(slot) if slot is not None else None
+        if slot is not None and entry is not None and _is_same_block(entry.block, block):
+            # NOTE: The canonical block at the slot, so its entry serves the root too
+            entry.roots.add(root)
+            self._roots[root] = slot
+            return
+
+        if self._roots.get(root) not in (None, root):
+            self._remove_root(root)
+
+        self._blocks.pop(root, None)
+        self._blocks[root] = _CacheEntry(block=block, roots={root}, expires_at=expires_at)
+        self._roots[root] = root
+        self._evict()
+
+    def _evict(self):
+        while len(self._blocks) > self.max_size:
+            self._remove(next(iter(self._blocks)))
+
+    def invalidate_unfinalized(self):
+        """
+        Drops all non-finalized blocks, e.g. when a new head arrives.
+        """
+        with self._lock:
+            unfinalized = [s for s, e in self._blocks.items() if e.expires_at is not None]
+            for slot in unfinalized:
+                self._remove(slot)
+
+    def invalidate_slots(self, slots: Iterable[int]):
+        """
+        Drops the non-finalized blocks at ``slots``, e.g. the slots reverted by a reorg.
+        """
+        with self._lock:
+            for slot in slots:
+                entry = self._blocks.get(slot)
+                if entry is not None and entry.expires_at is not None:
+                    self._remove(slot)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._roots.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key: BlockCacheKey):
+        entry = self._blocks.pop(key)
+        for root in entry.roots:
+            self._roots.pop(root, None)
+
+    def _remove_root(self, root: str):
+        key = self._roots.pop(root)
+        entry = self._blocks.get(key)
+        if entry is not None:
+            entry.roots.discard(root)
+
+
+def _is_same_block(block: BlockAPI, other: BlockAPI) -> bool:
+    return block is other or (block.hash is not None and block.hash == other.hash)
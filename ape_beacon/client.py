@@ -0,0 +1,718 @@
+import asyncio
+import codecs
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
+
+import aiohttp
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from web3.beacon import Beacon
+
+from ape_beacon.exceptions import SSZDecodingError
+from ape_beacon.ssz import SIGNED_BEACON_BLOCKS, decode_signed_beacon_block
+
+SSZ_CONTENT_TYPE = "application/octet-stream"
+SSZ_ACCEPT = f"{SSZ_CONTENT_TYPE};q=1,application/json;q=0.9"
+NOT_FOUND_STATUS_CODES = (400, 404)  # NOTE: Unknown or invalid block / validator id
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+
+class BeaconClientSettings(BaseModel):
+    """
+    Transport settings for :class:`~ape_beacon.client.BeaconClient`, read from
+    the provider settings.
+    """
+
+    pool_connections: int = 10  # number of per-host connection pools to cache
+    pool_maxsize: int = 32  # max connections kept alive per host
+    keep_alive: bool = True
+    gzip: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    max_concurrency: int = 256  # max in-flight requests for the async client
+    ssz: bool = False  # request SSZ encoded blocks (decoded in Python), falling back to JSON
+    validator_chunk_size: int = 64  # max validator ids per bulk request (fits a GET URL)
+    health_check_interval: float = 12.0  # seconds before cached health needs a live probe
+    uris: List[str] = []  # multiple beacon endpoints to balance reads across
+    load_balancing: Literal["round_robin", "least_outstanding"] = "round_robin"
+    max_sync_distance: int = 2  # slots an endpoint may lag before it is avoided
+    max_retries: int = 3  # retries of a request on a connection error, 429 or 502-504
+    retry_backoff: float = 0.5  # base seconds of the jittered exponential backoff
+    max_retry_backoff: float = 30.0
+    requests_per_second: Optional[float] = None  # client-side rate limit, unlimited if unset
+    rate_limit_burst: Optional[int] = None  # defaults to one second's worth of requests
+
+    @property
+    def timeout(self):
+        return (self.connect_timeout, self.read_timeout)
+
+    def retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns the seconds to wait before retry ``attempt`` (0-based), honoring a
+        ``Retry-After`` header value if the node sent one.
+        """
+        delay = _parse_retry_after(retry_after) if retry_after else None
+        if delay is None:
+            # NOTE: "Full jitter" spreads out retries of many concurrent requests
+            delay = random.uniform(0, self.retry_backoff * 2**attempt)
+
+        return min(delay, self.max_retry_backoff)
+
+    def create_rate_limiter(self) -> Optional["TokenBucket"]:
+        if not self.requests_per_second:
+            return None
+
+        return TokenBucket(self.requests_per_second, capacity=self.rate_limit_burst)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket allowing ``rate`` requests per second on average,
+    with bursts of up to ``capacity`` requests.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, returning the seconds the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            # NOTE: Tokens may go negative so waiting callers are served in order
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+class BeaconClient(Beacon):
+    """
+    A `web3.py Beacon API <https://web3py.readthedocs.io/en/latest/web3.beacon.html>`__
+    client that owns a pooled, keep-alive ``requests.Session`` so repeated requests
+    against the same node reuse connections instead of paying for a new handshake.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        settings: Optional[BeaconClientSettings] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(base_url)
+        self.settings = settings or BeaconClientSettings()
+        self.session = self._create_session(headers)
+        self._supports_post = True  # NOTE: Unset on first rejected POST request
+        self._supports_ssz = True  # NOTE: Unset on first block of a fork not decodable here
+        self._rate_limiter = self.settings.create_rate_limiter()
+
+        # NOTE: Updated passively by every request, see `_send()`
+        self.healthy: Optional[bool] = None
+        self.health_updated_at = 0.0
+        self.latency: Optional[float] = None  # NOTE: Moving average, in seconds
+
+    @property
+    def health_expired(self) -> bool:
+        """
+        ``True`` when no request has reported on the node's health within
+        ``health_check_interval`` seconds.
+        """
+        age = time.monotonic() - self.health_updated_at
+        return self.healthy is None or age > self.settings.health_check_interval
+
+    def record_health(self, healthy: bool):
+        self.healthy = healthy
+        self.health_updated_at = time.monotonic()
+
+    def record_latency(self, seconds: float):
+        self.latency = seconds if self.latency is None else 0.8 * self.latency + 0.2 * seconds
+
+    def _create_session(self, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.settings.pool_connections,
+            pool_maxsize=self.settings.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update(headers or {})
+        session.headers["Accept-Encoding"] = "gzip, deflate" if self.settings.gzip else "identity"
+        session.headers["Connection"] = "keep-alive" if self.settings.keep_alive else "close"
+        return session
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request, retrying connection errors and transient (429, 502-504)
+        responses with backoff. The last response is returned once out of retries.
+        """
+        kwargs.setdefault("timeout", self.settings.timeout)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                time.sleep(self._rate_limiter.reserve())
+
+            retry_after = None
+            try:
+                response = self._send_once(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= self.settings.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.record_latency(time.monotonic() - started)
+                    return response
+                elif attempt >= self.settings.max_retries:
+                    return response
+
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            time.sleep(self.settings.retry_delay(attempt, retry_after))
+            attempt += 1
+
+    def _send_once(self, method: str, url: str, **kwargs) -> requests.Response:
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.record_health(False)
+            raise
+
+        # NOTE: Client errors such as a missing block still mean the node is up
+        self.record_health(response.status_code < 500)
+        return response
+
+    def _make_get_request(self, endpoint: str) -> Dict[str, Any]:
+        response = self._send("GET", self.base_url + endpoint)
+        response.raise_for_status()
+        return response.json()
+
+    def _make_post_request(self, endpoint: str, body: Any) -> Dict[str, Any]:
+        response = self._send("POST", self.base_url + endpoint, json=body)
+        response.raise_for_status()
+        return response.json()
+
+    def _make_bulk_request(
+        self, endpoint: str, body: Any, validator_ids: Sequence[str]
+    ) -> Dict[str, Any]:
+        # NOTE: Prefer POST as it has no URL length limit, but not all nodes support it
+        if self._supports_post:
+            try:
+                return self._make_post_request(endpoint, body)
+            except requests.exceptions.HTTPError as err:
+                if err.response is None or err.response.status_code not in (404, 405, 415):
+                    raise
+
+                self._supports_post = False
+
+        return self._make_get_request(f"{endpoint}?id={','.join(validator_ids)}")
+
+    def get_validators_by_ids(
+        self, validator_ids: Sequence[str], state_id: str = "head"
+    ) -> Dict[str, Any]:
+        """
+        Gets many validators by index or pubkey in one request.
+        """
+        endpoint = f"/eth/v1/beacon/states/{state_id}/validators"
+        return self._make_bulk_request(endpoint, {"ids": list(validator_ids)}, validator_ids)
+
+    def get_validator_balances_by_ids(
+        self, validator_ids: Sequence[str], state_id: str = "head"
+    ) -> Dict[str, Any]:
+        """
+        Gets many validator balances by index or pubkey in one request.
+        """
+        endpoint = f"/eth/v1/beacon/states/{state_id}/validator_balances"
+        return self._make_bulk_request(endpoint, list(validator_ids), validator_ids)
+
+    def iter_validators(self, state_id: str = "head") -> Iterator[Dict[str, Any]]:
+        """
+        Streams every validator of a state, parsing one item at a time so the full
+        JSON response never has to be held in memory.
+        """
+        url = self.base_url + f"/eth/v1/beacon/states/{state_id}/validators"
+        with self._send("GET", url, stream=True) as response:
+            response.raise_for_status()
+            yield from _iter_json_data_items(response.iter_content(chunk_size=1 << 16))
+
+    def iter_events(self, topics: Sequence[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Subscribes to the node's server-sent event stream for ``topics``, yielding
+        ``(event, data)`` pairs until the connection closes.
+        """
+        url = self.base_url + f"/eth/v1/events?topics={','.join(topics)}"
+        headers = {"Accept": "text/event-stream"}
+        with self._send("GET", url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            try:
+                lines = response.iter_lines(decode_unicode=True)
+                for event in _iter_server_sent_events(lines):
+                    self.record_health(True)
+                    yield event
+
+            except requests.exceptions.RequestException:
+                self.record_health(False)
+                raise
+
+    def get_block_headers(
+        self, slot: Optional[int] = None, parent_root: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Gets the block headers at ``slot`` and / or with parent ``parent_root``,
+        including non-canonical ones. Defaults to the head headers.
+        """
+        params = {"slot": slot, "parent_root": parent_root}
+        query = "&".join(f"{name}={value}" for name, value in params.items() if value is not None)
+        endpoint = "/eth/v1/beacon/headers"
+        return self._make_get_request(f"{endpoint}?{query}" if query else endpoint)
+
+    def get_randao(self, state_id: str = "head", epoch: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Gets the RANDAO mix of ``epoch`` (defaults to the state's epoch) as of ``state_id``.
+        """
+        endpoint = f"/eth/v1/beacon/states/{state_id}/randao"
+        return self._make_get_request(endpoint if epoch is None else f"{endpoint}?epoch={epoch}")
+
+    def get_light_client_bootstrap(self, block_root: str) -> Dict[str, Any]:
+        return self._make_get_request(f"/eth/v1/beacon/light_client/bootstrap/{block_root}")
+
+    def get_light_client_updates(self, start_period: int, count: int) -> List[Dict[str, Any]]:
+        """
+        Gets the best light client update of each sync committee period from
+        ``start_period``, for up to ``count`` periods.
+        """
+        # NOTE: Responds with a list, unlike the other endpoints
+        endpoint = "/eth/v1/beacon/light_client/updates"
+        query = f"start_period={start_period}&count={count}"
+        response = self._send("GET", f"{self.base_url}{endpoint}?{query}")
+        response.raise_for_status()
+        return response.json()
+
+    def get_light_client_finality_update(self) -> Dict[str, Any]:
+        return self._make_get_request("/eth/v1/beacon/light_client/finality_update")
+
+    def get_light_client_optimistic_update(self) -> Dict[str, Any]:
+        return self._make_get_request("/eth/v1/beacon/light_client/optimistic_update")
+
+    def get_health(self) -> int:
+        # NOTE: Sent once, as 206 (syncing) and 503 (not ready) are the answer, not transient
+        if self._rate_limiter is not None:
+            time.sleep(self._rate_limiter.reserve())
+
+        url = self.base_url + "/eth/v1/node/health"
+        with self._send_once("GET", url, timeout=self.settings.timeout) as response:
+            return response.status_code
+
+    def get_block(self, block_id: str) -> Dict[str, Any]:
+        endpoint = f"/eth/v2/beacon/blocks/{block_id}"
+        if not self.settings.ssz or not self._supports_ssz:
+            return self._make_get_request(endpoint)
+
+        url = self.base_url + endpoint
+        headers = {"Accept": SSZ_ACCEPT}
+        response = self._send("GET", url, headers=headers)
+        if response.status_code in (406, 415):
+            return self._make_get_request(endpoint)  # NOTE: Node does not support SSZ
+
+        response.raise_for_status()
+        if not _is_ssz(response.headers.get("Content-Type")):
+            return response.json()
+
+        version = response.headers.get("Eth-Consensus-Version", "")
+        if not _is_ssz_decodable(version):
+            # NOTE: Later blocks are of this fork or newer, don't download them twice
+            self._supports_ssz = False
+            return self._make_get_request(endpoint)
+
+        try:
+            return decode_signed_beacon_block(response.content, version)
+        except SSZDecodingError:
+            return self._make_get_request(endpoint)  # NOTE: e.g. malformed SSZ data
+
+    def close(self):
+        """
+        Closes all pooled connections held by the session.
+        """
+        self.session.close()
+
+
+class EndpointState:
+    """
+    Load, latency and sync status of one endpoint of a
+    :class:`~ape_beacon.client.MultiBeaconClient`.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.outstanding = 0
+        self.latency: Optional[float] = None  # NOTE: Moving average, in seconds
+        self.healthy = True
+        self.head_slot: Optional[int] = None
+        self.sync_distance = 0
+
+    def record_latency(self, seconds: float):
+        self.latency = seconds if self.latency is None else 0.8 * self.latency + 0.2 * seconds
+
+
+class MultiBeaconClient(BeaconClient):
+    """
+    A :class:`~ape_beacon.client.BeaconClient` that spreads requests across several
+    beacon nodes, either round-robin or to the endpoint with the fewest outstanding
+    requests. Unhealthy or lagging endpoints are avoided, and a request that fails on
+    one endpoint is retried on the next.
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        settings: Optional[BeaconClientSettings] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        if not base_urls:
+            raise ValueError("At least one beacon endpoint is required.")
+
+        super().__init__(base_urls[0], settings=settings, headers=headers)
+        self.endpoints = [EndpointState(base_url) for base_url in base_urls]
+        self._next_endpoint = 0
+        self._sync_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _send_once(self, method: str, url: str, **kwargs) -> requests.Response:
+        self._refresh_sync_status()
+        path = url[len(self.base_url) :]
+        endpoints = self._ordered_endpoints()
+        for position, endpoint in enumerate(endpoints):
+            with self._lock:
+                endpoint.outstanding += 1
+
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, endpoint.base_url + path, **kwargs)
+            except requests.exceptions.RequestException as err:
+                endpoint.healthy = False
+                error = err
+                continue
+            finally:
+                with self._lock:
+                    endpoint.outstanding -= 1
+
+            endpoint.record_latency(time.monotonic() - started)
+            endpoint.healthy = response.status_code < 500
+            if position == len(endpoints) - 1 or not self._should_retry(endpoint, response):
+                self.record_health(any(e.healthy for e in self.endpoints))
+                return response
+
+            response.close()
+
+        self.record_health(False)
+        raise requests.exceptions.ConnectionError("All beacon endpoints failed.") from error
+
+    def _ordered_endpoints(self) -> List[EndpointState]:
+        with self._lock:
+            if self.settings.load_balancing == "least_outstanding":
+                endpoints = sorted(self.endpoints, key=lambda e: (e.outstanding, e.latency or 0))
+            else:
+                start = self._next_endpoint
+                self._next_endpoint = (start + 1) % len(self.endpoints)
+                endpoints = self.endpoints[start:] + self.endpoints[:start]
+
+        # NOTE: Stable sort keeps the balancing order within each group
+        return sorted(endpoints, key=lambda e: (not e.healthy, self._is_lagging(e)))
+
+    def _is_lagging(self, endpoint: EndpointState) -> bool:
+        return endpoint.sync_distance > self.settings.max_sync_distance
+
+    def _should_retry(self, endpoint: EndpointState, response: requests.Response) -> bool:
+        if response.status_code >= 500 or response.status_code == 429:
+            return True
+
+        # NOTE: A lagging node may not have a recent block yet
+        head_slots = [e.head_slot for e in self.endpoints if e.head_slot is not None]
+        behind = endpoint.head_slot is not None and endpoint.head_slot < max(head_slots)
+        return response.status_code == 404 and (self._is_lagging(endpoint) or behind)
+
+    def _refresh_sync_status(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._sync_checked_at < self.settings.health_check_interval:
+                return
+
+            self._sync_checked_at = now
+
+        for endpoint in self.endpoints:
+            try:
+                response = self.session.get(
+                    endpoint.base_url + "/eth/v1/node/syncing", timeout=self.settings.timeout
+                )
+                response.raise_for_status()
+                data = response.json()["data"]
+                endpoint.head_slot = int(data["head_slot"])
+                endpoint.sync_distance = int(data["sync_distance"])
+                endpoint.healthy = True
+            except (requests.exceptions.RequestException, KeyError, ValueError):
+                endpoint.healthy = False
+
+
+class AsyncBeaconClient:
+    """
+    A non-blocking counterpart of :class:`~ape_beacon.client.BeaconClient` built on
+    ``aiohttp``. Serves the same endpoints, sharing one pooled ``aiohttp.ClientSession``
+    and capping in-flight requests at ``settings.max_concurrency``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        settings: Optional[BeaconClientSettings] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.base_url = base_url
+        self.settings = settings or BeaconClientSettings()
+        self.headers = headers or {}
+
+        # NOTE: Created lazily as aiohttp sessions are bound to the running loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._supports_ssz = True  # NOTE: Unset on first block of a fork not decodable here
+        self._rate_limiter = self.settings.create_rate_limiter()
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._session = None
+            self._semaphore = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.settings.max_concurrency,
+                limit_per_host=self.settings.pool_maxsize,
+                force_close=not self.settings.keep_alive,
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.settings.connect_timeout,
+                sock_read=self.settings.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=self.headers,
+                auto_decompress=self.settings.gzip,
+            )
+
+        return self._session
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        self._bind_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.settings.max_concurrency)
+
+        return self._semaphore
+
+    async def _send(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        """
+        Sends a GET request, retrying like :meth:`~ape_beacon.client.BeaconClient._send`.
+        Returns the released response and its body.
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+
+            retry_after = None
+            try:
+                response, body = await self._send_once(url, headers=headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.settings.max_retries:
+                    raise
+            else:
+                if response.status not in RETRY_STATUS_CODES:
+                    return response, body
+                elif attempt >= self.settings.max_retries:
+                    return response, body
+
+                retry_after = response.headers.get("Retry-After")
+
+            await asyncio.sleep(self.settings.retry_delay(attempt, retry_after))
+            attempt += 1
+
+    async def _send_once(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        async with self.semaphore:
+            async with self.session.get(url, headers=headers) as response:
+                body = await response.read()
+
+        return response, body
+
+    async def _make_get_request(self, endpoint: str) -> Dict[str, Any]:
+        response, body = await self._send(self.base_url + endpoint)
+        response.raise_for_status()
+        return json.loads(body)
+
+    async def get_health(self) -> int:
+        if self._rate_limiter is not None:
+            await asyncio.sleep(self._rate_limiter.reserve())
+
+        response, _ = await self._send_once(self.base_url + "/eth/v1/node/health")
+        return response.status
+
+    async def get_block(self, block_id: str) -> Dict[str, Any]:
+        endpoint = f"/eth/v2/beacon/blocks/{block_id}"
+        if not self.settings.ssz or not self._supports_ssz:
+            return await self._make_get_request(endpoint)
+
+        url = self.base_url + endpoint
+        response, body = await self._send(url, headers={"Accept": SSZ_ACCEPT})
+        if response.status in (406, 415):
+            return await self._make_get_request(endpoint)  # NOTE: Node does not support SSZ
+
+        response.raise_for_status()
+        if not _is_ssz(response.headers.get("Content-Type")):
+            return json.loads(body)
+
+        version = response.headers.get("Eth-Consensus-Version", "")
+        if not _is_ssz_decodable(version):
+            # NOTE: Later blocks are of this fork or newer, don't download them twice
+            self._supports_ssz = False
+            return await self._make_get_request(endpoint)
+
+        try:
+            return decode_signed_beacon_block(body, version)
+        except SSZDecodingError:
+            return await self._make_get_request(endpoint)  # NOTE: e.g. malformed SSZ data
+
+    async def get_block_header(self, block_id: str) -> Dict[str, Any]:
+        return await self._make_get_request(f"/eth/v1/beacon/headers/{block_id}")
+
+    async def get_validator(self, validator_id: str, state_id: str = "head") -> Dict[str, Any]:
+        return await self._make_get_request(
+            f"/eth/v1/beacon/states/{state_id}/validators/{validator_id}"
+        )
+
+    async def close(self):
+        """
+        Closes all pooled connections held by the session.
+        """
+        if self._session is not None and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+
+        self._loop = None
+        self._session = None
+        self._semaphore = None
+
+
+def _iter_json_data_items(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    # NOTE: Incrementally decodes the items of the top-level ``"data"`` array
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunk_iter = iter(chunks)
+    buffer = ""
+
+    def read_more() -> bool:
+        nonlocal buffer
+        for chunk in chunk_iter:
+            if chunk:
+                buffer += text_decoder.decode(chunk)
+                return True
+
+        return False
+
+    while True:
+        key = buffer.find('"data"')
+        start = buffer.find("[", key) if key >= 0 else -1
+        if start >= 0:
+            break
+        elif not read_more():
+            return
+
+    position = start + 1
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+
+        if position == len(buffer):
+            buffer, position = "", 0
+            if not read_more():
+                raise ValueError("Unexpected end of JSON data array.")
+
+            continue
+        elif buffer[position] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            buffer, position = buffer[position:], 0
+            if not read_more():
+                raise
+
+            continue
+
+        yield item
+        position = end
+
+
+def _iter_server_sent_events(lines: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    # SEE: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
+    event = "message"
+    data: List[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+
+            event, data = "message", []
+        elif line.startswith(":"):
+            continue  # NOTE: Comment, e.g. keep-alive
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    # NOTE: Either delay-seconds or an HTTP-date
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _is_ssz(content_type: Optional[str]) -> bool:
+    return content_type is not None and content_type.split(";")[0].strip() == SSZ_CONTENT_TYPE
+
+
+def _is_ssz_decodable(version: str) -> bool:
+    return version.lower() in SIGNED_BEACON_BLOCKS
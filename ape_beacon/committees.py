@@ -0,0 +1,245 @@
+from collections import OrderedDict
+from hashlib import sha256
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ape_beacon.registry import ValidatorRegistry
+from ape_beacon.types import SLOTS_PER_EPOCH
+
+SHUFFLE_ROUND_COUNT = 90
+TARGET_COMMITTEE_SIZE = 128
+MAX_COMMITTEES_PER_SLOT = 64
+MAX_EFFECTIVE_BALANCE = 32 * 10**9
+MAX_RANDOM_BYTE = 255
+MIN_SEED_LOOKAHEAD = 1
+DOMAIN_BEACON_PROPOSER = bytes.fromhex("00000000")
+DOMAIN_BEACON_ATTESTER = bytes.fromhex("01000000")
+
+# NOTE: Proposer candidates are drawn in batches, as most slots accept one within a few
+PROPOSER_BATCH_SIZE = 32
+
+
+def compute_shuffled_indices(indices: np.ndarray, index_count: int, seed: bytes) -> np.ndarray:
+    """
+    The spec's ``compute_shuffled_index`` (swap-or-not shuffle) applied to every
+    position in ``indices`` at once. Each round hashes only the 256 position chunks
+    in use, so shuffling the whole list costs ``index_count / 256`` hashes a round.
+    """
+    index = np.array(indices, dtype=np.int64)
+    if index_count <= 1:
+        return index
+
+    all_chunks = np.arange((index_count - 1) // 256 + 1)
+    for current_round in range(SHUFFLE_ROUND_COUNT):
+        round_seed = seed + bytes([current_round])
+        pivot = int.from_bytes(sha256(round_seed).digest()[:8], "little") % index_count
+        flip = (pivot + index_count - index) % index_count
+        position = np.maximum(index, flip)
+        chunk = position >> 8
+        if 8 * len(index) >= index_count:
+            chunks, row = all_chunks, chunk
+        else:
+            chunks, row = np.unique(chunk, return_inverse=True)
+
+        source = b"".join(
+            sha256(round_seed + int(c).to_bytes(4, "little")).digest() for c in chunks
+        )
+        bits = np.unpackbits(np.frombuffer(source, dtype=np.uint8), bitorder="little")
+        bit = bits.reshape(len(chunks), 256)[row.reshape(-1), position & 255]
+        index = np.where(bit, flip, index)
+
+    return index
+
+
+def compute_seed(randao_mix: bytes, epoch: int, domain_type: bytes) -> bytes:
+    """
+    The spec's ``get_seed`` given ``randao_mix``, the RANDAO mix of epoch
+    ``epoch - MIN_SEED_LOOKAHEAD - 1``.
+    """
+    return sha256(domain_type + epoch.to_bytes(8, "little") + bytes(randao_mix)).digest()
+
+
+def get_committee_count_per_slot(active_validator_count: int) -> int:
+    committees = active_validator_count // SLOTS_PER_EPOCH // TARGET_COMMITTEE_SIZE
+    return max(1, min(MAX_COMMITTEES_PER_SLOT, committees))
+
+
+def compute_proposer_index(indices: np.ndarray, effective_balance: np.ndarray, seed: bytes) -> int:
+    """
+    The spec's ``compute_proposer_index`` for active validator ``indices`` and their
+    ``effective_balance``.
+    """
+    total = len(indices)
+    if total == 0:
+        raise ValueError("No active validators.")
+
+    start = 0
+    while True:
+        i = np.arange(start, start + PROPOSER_BATCH_SIZE)
+        candidates = compute_shuffled_indices(i % total, total, seed)
+        random_bytes = np.frombuffer(
+            b"".join(
+                sha256(seed + j.to_bytes(8, "little")).digest()
+                for j in range(start // 32, (start + PROPOSER_BATCH_SIZE) // 32)
+            ),
+            dtype=np.uint8,
+        )
+        accepted = np.flatnonzero(
+            effective_balance[candidates] * np.uint64(MAX_RANDOM_BYTE)
+            >= np.uint64(MAX_EFFECTIVE_BALANCE) * random_bytes.astype(np.uint64)
+        )
+        if len(accepted) > 0:
+            return int(indices[candidates[accepted[0]]])
+
+        start += PROPOSER_BATCH_SIZE
+
+
+class CommitteeAssignment(NamedTuple):
+    slot: int
+    committee_index: int
+    position: int  # NOTE: Position in the committee, i.e. its aggregation bit
+    committee_size: int
+
+
+class EpochShuffling:
+    """
+    The beacon committees of one epoch, computed by shuffling the sorted
+    ``active_indices`` with the attester ``seed``. ``shuffled`` holds every active
+    validator in committee order, so committees are contiguous slices of it.
+    """
+
+    def __init__(self, epoch: int, active_indices: np.ndarray, seed: bytes):
+        self.epoch = epoch
+        self.seed = seed
+        self.committees_per_slot = get_committee_count_per_slot(len(active_indices))
+
+        count = len(active_indices)
+        self.shuffled = active_indices[compute_shuffled_indices(np.arange(count), count, seed)]
+
+        # NOTE: Committee `c` of the epoch is `shuffled[bounds[c]:bounds[c + 1]]`
+        total = self.committees_per_slot * SLOTS_PER_EPOCH
+        self._bounds = count * np.arange(total + 1, dtype=np.int64) // total
+
+    def committee(self, slot: int, index: int) -> np.ndarray:
+        """
+        Returns the validator indices of committee ``index`` at ``slot``, in
+        aggregation bit order.
+        """
+        if slot // SLOTS_PER_EPOCH != self.epoch:
+            raise ValueError(f"Slot {slot} is not in epoch {self.epoch}.")
+        elif not 0 <= index < self.committees_per_slot:
+            raise ValueError(f"Committee index {index} out of range.")
+
+        committee = (slot % SLOTS_PER_EPOCH) * self.committees_per_slot + index
+        return self.shuffled[self._bounds[committee] : self._bounds[committee + 1]]
+
+    def assignments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the ``(validator_index, slot, committee_index)`` of every active
+        validator, in committee order.
+        """
+        committee = np.repeat(np.arange(len(self._bounds) - 1), np.diff(self._bounds))
+        slot = self.epoch * SLOTS_PER_EPOCH + committee // self.committees_per_slot
+        return self.shuffled, slot, committee % self.committees_per_slot
+
+    def find(self, validator_index: int) -> Optional[CommitteeAssignment]:
+        """
+        Returns the committee assignment of ``validator_index``, if active.
+        """
+        found = np.flatnonzero(self.shuffled == np.uint64(validator_index))
+        if len(found) == 0:
+            return None
+
+        position = int(found[0])
+        committee = int(np.searchsorted(self._bounds, position, side="right")) - 1
+        start, stop = int(self._bounds[committee]), int(self._bounds[committee + 1])
+        return CommitteeAssignment(
+            slot=self.epoch * SLOTS_PER_EPOCH + committee // self.committees_per_slot,
+            committee_index=committee % self.committees_per_slot,
+            position=position - start,
+            committee_size=stop - start,
+        )
+
+
+class CommitteeEngine:
+    """
+    Computes beacon committees and block proposers locally from a
+    :class:`~ape_beacon.registry.ValidatorRegistry` snapshot, instead of one
+    committees or duties API call per epoch. Results are cached per epoch.
+
+    Each epoch needs the RANDAO mix of epoch ``epoch - MIN_SEED_LOOKAHEAD - 1``::
+
+        engine = CommitteeEngine(provider.load_validator_registry())
+        shuffling = engine.get_shuffling(epoch, provider.get_randao_mix(epoch - 2))
+
+    The registry should be a snapshot of a state in (or shortly before) ``epoch``,
+    as the active set and effective balances change between epochs.
+    """
+
+    def __init__(self, registry: ValidatorRegistry, cache_size: int = 16):
+        self.registry = registry
+        self.cache_size = cache_size
+        self._shufflings: "OrderedDict[Tuple[int, bytes], EpochShuffling]" = OrderedDict()
+        self._proposers: "OrderedDict[Tuple[int, bytes], np.ndarray]" = OrderedDict()
+
+    def _get_active(self, epoch: int) -> Tuple[np.ndarray, np.ndarray]:
+        # NOTE: The spec iterates the active validators in index order
+        rows = np.flatnonzero(
+            (self.registry.activation_epoch <= epoch)
+            & (np.uint64(epoch) < self.registry.exit_epoch)
+        )
+        rows = rows[np.argsort(self.registry.index[rows], kind="stable")]
+        return self.registry.index[rows], self.registry.effective_balance[rows]
+
+    def get_shuffling(self, epoch: int, randao_mix: bytes) -> EpochShuffling:
+        """
+        Returns the committees of ``epoch``.
+        """
+        key = (epoch, bytes(randao_mix))
+        shuffling = _lookup(self._shufflings, key)
+        if shuffling is None:
+            active_indices, _ = self._get_active(epoch)
+            seed = compute_seed(randao_mix, epoch, DOMAIN_BEACON_ATTESTER)
+            shuffling = EpochShuffling(epoch, active_indices, seed)
+            _store(self._shufflings, key, shuffling, self.cache_size)
+
+        return shuffling
+
+    def get_proposers(self, epoch: int, randao_mix: bytes) -> np.ndarray:
+        """
+        Returns the proposer index of each slot of ``epoch``.
+        """
+        key = (epoch, bytes(randao_mix))
+        proposers = _lookup(self._proposers, key)
+        if proposers is None:
+            active_indices, effective_balance = self._get_active(epoch)
+            epoch_seed = compute_seed(randao_mix, epoch, DOMAIN_BEACON_PROPOSER)
+            proposers = np.array(
+                [
+                    compute_proposer_index(
+                        active_indices,
+                        effective_balance,
+                        sha256(epoch_seed + slot.to_bytes(8, "little")).digest(),
+                    )
+                    for slot in range(epoch * SLOTS_PER_EPOCH, (epoch + 1) * SLOTS_PER_EPOCH)
+                ],
+                dtype=np.uint64,
+            )
+            _store(self._proposers, key, proposers, self.cache_size)
+
+        return proposers
+
+
+def _lookup(cache: OrderedDict, key: Tuple[int, bytes]):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+
+    return value
+
+
+def _store(cache: OrderedDict, key: Tuple[int, bytes], value, max_size: int):
+    cache[key] = value
+    while len(cache) > max_size:
+        cache.popitem(last=False)
@@ -1,11 +1,13 @@
-from typing import Any, Optional, get_args
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, get_args
 
+import numpy as np
 from ape.api.providers import BlockAPI
 from ape.utils import EMPTY_BYTES32
 from hexbytes import HexBytes
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
-from .types import BytesLike
+from .operations import BlockOperations
+from .types import SYNC_COMMITTEE_SIZE, BytesLike, attempt_to_hexbytes
 
 
 class Eth1Data(BaseModel):
@@ -29,10 +31,95 @@ class Eth1Data(BaseModel):
         return value
 
 
+class ValidatorSummary(NamedTuple):
+    """
+    Compact balance and status of a validator, as returned by bulk validator queries.
+    """
+
+    validator_index: int
+    pubkey: HexBytes
+    balance: int
+    effective_balance: int
+    status: str
+
+    @classmethod
+    def from_response(cls, data: dict) -> "ValidatorSummary":
+        return cls(
+            validator_index=int(data["index"]),
+            pubkey=HexBytes(data["validator"]["pubkey"]),
+            balance=int(data["balance"]),
+            effective_balance=int(data["validator"]["effective_balance"]),
+            status=data["status"],
+        )
+
+
+class BeaconBlockHeader(NamedTuple):
+    """
+    The header of a beacon block, as returned by the ``headers`` endpoints. A
+    fraction of the size of the full block, for jobs that don't need the body.
+    """
+
+    root: HexBytes
+    slot: int
+    proposer_index: int
+    parent_root: HexBytes
+    state_root: HexBytes
+    body_root: HexBytes
+    canonical: bool = True
+
+    @classmethod
+    def from_response(cls, data: dict) -> "BeaconBlockHeader":
+        message = data["header"]["message"]
+        return cls(
+            root=HexBytes(data["root"]),
+            slot=int(message["slot"]),
+            proposer_index=int(message["proposer_index"]),
+            parent_root=HexBytes(message["parent_root"]),
+            state_root=HexBytes(message["state_root"]),
+            body_root=HexBytes(message["body_root"]),
+            canonical=data.get("canonical", True),
+        )
+
+
 class SyncAggregate(BaseModel):
-    sync_committee_bits: Any  # TODO: Bitvector[SYNC_COMMITTEE_SIZE]
+    sync_committee_bits: Any  # Bitvector[SYNC_COMMITTEE_SIZE], packed as HexBytes
     sync_committee_signature: Any  # TODO: Bytes96
 
+    @validator("sync_committee_bits", pre=True)
+    def convert_hexbytes(cls, value):
+        if value and isinstance(value, get_args(BytesLike)):
+            return HexBytes(value)
+
+        return value
+
+    @property
+    def bits(self) -> np.ndarray:
+        """
+        The participation of each sync committee member as a boolean array.
+        """
+        packed = np.frombuffer(self.sync_committee_bits or b"", dtype=np.uint8)
+        return np.unpackbits(packed, bitorder="little").astype(bool)
+
+    @property
+    def participation_count(self) -> int:
+        return int(np.count_nonzero(self.bits))
+
+    @property
+    def participation_rate(self) -> float:
+        bits = self.bits
+        return float(bits.mean()) if len(bits) else 0.0
+
+    @property
+    def participants(self) -> np.ndarray:
+        """
+        The sync committee positions of the participating members.
+        """
+        return np.flatnonzero(self.bits)
+
+
+# NOTE: The `execution_payload` fields read by `BeaconExecutionPayload.from_response()`
+_PAYLOAD_FIELDS = ("block_hash", "parent_hash", "block_number", "timestamp", "prev_randao")
+
 
 class BeaconExecutionPayload(BlockAPI):
     """
@@ -56,6 +143,30 @@ class BeaconExecutionPayload(BlockAPI):
 
         return value
 
+    @classmethod
+    def from_response(cls, data: Dict) -> "BeaconExecutionPayload":
+        """
+        Builds the payload from trusted beacon API ``execution_payload`` data without
+        validation, converting fields as
+        :meth:`~ape_beacon.ecosystem.Beacon.decode_block` does.
+        """
+        block_hash = data.get("block_hash")
+        parent_hash = data.get("parent_hash")
+        block_number = data.get("block_number")
+        num_transactions = data.get("num_transactions")
+        if num_transactions is None:
+            num_transactions = len(data.get("transactions", ()))
+
+        return cls.construct(
+            num_transactions=num_transactions,
+            hash=HexBytes(block_hash) or None if block_hash else None,
+            number=int(block_number) if block_number is not None else None,
+            parent_hash=HexBytes(parent_hash or b"") or EMPTY_BYTES32,
+            size=0,
+            timestamp=int(data["timestamp"]),
+            prev_randao=attempt_to_hexbytes(data.get("prev_randao")),
+        )
+
 
 class BeaconBlockBody(BaseModel):
     """
@@ -82,6 +193,10 @@ class BeaconBlockBody(BaseModel):
     sync_aggregate: Optional[SyncAggregate] = None  # NOTE: pre-merge has no sync agg
     execution_payload: Optional[BeaconExecutionPayload] = None  # NOTE: pre-merge has no payload
 
+    # NOTE: Raw payload data decoded on first access of `execution_payload`, see `defer_payload()`
+    _raw_execution_payload: Optional[Dict] = PrivateAttr(None)
+    _operations: Optional[BlockOperations] = PrivateAttr(None)
+
     @validator("randao_reveal", "graffiti", pre=True)
     def convert_hexbytes(cls, value):
         if value and isinstance(value, get_args(BytesLike)):
@@ -97,4 +212,69 @@ class BeaconBlockBody(BaseModel):
 
         return value
 
-    # TODO: cached_property decordted functions for fetching more detail on num_* fields
+    @property
+    def operations(self) -> Optional[BlockOperations]:
+        """
+        The attestations, deposits, exits and slashings behind the ``num_*`` fields,
+        if kept when decoding (see ``keep_operations`` of
+        :meth:`~ape_beacon.ecosystem.Beacon.decode_block`).
+        """
+        return self._operations
+
+    def retain_operations(self, operations: BlockOperations):
+        self._operations = operations
+
+    def defer_payload(self, payload_data: Dict):
+        """
+        Drops the decoded execution payload, decoding it from ``payload_data``
+        (trusted beacon API data) on first access instead.
+        """
+        self.__dict__.pop("execution_payload", None)
+        # NOTE: Keep only what `from_response()` reads, not the raw transactions
+        deferred = {
+            field: payload_data[field] for field in _PAYLOAD_FIELDS if field in payload_data
+        }
+        deferred["num_transactions"] = len(payload_data.get("transactions", ()))
+        self._raw_execution_payload = deferred
+
+    def __getattr__(self, name: str) -> Any:
+        # NOTE: Only called when `execution_payload` is deferred (not in `__dict__`)
+        if name != "execution_payload":
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        raw_payload = self._raw_execution_payload
+        payload = None
+        if raw_payload is not None:
+            payload = BeaconExecutionPayload.from_response(raw_payload)
+
+        self.__dict__["execution_payload"] = payload
+        self._raw_execution_payload = None
+        return payload
+
+    def _iter(self, *args, **kwargs):
+        # NOTE: Decode a deferred payload so `dict()`, `copy()` and `==` include it
+        if "execution_payload" not in self.__dict__:
+            self.execution_payload
+
+        return super()._iter(*args, **kwargs)
+
+
+def sync_participation_matrix(blocks: Iterable[BlockAPI]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the slots of ``blocks`` and a ``(len(slots), SYNC_COMMITTEE_SIZE)`` boolean
+    matrix of their sync committee participation. Blocks without a sync aggregate
+    (before Altair) have no participants.
+    """
+    slots = []
+    packed = bytearray()
+    for block in blocks:
+        sync_aggregate = getattr(getattr(block, "body", None), "sync_aggregate", None)
+        bits = sync_aggregate.sync_committee_bits if sync_aggregate is not None else None
+        slots.append(block.number)
+        packed += bytes(bits or b"").ljust(SYNC_COMMITTEE_SIZE // 8, b"\x00")
+
+    matrix = np.frombuffer(bytes(packed), dtype=np.uint8).reshape(
+        len(slots), SYNC_COMMITTEE_SIZE // 8
+    )
+    participation = np.unpackbits(matrix, axis=1, bitorder="little").astype(bool)
+    return np.array(slots, dtype=np.uint64), participation
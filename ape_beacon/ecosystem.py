@@ -1,14 +1,30 @@
-from typing import Dict, Optional, cast
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import deepcopy
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union, cast
 
 from ape.api import PluginConfig
 from ape.api.networks import LOCAL_NETWORK_NAME
 from ape.api.providers import BlockAPI
+from ape.utils import EMPTY_BYTES32
 from ape_ethereum.ecosystem import Ethereum
+from hexbytes import HexBytes
 
-from ape_beacon.containers import BeaconBlockBody, BeaconExecutionPayload
+from ape_beacon.containers import BeaconBlockBody, BeaconExecutionPayload, Eth1Data, SyncAggregate
+from ape_beacon.operations import BlockOperations
+from ape_beacon.ssz import compute_block_root
 
 from .types import attempt_to_hexbytes
 
+RawBlock = Union[bytes, str, Dict]
+"""
+A beacon block JSON document: a ``GET /eth/v2/beacon/blocks/{block_id}`` response,
+a signed block or a block ``message``, either raw or already parsed.
+"""
+
 NETWORKS = {
     # chain_id, network_id
     "mainnet": (1, 1),
@@ -48,6 +64,7 @@ class BeaconBlock(BlockAPI):
 
     proposer_index: Optional[int] = None
     body: BeaconBlockBody
+    root: Optional[HexBytes] = None  # NOTE: Only computed if asked, see `decode_block()`
 
 
 class Beacon(Ethereum):
@@ -57,11 +74,49 @@ class Beacon(Ethereum):
     def config(self) -> BeaconConfig:  # type: ignore
         return cast(BeaconConfig, self.config_manager.get_config("beacon"))
 
-    def decode_block(self, data: Dict) -> BlockAPI:
+    def decode_block(
+        self,
+        data: Dict,
+        trusted: bool = False,
+        keep_execution_payload: bool = True,
+        keep_operations: bool = False,
+        compute_root: bool = False,
+    ) -> BlockAPI:
         """
         Decodes consensus layer block with possible execution layer
         payload.
+
+        If ``trusted``, ``data`` is assumed to be a well-formed beacon API block
+        (e.g. straight from the connected node) and the models are built in a
+        single pass without validation, leaving ``data`` untouched. The result is
+        the same as the validated path, except the execution payload is only
+        decoded on first access of ``block.body.execution_payload``.
+
+        Pass ``keep_execution_payload=False`` if the payload won't be needed to
+        skip it entirely; ``block.body.execution_payload`` is then ``None``.
+        Pass ``keep_operations=True`` to keep the attestations, deposits, exits and
+        slashings in compact form as ``block.body.operations`` rather than only
+        their counts.
+        Pass ``compute_root=True`` to compute the block's own root (its SSZ
+        ``hash_tree_root``) as ``block.root``, e.g. to link blocks with
+        :meth:`~ape_beacon.ecosystem.Beacon.verify_parent_roots`.
         """
+        if trusted:
+            try:
+                return _construct_block(data, keep_execution_payload, keep_operations, compute_root)
+            except (KeyError, TypeError, ValueError):
+                # NOTE: Let the validated path report what is wrong with the data
+                return self.decode_block(
+                    deepcopy(data),
+                    keep_execution_payload=keep_execution_payload,
+                    keep_operations=keep_operations,
+                    compute_root=compute_root,
+                )
+
+        # NOTE: Hash before the body lists are dropped below
+        if compute_root:
+            data["root"] = HexBytes(compute_block_root(data))
+
         # map CL (slot, roots) to ape BlockAPI (number, hashes)
         if "slot" in data:
             data["number"] = data.pop("slot")
@@ -76,7 +131,12 @@ class Beacon(Ethereum):
 
         # use data from EL if can (block within a block post-merge)
         payload = None
+        operations = None
         if "body" in data:
+            if keep_operations:
+                block_slot = int(data.get("number") or 0)
+                operations = BlockOperations.from_response(data["body"], block_slot)
+
             # limit data retained at block level for beacon operations
             if "proposer_slashings" in data["body"]:
                 data["body"]["num_proposer_slashings"] = len(data["body"].pop("proposer_slashings"))
@@ -90,7 +150,9 @@ class Beacon(Ethereum):
                 data["body"]["num_voluntary_exits"] = len(data["body"].pop("voluntary_exits"))
 
             payload_data = data["body"].pop("execution_payload", None)
-            if payload_data is not None:
+            if payload_data is not None and not keep_execution_payload:
+                data["timestamp"] = payload_data["timestamp"]
+            elif payload_data is not None:
                 payload_data["size"] = 0  # TODO: infer size from gas limit
 
                 # convert from beacon API spec to an Ape BlockAPI for block in block
@@ -115,4 +177,173 @@ class Beacon(Ethereum):
         # parse without EL payload then set payload
         block = BeaconBlock.parse_obj(data)
         block.body.execution_payload = payload
+        if operations is not None:
+            block.body.retain_operations(operations)
+
         return block
+
+    def decode_blocks(
+        self,
+        blocks: Iterable[RawBlock],
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+        keep_execution_payload: bool = True,
+        keep_operations: bool = False,
+        compute_root: bool = False,
+    ) -> Iterator[BlockAPI]:
+        """
+        Parses and decodes many trusted beacon block JSON documents across a pool of
+        ``workers`` processes (defaults to the CPU count), ``chunk_size`` documents
+        at a time. Blocks are yielded in input order. With ``workers=1`` the blocks
+        are decoded in this process.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("workers and chunk_size must be at least 1.")
+
+        options = dict(
+            keep_execution_payload=keep_execution_payload,
+            keep_operations=keep_operations,
+            compute_root=compute_root,
+        )
+        chunks = _iter_chunks(blocks, chunk_size)
+        if workers == 1:
+            for chunk in chunks:
+                yield from self._finish_decoded_chunk(_decode_block_chunk(chunk, options), options)
+
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # NOTE: Keep a window of chunks in flight so memory stays bounded on long inputs
+            pending: Deque[Future] = deque(
+                executor.submit(_decode_block_chunk, chunk, options)
+                for chunk in islice(chunks, 2 * workers)
+            )
+            try:
+                while pending:
+                    decoded = pending.popleft().result()
+                    next_chunk = next(chunks, None)
+                    if next_chunk is not None:
+                        pending.append(executor.submit(_decode_block_chunk, next_chunk, options))
+
+                    yield from self._finish_decoded_chunk(decoded, options)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _finish_decoded_chunk(
+        self, decoded: List[Union[BlockAPI, Dict]], options: Dict[str, bool]
+    ) -> Iterator[BlockAPI]:
+        for item in decoded:
+            if isinstance(item, BlockAPI):
+                yield item
+            else:
+                # NOTE: Malformed block, let the validated path report what is wrong
+                yield self.decode_block(item, **options)
+
+    def verify_parent_roots(self, blocks: Iterable[BeaconBlock]) -> List[int]:
+        """
+        Checks that each of ``blocks`` (in slot order, decoded with
+        ``compute_root=True``) references the root of the block before it as its
+        parent. Returns the slots of the blocks that don't; empty if the blocks
+        form a chain. Missed slots in between are fine.
+        """
+        broken = []
+        parent_root = None
+        for block in blocks:
+            if block.number is None or block.root is None:
+                raise ValueError(f"Block {block.number} was decoded without its slot or root.")
+            if parent_root is not None and HexBytes(block.parent_hash) != parent_root:
+                broken.append(block.number)
+
+            parent_root = block.root
+
+        return broken
+
+
+def _iter_chunks(blocks: Iterable[RawBlock], chunk_size: int) -> Iterator[List[RawBlock]]:
+    block_iter = iter(blocks)
+    while True:
+        chunk = list(islice(block_iter, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _decode_block_chunk(
+    chunk: List[RawBlock], options: Dict[str, bool]
+) -> List[Union[BlockAPI, Dict]]:
+    # NOTE: Runs in worker processes, so only uses the trusted (manager-free) decoder
+    decoded: List[Union[BlockAPI, Dict]] = []
+    for raw_block in chunk:
+        data = json.loads(raw_block) if isinstance(raw_block, (bytes, str)) else raw_block
+        if "data" in data:
+            data = data["data"]
+        if "message" in data:
+            data = data["message"]
+
+        try:
+            block = _construct_block(data, **options)
+        except (KeyError, TypeError, ValueError):
+            decoded.append(data)
+            continue
+
+        # NOTE: Decode the payload here rather than send its raw data back
+        block.body.execution_payload
+        decoded.append(block)
+
+    return decoded
+
+
+def _construct_block(
+    data: Dict,
+    keep_execution_payload: bool = True,
+    keep_operations: bool = False,
+    compute_root: bool = False,
+) -> BeaconBlock:
+    # NOTE: Mirrors the field conversions of `decode_block()` and the model validators
+    body_data = data["body"]
+    payload_data = body_data.get("execution_payload")
+    sync_aggregate = body_data.get("sync_aggregate")
+    body = BeaconBlockBody.construct(
+        randao_reveal=attempt_to_hexbytes(body_data.get("randao_reveal")),
+        eth1_data=Eth1Data.construct(
+            deposit_root=attempt_to_hexbytes(body_data["eth1_data"].get("deposit_root")),
+            deposit_count=int(body_data["eth1_data"]["deposit_count"]),
+            block_hash=attempt_to_hexbytes(body_data["eth1_data"].get("block_hash")),
+        ),
+        graffiti=attempt_to_hexbytes(body_data.get("graffiti", EMPTY_BYTES32)),
+        num_proposer_slashings=len(body_data.get("proposer_slashings", ())),
+        num_attester_slashings=len(body_data.get("attester_slashings", ())),
+        num_attestations=len(body_data.get("attestations", ())),
+        num_deposits=len(body_data.get("deposits", ())),
+        num_voluntary_exits=len(body_data.get("voluntary_exits", ())),
+        sync_aggregate=SyncAggregate.construct(
+            sync_committee_bits=attempt_to_hexbytes(sync_aggregate.get("sync_committee_bits")),
+            sync_committee_signature=sync_aggregate.get("sync_committee_signature"),
+        )
+        if sync_aggregate is not None
+        else None,
+    )
+    if payload_data is not None and keep_execution_payload:
+        body.defer_payload(payload_data)
+    if keep_operations:
+        body.retain_operations(BlockOperations.from_response(body_data, int(data["slot"])))
+
+    return BeaconBlock.construct(
+        num_transactions=0,
+        hash=attempt_to_hexbytes(data["state_root"]) if "state_root" in data else None,
+        number=_to_optional_int(data.get("slot")),
+        parent_hash=attempt_to_hexbytes(data.get("parent_root")) or EMPTY_BYTES32,
+        size=0,
+        timestamp=int(payload_data["timestamp"]) if payload_data is not None else 0,
+        proposer_index=_to_optional_int(data.get("proposer_index")),
+        body=body,
+        root=HexBytes(compute_block_root(data)) if compute_root else None,
+    )
+
+
+def _to_optional_int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
@@ -0,0 +1,78 @@
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+from ape.api.providers import BlockAPI
+
+from ape_beacon.summaries import COUNTERS
+from ape_beacon.types import SLOTS_PER_EPOCH, SYNC_COMMITTEE_SIZE
+
+
+class EpochSummary(NamedTuple):
+    """
+    Per-epoch statistics of the blocks proposed in an epoch: which slots were
+    missed, and the totals of the blocks' ``num_*`` counters and sync committee
+    participation.
+    """
+
+    epoch: int
+    num_proposed: int
+    missed_slots: Tuple[int, ...]
+    num_proposer_slashings: int = 0
+    num_attester_slashings: int = 0
+    num_attestations: int = 0
+    num_deposits: int = 0
+    num_voluntary_exits: int = 0
+    sync_participants: int = 0  # NOTE: Summed over the blocks with a sync aggregate
+    num_sync_aggregates: int = 0
+
+    @classmethod
+    def from_blocks(
+        cls, epoch: int, blocks: Iterable[BlockAPI], head_slot: Optional[int] = None
+    ) -> "EpochSummary":
+        """
+        Builds the summary of ``epoch`` from the blocks proposed in it. Slots of the
+        epoch without a block are missed, up to ``head_slot`` if the epoch is still
+        in progress.
+        """
+        slots = set()
+        totals = dict.fromkeys(COUNTERS, 0)
+        sync_participants = num_sync_aggregates = 0
+        for block in blocks:
+            if block.number is None or block.number // SLOTS_PER_EPOCH != epoch:
+                raise ValueError(f"Block {block.number} is not in epoch {epoch}.")
+
+            slots.add(block.number)
+            body = getattr(block, "body", None)
+            for name in COUNTERS:
+                totals[name] += getattr(body, name, 0)
+
+            sync_aggregate = getattr(body, "sync_aggregate", None)
+            if sync_aggregate is not None:
+                sync_participants += sync_aggregate.participation_count
+                num_sync_aggregates += 1
+
+        first_slot = epoch * SLOTS_PER_EPOCH
+        stop = first_slot + SLOTS_PER_EPOCH
+        if head_slot is not None:
+            stop = min(stop, head_slot + 1)
+
+        return cls(
+            epoch=epoch,
+            num_proposed=len(slots),
+            missed_slots=tuple(s for s in range(first_slot, stop) if s not in slots),
+            sync_participants=sync_participants,
+            num_sync_aggregates=num_sync_aggregates,
+            **totals,
+        )
+
+    @property
+    def num_missed(self) -> int:
+        return len(self.missed_slots)
+
+    @property
+    def sync_participation_rate(self) -> float:
+        """
+        The share of sync committee members that participated, over the blocks with
+        a sync aggregate.
+        """
+        total = self.num_sync_aggregates * SYNC_COMMITTEE_SIZE
+        return self.sync_participants / total if total else 0.0
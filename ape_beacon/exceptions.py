@@ -1,4 +1,6 @@
-from ape.exceptions import ProviderError
+from typing import Optional
+
+from ape.exceptions import ApeException, ProviderError
 
 
 class ValidatorNotFoundError(ProviderError):
@@ -8,3 +10,26 @@ class ValidatorNotFoundError(ProviderError):
 
     def __init__(self, validator_address: str):
         super().__init__(f"Validator address '{validator_address}' not found.")
+
+
+class SSZDecodingError(ApeException):
+    """
+    Raised when SSZ bytes don't match the expected schema.
+    """
+
+
+class BeaconRequestError(ProviderError):
+    """
+    Raised when the beacon node fails a request for a reason other than a missing
+    block or validator, e.g. it is overloaded or out of sync.
+    """
+
+    def __init__(self, status_code: Optional[int], message: str = ""):
+        self.status_code = status_code
+        super().__init__(f"Beacon request failed with status {status_code}. {message}".strip())
+
+
+class LightClientError(ProviderError):
+    """
+    Raised when light client data fails verification or can't be applied.
+    """
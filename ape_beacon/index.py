@@ -0,0 +1,192 @@
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from hexbytes import HexBytes
+from pydantic import BaseModel
+
+
+class Reorg(NamedTuple):
+    slot: int  # NOTE: The first slot affected
+    reverted: Tuple[int, ...]  # slots whose canonical block was orphaned
+    new: Tuple[int, ...]  # slots with a new canonical block, to (re-)fetch
+
+
+ReorgCallback = Callable[[Reorg], None]
+
+
+class SlotIndexSettings(BaseModel):
+    """
+    Settings for :class:`~ape_beacon.index.SlotIndex`, read from the provider settings.
+    """
+
+    # NOTE: Blocks fetched by slot must be hashed whole (~20 ms each) to be indexed
+    track_reorgs: bool = False  # index non-finalized blocks fetched by slot to detect reorgs
+
+
+class SlotIndex:
+    """
+    A thread-safe index of the canonical ``slot -> root`` and every seen
+    ``root -> (slot, parent root)`` over the unfinalized window of the chain.
+
+    Adding a block checks it against the indexed blocks around it: when its
+    parent root skips or replaces indexed canonical blocks, or blocks above it
+    don't descend from it, those are reverted and subscribers are notified with
+    a :class:`~ape_beacon.index.Reorg`. Indexed blocks are dropped once finalized.
+    """
+
+    def __init__(self, finalized_slot: int = -1):
+        self.finalized_slot = finalized_slot
+        self._blocks: Dict[bytes, Tuple[int, bytes]] = {}
+        self._canonical: Dict[int, bytes] = {}
+        self._subscribers: List[ReorgCallback] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def __contains__(self, root) -> bool:
+        return bytes(HexBytes(root)) in self._blocks
+
+    def get_root(self, slot: int) -> Optional[HexBytes]:
+        """
+        Returns the root of the canonical block at ``slot``, if indexed.
+        """
+        root = self._canonical.get(slot)
+        return HexBytes(root) if root is not None else None
+
+    @property
+    def tip(self) -> Optional[Tuple[int, HexBytes]]:
+        """
+        The slot and root of the highest indexed canonical block, if any.
+        """
+        with self._lock:
+            if not self._canonical:
+                return None
+
+            slot = max(self._canonical)
+            return slot, HexBytes(self._canonical[slot])
+
+    def is_canonical(self, root) -> bool:
+        block = self._blocks.get(bytes(HexBytes(root)))
+        return block is not None and self._canonical.get(block[0]) == bytes(HexBytes(root))
+
+    def subscribe(self, callback: ReorgCallback):
+        """
+        Calls ``callback`` with each detected :class:`~ape_beacon.index.Reorg`.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: ReorgCallback):
+        self._subscribers.remove(callback)
+
+    def add(self, slot: int, root, parent_root) -> Optional[Reorg]:
+        """
+        Indexes the block ``root`` as canonical at ``slot``, e.g. as just returned by
+        the node. Returns the reorg it reveals, if any.
+        """
+        root, parent_root = bytes(HexBytes(root)), bytes(HexBytes(parent_root))
+        with self._lock:
+            if slot < self.finalized_slot:
+                return None
+
+            self._blocks[root] = (slot, parent_root)
+            if self._canonical.get(slot) == root:
+                return None
+
+            reverted: Set[int] = {slot} if slot in self._canonical else set()
+            restored = [(slot, root)]
+
+            # NOTE: Walk back while ancestors are known; canonical slots they skip are orphaned
+            child_slot, parent = slot, parent_root
+            while parent in self._blocks:
+                parent_slot, grandparent = self._blocks[parent]
+                reverted.update(s for s in self._canonical if parent_slot < s < child_slot)
+                if self._canonical.get(parent_slot) == parent:
+                    break
+                elif parent_slot in self._canonical:
+                    reverted.add(parent_slot)
+
+                restored.append((parent_slot, parent))
+                child_slot, parent = parent_slot, grandparent
+
+            # NOTE: Canonical blocks above that don't descend from this one are orphaned too
+            if not self._descends(slot, root):
+                reverted.update(s for s in self._canonical if s > slot)
+
+            for reverted_slot in reverted:
+                del self._canonical[reverted_slot]
+
+            for restored_slot, restored_root in restored:
+                self._canonical[restored_slot] = restored_root
+
+            if not reverted and len(restored) == 1:
+                return None
+
+            new = [restored_slot for restored_slot, _ in restored]
+            reorg = Reorg(min(reverted | set(new)), tuple(sorted(reverted)), tuple(sorted(new)))
+
+        self._notify(reorg)
+        return reorg
+
+    def reorg(self, slot: int, depth: int, new_head_root=None) -> Optional[Reorg]:
+        """
+        Applies a ``chain_reorg`` event: the canonical blocks from ``depth`` slots
+        back up to the new head at ``slot`` are reverted, and those slots are due to
+        be re-fetched.
+        """
+        first_slot = slot - depth + 1
+        with self._lock:
+            if new_head_root is not None and self._canonical.get(slot) == bytes(
+                HexBytes(new_head_root)
+            ):
+                return None  # NOTE: Already seen through the new head's parent roots
+
+            reverted = sorted(s for s in self._canonical if s >= first_slot)
+            for reverted_slot in reverted:
+                del self._canonical[reverted_slot]
+
+            new = range(max(first_slot, self.finalized_slot + 1), slot + 1)
+            reorg = Reorg(first_slot, tuple(reverted), tuple(new))
+
+        self._notify(reorg)
+        return reorg
+
+    def finalize(self, finalized_slot: int):
+        """
+        Drops the blocks before ``finalized_slot``, keeping the finalized block
+        itself as the anchor of the window.
+        """
+        with self._lock:
+            if finalized_slot <= self.finalized_slot:
+                return
+
+            self.finalized_slot = finalized_slot
+            self._canonical = {s: r for s, r in self._canonical.items() if s >= finalized_slot}
+            self._blocks = {r: b for r, b in self._blocks.items() if b[0] >= finalized_slot}
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._canonical.clear()
+
+    def _descends(self, slot: int, root: bytes) -> bool:
+        # NOTE: Unknown ancestry between the two is given the benefit of the doubt
+        above = [s for s in self._canonical if s > slot]
+        if not above:
+            return True
+
+        block = self._blocks.get(self._canonical[min(above)])
+        while block is not None:
+            _, parent = block
+            if parent == root:
+                return True
+
+            block = self._blocks.get(parent)
+            if block is not None and block[0] <= slot:
+                return False
+
+        return True
+
+    def _notify(self, reorg: Reorg):
+        for callback in list(self._subscribers):
+            callback(reorg)
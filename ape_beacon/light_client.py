@@ -0,0 +1,406 @@
+import secrets
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, cast
+
+import numpy as np
+from eth_typing import BLSPubkey, BLSSignature
+from hexbytes import HexBytes
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primitives import pubkey_to_G1, signature_to_G2, subgroup_check
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
+from py_ecc.optimized_bls12_381 import G1, Z1, Z2, add, final_exponentiate, is_inf, multiply, neg
+from py_ecc.optimized_bls12_381 import pairing as miller_loop
+
+from ape_beacon import ssz
+from ape_beacon.containers import BeaconBlockHeader
+from ape_beacon.exceptions import LightClientError
+from ape_beacon.types import SLOTS_PER_EPOCH, SYNC_COMMITTEE_SIZE
+
+EPOCHS_PER_SYNC_COMMITTEE_PERIOD = 256
+MAX_REQUEST_LIGHT_CLIENT_UPDATES = 128
+MIN_SYNC_COMMITTEE_PARTICIPANTS = 1
+DOMAIN_SYNC_COMMITTEE = bytes.fromhex("07000000")
+
+# NOTE: Generalized indices into the phase0 through deneb `BeaconState`
+FINALIZED_ROOT_GINDEX = 105
+CURRENT_SYNC_COMMITTEE_GINDEX = 54
+NEXT_SYNC_COMMITTEE_GINDEX = 55
+
+# NOTE: From electra, the `BeaconState` has over 32 fields so its tree is one level deeper
+FINALIZED_ROOT_GINDEX_ELECTRA = 169
+CURRENT_SYNC_COMMITTEE_GINDEX_ELECTRA = 86
+NEXT_SYNC_COMMITTEE_GINDEX_ELECTRA = 87
+
+ForkSchedule = Sequence[Tuple[int, bytes]]
+"""
+``(epoch, fork_version)`` pairs, in epoch order.
+"""
+
+
+def compute_sync_committee_period(slot: int) -> int:
+    return slot // SLOTS_PER_EPOCH // EPOCHS_PER_SYNC_COMMITTEE_PERIOD
+
+
+def compute_signing_root(object_root: bytes, fork_version: bytes, genesis_validators_root: bytes):
+    """
+    The spec's ``compute_signing_root`` for a sync committee signature over ``object_root``.
+    """
+    fork_data_root = ssz.ForkData.hash_tree_root(
+        {"current_version": fork_version, "genesis_validators_root": genesis_validators_root}
+    )
+    domain = DOMAIN_SYNC_COMMITTEE + fork_data_root[:28]
+    return ssz.SigningData.hash_tree_root({"object_root": object_root, "domain": domain})
+
+
+class SyncCommittee:
+    """
+    The 512 validator pubkeys of a sync committee period. Pubkeys are decompressed
+    and validated once, on first use, and reused for every signature of the period.
+    """
+
+    def __init__(self, pubkeys: Sequence[bytes], aggregate_pubkey: bytes):
+        self.pubkeys = [bytes(HexBytes(pubkey)) for pubkey in pubkeys]
+        self.aggregate_pubkey = bytes(HexBytes(aggregate_pubkey))
+        self._points: Optional[list] = None
+
+    @classmethod
+    def from_response(cls, data: Dict) -> "SyncCommittee":
+        return cls(data["pubkeys"], data["aggregate_pubkey"])
+
+    @property
+    def root(self) -> bytes:
+        return ssz.SyncCommittee.hash_tree_root(
+            {"pubkeys": self.pubkeys, "aggregate_pubkey": self.aggregate_pubkey}
+        )
+
+    @property
+    def points(self) -> list:
+        if self._points is None:
+            points = {}
+            for pubkey in set(self.pubkeys):
+                if not G2ProofOfPossession.KeyValidate(BLSPubkey(pubkey)):
+                    raise LightClientError(f"Invalid sync committee pubkey {pubkey.hex()}.")
+
+                points[pubkey] = pubkey_to_G1(BLSPubkey(pubkey))
+
+            self._points = [points[pubkey] for pubkey in self.pubkeys]
+
+        return self._points
+
+    def aggregate(self, bits: np.ndarray):
+        """
+        Returns the aggregate pubkey point of the members set in ``bits``.
+        """
+        # NOTE: Subtract the absent members from the full sum when most members signed
+        points = self.points
+        absent = np.flatnonzero(~bits)
+        if len(absent) < len(points) // 2:
+            total = _sum_points(points)
+            return add(total, neg(_sum_points([points[i] for i in absent])))
+
+        return _sum_points([points[i] for i in np.flatnonzero(bits)])
+
+
+class SignatureCheck(NamedTuple):
+    aggregate_pubkey: tuple
+    signing_root: bytes
+    signature: bytes
+
+
+def verify_signatures(checks: Sequence[SignatureCheck]) -> bool:
+    """
+    Verifies many aggregate BLS signatures at once, with one Miller loop each plus
+    one for the combined signature and a single final exponentiation. The checks are
+    combined with random scalars, so an invalid signature can't be cancelled out by
+    another.
+    """
+    if not checks:
+        return True
+
+    product = FQ12.one()
+    combined_signature = Z2
+    for check in checks:
+        if is_inf(check.aggregate_pubkey):
+            return False
+
+        try:
+            signature = signature_to_G2(BLSSignature(check.signature))
+        except ValueError:
+            return False
+
+        if not subgroup_check(signature):
+            return False
+
+        scalar = secrets.randbits(64) | 1 if len(checks) > 1 else 1
+        # NOTE: py_ecc annotates the hash function as a hash object
+        hash_function = cast(Any, G2ProofOfPossession.xmd_hash_function)
+        message = hash_to_G2(check.signing_root, G2ProofOfPossession.DST, hash_function)
+        product *= miller_loop(
+            message, neg(multiply(check.aggregate_pubkey, scalar)), final_exponentiate=False
+        )
+        combined_signature = add(combined_signature, multiply(signature, scalar))
+
+    product *= miller_loop(combined_signature, G1, final_exponentiate=False)
+    return final_exponentiate(product) == FQ12.one()
+
+
+class LightClientStore:
+    """
+    Tracks verified finalized and optimistic beacon block headers from light client
+    updates, starting from a trusted checkpoint. Follows the Altair light client
+    sync protocol, verifying each update's Merkle branches against its attested
+    header and its sync committee signature, without downloading any blocks.
+    """
+
+    def __init__(
+        self,
+        finalized_header: BeaconBlockHeader,
+        current_sync_committee: SyncCommittee,
+        genesis_validators_root: bytes,
+        fork_schedule: ForkSchedule,
+    ):
+        self.finalized_header = finalized_header
+        self.optimistic_header = finalized_header
+        self.current_sync_committee = current_sync_committee
+        self.next_sync_committee: Optional[SyncCommittee] = None
+        self.genesis_validators_root = bytes(genesis_validators_root)
+        self.fork_schedule = sorted(fork_schedule)
+
+        # NOTE: Most participants seen in an update of the previous and current period
+        self.previous_max_active_participants = 0
+        self.current_max_active_participants = 0
+
+    @classmethod
+    def bootstrap(
+        cls,
+        data: Dict,
+        trusted_root: bytes,
+        genesis_validators_root: bytes,
+        fork_schedule: ForkSchedule,
+    ) -> "LightClientStore":
+        """
+        Starts from beacon API ``LightClientBootstrap`` ``data`` for the block with
+        ``trusted_root``, e.g. a recent finalized checkpoint root from a source you trust.
+        """
+        header = _header_from_response(data["header"])
+        if header.root != HexBytes(trusted_root):
+            raise LightClientError("Bootstrap header does not match the trusted root.")
+
+        committee = SyncCommittee.from_response(data["current_sync_committee"])
+        _check_branch(
+            committee.root,
+            data["current_sync_committee_branch"],
+            (CURRENT_SYNC_COMMITTEE_GINDEX, CURRENT_SYNC_COMMITTEE_GINDEX_ELECTRA),
+            header.state_root,
+            "current sync committee",
+        )
+        return cls(header, committee, genesis_validators_root, fork_schedule)
+
+    @property
+    def period(self) -> int:
+        return compute_sync_committee_period(self.finalized_header.slot)
+
+    @property
+    def safety_threshold(self) -> int:
+        """
+        The spec's ``get_safety_threshold``: an update needs more participants than
+        this to advance the optimistic header, so a few members can't forge it.
+        """
+        return max(self.previous_max_active_participants, self.current_max_active_participants) // 2
+
+    def fork_version(self, slot: int) -> bytes:
+        epoch = slot // SLOTS_PER_EPOCH
+        versions = [version for fork_epoch, version in self.fork_schedule if fork_epoch <= epoch]
+        if not versions:
+            raise LightClientError(f"No fork known at epoch {epoch}.")
+
+        return versions[-1]
+
+    def process_updates(self, updates: Sequence[Dict]):
+        """
+        Verifies and applies beacon API ``LightClientUpdate``,
+        ``LightClientFinalityUpdate`` or ``LightClientOptimisticUpdate`` ``data``
+        in order. The sync committee signatures of all ``updates`` are verified in
+        one batch; if any is invalid, none of them are applied.
+        """
+        # NOTE: Validate against a scratch copy, as committees may rotate along the way
+        scratch = LightClientStore(
+            self.finalized_header,
+            self.current_sync_committee,
+            self.genesis_validators_root,
+            self.fork_schedule,
+        )
+        scratch.optimistic_header = self.optimistic_header
+        scratch.next_sync_committee = self.next_sync_committee
+        scratch.previous_max_active_participants = self.previous_max_active_participants
+        scratch.current_max_active_participants = self.current_max_active_participants
+
+        checks = []
+        for data in updates:
+            update = _Update.from_response(data)
+            checks.append(scratch._validate(update))
+            scratch._apply(update)
+
+        if not verify_signatures(checks):
+            raise LightClientError("Invalid sync committee signature.")
+
+        self.finalized_header = scratch.finalized_header
+        self.optimistic_header = scratch.optimistic_header
+        self.current_sync_committee = scratch.current_sync_committee
+        self.next_sync_committee = scratch.next_sync_committee
+        self.previous_max_active_participants = scratch.previous_max_active_participants
+        self.current_max_active_participants = scratch.current_max_active_participants
+
+    def _validate(self, update: "_Update") -> SignatureCheck:
+        participants = int(update.sync_committee_bits.sum())
+        if participants < MIN_SYNC_COMMITTEE_PARTICIPANTS:
+            raise LightClientError("Not enough sync committee participants.")
+
+        finalized_slot = update.finalized_header.slot if update.finalized_header else 0
+        if not update.signature_slot > update.attested_header.slot >= finalized_slot:
+            raise LightClientError("Update slots are out of order.")
+
+        signature_period = compute_sync_committee_period(update.signature_slot)
+        if self.next_sync_committee is not None:
+            if signature_period not in (self.period, self.period + 1):
+                raise LightClientError(f"Update from unexpected period {signature_period}.")
+        elif signature_period != self.period:
+            raise LightClientError(f"Update from unexpected period {signature_period}.")
+
+        state_root = update.attested_header.state_root
+        if update.finalized_header is not None:
+            # NOTE: The genesis checkpoint is finalized with a zero root
+            leaf = update.finalized_header.root if finalized_slot else bytes(32)
+            _check_branch(
+                leaf,
+                update.finality_branch,
+                (FINALIZED_ROOT_GINDEX, FINALIZED_ROOT_GINDEX_ELECTRA),
+                state_root,
+                "finalized header",
+            )
+
+        if update.next_sync_committee is not None:
+            _check_branch(
+                update.next_sync_committee.root,
+                update.next_sync_committee_branch,
+                (NEXT_SYNC_COMMITTEE_GINDEX, NEXT_SYNC_COMMITTEE_GINDEX_ELECTRA),
+                state_root,
+                "next sync committee",
+            )
+
+        committee = self.current_sync_committee
+        if signature_period != self.period:
+            committee = self.next_sync_committee  # type: ignore
+
+        signing_root = compute_signing_root(
+            update.attested_header.root,
+            self.fork_version(max(update.signature_slot, 1) - 1),
+            self.genesis_validators_root,
+        )
+        return SignatureCheck(
+            committee.aggregate(update.sync_committee_bits), signing_root, update.signature
+        )
+
+    def _apply(self, update: "_Update"):
+        participants = int(update.sync_committee_bits.sum())
+        self.current_max_active_participants = max(
+            self.current_max_active_participants, participants
+        )
+        if (
+            participants > self.safety_threshold
+            and update.attested_header.slot > self.optimistic_header.slot
+        ):
+            self.optimistic_header = update.attested_header
+
+        # NOTE: Only a 2/3 supermajority may advance finality or rotate committees
+        finalized = update.finalized_header
+        if finalized is None or 3 * participants < 2 * SYNC_COMMITTEE_SIZE:
+            return
+
+        finalized_period = compute_sync_committee_period(finalized.slot)
+        attested_period = compute_sync_committee_period(update.attested_header.slot)
+        next_committee = update.next_sync_committee if finalized_period == attested_period else None
+        if self.next_sync_committee is None:
+            if next_committee is not None and finalized_period == self.period:
+                self.next_sync_committee = next_committee
+        elif finalized_period == self.period + 1:
+            self.current_sync_committee = self.next_sync_committee
+            self.next_sync_committee = next_committee
+            self.previous_max_active_participants = self.current_max_active_participants
+            self.current_max_active_participants = 0
+
+        if finalized.slot > self.finalized_header.slot:
+            self.finalized_header = finalized
+            if finalized.slot > self.optimistic_header.slot:
+                self.optimistic_header = finalized
+
+
+class _Update(NamedTuple):
+    attested_header: BeaconBlockHeader
+    finalized_header: Optional[BeaconBlockHeader]
+    finality_branch: List[str]
+    next_sync_committee: Optional[SyncCommittee]
+    next_sync_committee_branch: List[str]
+    sync_committee_bits: np.ndarray
+    signature: bytes
+    signature_slot: int
+
+    @classmethod
+    def from_response(cls, data: Dict) -> "_Update":
+        sync_aggregate = data["sync_aggregate"]
+        bits = np.frombuffer(HexBytes(sync_aggregate["sync_committee_bits"]), dtype=np.uint8)
+        next_committee = data.get("next_sync_committee")
+        finalized_header = data.get("finalized_header")
+        return cls(
+            attested_header=_header_from_response(data["attested_header"]),
+            finalized_header=_header_from_response(finalized_header)
+            if finalized_header is not None
+            else None,
+            finality_branch=data.get("finality_branch", []),
+            next_sync_committee=SyncCommittee.from_response(next_committee)
+            if next_committee is not None
+            else None,
+            next_sync_committee_branch=data.get("next_sync_committee_branch", []),
+            sync_committee_bits=np.unpackbits(bits, bitorder="little").astype(bool),
+            signature=bytes(HexBytes(sync_aggregate["sync_committee_signature"])),
+            signature_slot=int(data["signature_slot"]),
+        )
+
+
+def _header_from_response(data: Dict) -> BeaconBlockHeader:
+    # NOTE: Altair headers are bare, later forks wrap them with execution data
+    message = data.get("beacon", data)
+    return BeaconBlockHeader(
+        root=HexBytes(ssz.BeaconBlockHeader.hash_tree_root(message)),
+        slot=int(message["slot"]),
+        proposer_index=int(message["proposer_index"]),
+        parent_root=HexBytes(message["parent_root"]),
+        state_root=HexBytes(message["state_root"]),
+        body_root=HexBytes(message["body_root"]),
+    )
+
+
+def _check_branch(
+    leaf: bytes, branch: Sequence[str], gindices: Sequence[int], root: bytes, name: str
+):
+    # NOTE: The branch depth tells the fork's state layout apart
+    proof = [bytes(HexBytes(node)) for node in branch]
+    depths = {gindex.bit_length() - 1: gindex for gindex in gindices}
+    if len(proof) not in depths:
+        raise LightClientError(
+            f"Unsupported fork: {name} branch of depth {len(proof)} (expected one of "
+            f"{sorted(depths)})."
+        )
+
+    gindex = depths[len(proof)]
+    depth = len(proof)
+    if not ssz.is_valid_merkle_branch(leaf, proof, depth, gindex - (1 << depth), root):
+        raise LightClientError(f"Invalid {name} branch.")
+
+
+def _sum_points(points: Sequence[tuple]) -> tuple:
+    total = Z1
+    for point in points:
+        total = add(total, point)
+
+    return total
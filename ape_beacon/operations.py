@@ -0,0 +1,202 @@
+from array import array
+from typing import Dict, List, Tuple
+
+import numpy as np
+from hexbytes import HexBytes
+
+ROOT_DTYPE = np.dtype("S32")
+PUBKEY_DTYPE = np.dtype("S48")
+
+
+class Attestations:
+    """
+    The attestations of a beacon block as parallel NumPy arrays, one row per
+    attestation. Aggregation bitlists are packed back to back in ``bits`` (SSZ bit
+    order, without the length delimiter bit) with ``bits_offset`` / ``bits_length``
+    giving each row's bit range, so participation is computed without unpacking
+    one attestation at a time.
+    """
+
+    def __init__(
+        self,
+        block_slot: int,
+        slot: np.ndarray,
+        committee_index: np.ndarray,
+        beacon_block_root: np.ndarray,
+        source_epoch: np.ndarray,
+        source_root: np.ndarray,
+        target_epoch: np.ndarray,
+        target_root: np.ndarray,
+        bits: np.ndarray,
+        bits_offset: np.ndarray,
+        bits_length: np.ndarray,
+    ):
+        self.block_slot = block_slot
+        self.slot = slot
+        self.committee_index = committee_index
+        self.beacon_block_root = beacon_block_root
+        self.source_epoch = source_epoch
+        self.source_root = source_root
+        self.target_epoch = target_epoch
+        self.target_root = target_root
+        self.bits = bits
+        self.bits_offset = bits_offset
+        self.bits_length = bits_length
+
+    @classmethod
+    def from_response(cls, items: List[Dict], block_slot: int) -> "Attestations":
+        """
+        Builds the arrays from the beacon API ``attestations`` of the block at ``block_slot``.
+        """
+        slot, committee_index = array("Q"), array("Q")
+        source_epoch, target_epoch = array("Q"), array("Q")
+        bits_offset, bits_length = array("Q"), array("Q")
+        block_roots, source_roots, target_roots = bytearray(), bytearray(), bytearray()
+        packed_bits = bytearray()
+        for item in items:
+            data = item["data"]
+            slot.append(int(data["slot"]))
+            committee_index.append(int(data["index"]))
+            source_epoch.append(int(data["source"]["epoch"]))
+            target_epoch.append(int(data["target"]["epoch"]))
+            block_roots += HexBytes(data["beacon_block_root"])
+            source_roots += HexBytes(data["source"]["root"])
+            target_roots += HexBytes(data["target"]["root"])
+
+            # NOTE: The highest set bit of an SSZ bitlist marks its length
+            aggregation_bits = HexBytes(item["aggregation_bits"])
+            length = 8 * (len(aggregation_bits) - 1) + aggregation_bits[-1].bit_length() - 1
+            bits_offset.append(8 * len(packed_bits))
+            bits_length.append(max(length, 0))
+            packed_bits += aggregation_bits
+
+        return cls(
+            block_slot=block_slot,
+            slot=np.frombuffer(slot, dtype=np.uint64),
+            committee_index=np.frombuffer(committee_index, dtype=np.uint64),
+            beacon_block_root=np.frombuffer(bytes(block_roots), dtype=ROOT_DTYPE),
+            source_epoch=np.frombuffer(source_epoch, dtype=np.uint64),
+            source_root=np.frombuffer(bytes(source_roots), dtype=ROOT_DTYPE),
+            target_epoch=np.frombuffer(target_epoch, dtype=np.uint64),
+            target_root=np.frombuffer(bytes(target_roots), dtype=ROOT_DTYPE),
+            bits=np.frombuffer(bytes(packed_bits), dtype=np.uint8),
+            bits_offset=np.frombuffer(bits_offset, dtype=np.uint64).astype(np.int64),
+            bits_length=np.frombuffer(bits_length, dtype=np.uint64).astype(np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    @property
+    def inclusion_delay(self) -> np.ndarray:
+        """
+        Slots between each attestation's slot and the block that included it.
+        """
+        return np.uint64(self.block_slot) - self.slot
+
+    def aggregation_bits(self, row: int) -> np.ndarray:
+        """
+        Returns the aggregation bits of attestation ``row`` as a boolean array, one
+        entry per committee member.
+        """
+        start, length = int(self.bits_offset[row]) // 8, int(self.bits_length[row])
+        bits = np.unpackbits(self.bits[start : start + length // 8 + 1], bitorder="little")
+        return bits[:length].astype(bool)
+
+    def participation(self) -> np.ndarray:
+        """
+        Returns the number of committee members included in each attestation.
+        """
+        bits = np.unpackbits(self.bits, bitorder="little")
+        cumulative = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(bits, dtype=np.int64)))
+        return cumulative[self.bits_offset + self.bits_length] - cumulative[self.bits_offset]
+
+    def committee_participation(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the ``(slot, committee_index, participants, committee_size)`` of each
+        committee attested to in the block, merging the aggregation bits of all its
+        attestations.
+        """
+        keys = np.stack((self.slot, self.committee_index), axis=1)
+        committees, group = np.unique(keys, axis=0, return_inverse=True)
+        group = group.reshape(-1)
+        committee_size = np.zeros(len(committees), dtype=np.int64)
+        np.maximum.at(committee_size, group, self.bits_length)
+
+        # NOTE: Each row's bits are ORed into its committee's range of one merged array
+        committee_start = np.cumsum(committee_size) - committee_size
+        row_start = np.cumsum(self.bits_length) - self.bits_length
+        row = np.repeat(np.arange(len(self)), self.bits_length)
+        position = np.arange(int(self.bits_length.sum())) - row_start[row]
+        bits = np.unpackbits(self.bits, bitorder="little").astype(bool)
+        is_set = bits[self.bits_offset[row] + position]
+
+        merged = np.zeros(int(committee_size.sum()), dtype=bool)
+        merged[committee_start[group[row[is_set]]] + position[is_set]] = True
+        cumulative = np.concatenate(
+            (np.zeros(1, dtype=np.int64), np.cumsum(merged, dtype=np.int64))
+        )
+        participants = cumulative[committee_start + committee_size] - cumulative[committee_start]
+
+        return committees[:, 0], committees[:, 1], participants, committee_size
+
+
+class BlockOperations:
+    """
+    The operations of a beacon block kept in compact, array-backed form, see
+    :meth:`~ape_beacon.ecosystem.Beacon.decode_block` with ``keep_operations=True``.
+    """
+
+    def __init__(
+        self,
+        attestations: Attestations,
+        deposit_pubkey: np.ndarray,
+        deposit_amount: np.ndarray,
+        exit_validator_index: np.ndarray,
+        exit_epoch: np.ndarray,
+        proposer_slashed_index: np.ndarray,
+        attester_slashed_index: np.ndarray,
+    ):
+        self.attestations = attestations
+        self.deposit_pubkey = deposit_pubkey
+        self.deposit_amount = deposit_amount
+        self.exit_validator_index = exit_validator_index
+        self.exit_epoch = exit_epoch
+        self.proposer_slashed_index = proposer_slashed_index
+        self.attester_slashed_index = attester_slashed_index
+
+    @classmethod
+    def from_response(cls, body: Dict, block_slot: int) -> "BlockOperations":
+        """
+        Builds the operations from beacon API block ``body`` data.
+        """
+        deposits = [deposit["data"] for deposit in body.get("deposits", [])]
+        exits = [voluntary_exit["message"] for voluntary_exit in body.get("voluntary_exits", [])]
+        proposer_slashings = body.get("proposer_slashings", [])
+
+        # NOTE: Validators are slashed if in both conflicting attestations
+        attester_slashed = set()
+        for slashing in body.get("attester_slashings", []):
+            first = slashing["attestation_1"]["attesting_indices"]
+            second = slashing["attestation_2"]["attesting_indices"]
+            attester_slashed.update({int(i) for i in first} & {int(i) for i in second})
+
+        return cls(
+            attestations=Attestations.from_response(body.get("attestations", []), block_slot),
+            deposit_pubkey=np.array(
+                [bytes(HexBytes(deposit["pubkey"])) for deposit in deposits], dtype=PUBKEY_DTYPE
+            ),
+            deposit_amount=np.array([int(d["amount"]) for d in deposits], dtype=np.uint64),
+            exit_validator_index=np.array(
+                [int(e["validator_index"]) for e in exits], dtype=np.uint64
+            ),
+            exit_epoch=np.array([int(e["epoch"]) for e in exits], dtype=np.uint64),
+            proposer_slashed_index=np.array(
+                [
+                    int(slashing["signed_header_1"]["message"]["proposer_index"])
+                    for slashing in proposer_slashings
+                ],
+                dtype=np.uint64,
+            ),
+            attester_slashed_index=np.array(sorted(attester_slashed), dtype=np.uint64),
+        )
@@ -1,19 +1,62 @@
+import asyncio
+import time
 from abc import ABC
-from typing import Iterator, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby, islice
+from typing import (
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+import aiohttp
 import requests
 from ape.api.networks import LOCAL_NETWORK_NAME
 from ape.api.providers import BlockAPI, ProviderAPI
 from ape.api.transactions import ReceiptAPI, TransactionAPI
-from ape.exceptions import APINotImplementedError, BlockNotFoundError, ProviderNotConnectedError
+from ape.exceptions import (
+    APINotImplementedError,
+    BlockNotFoundError,
+    ProviderError,
+    ProviderNotConnectedError,
+)
 from ape.types import BlockID, ContractLog, LogFilter
 from ape.utils import cached_property
 from eth_typing import HexStr
 from hexbytes import HexBytes
 from web3.beacon import Beacon
 
-from ape_beacon.exceptions import ValidatorNotFoundError
-from ape_beacon.types import convert_block_id
+from ape_beacon.cache import BlockCache, BlockCacheKey, BlockCacheSettings
+from ape_beacon.client import (
+    NOT_FOUND_STATUS_CODES,
+    AsyncBeaconClient,
+    BeaconClient,
+    BeaconClientSettings,
+    MultiBeaconClient,
+)
+from ape_beacon.containers import BeaconBlockHeader, ValidatorSummary
+from ape_beacon.ecosystem import Beacon as BeaconEcosystem
+from ape_beacon.epochs import EpochSummary
+from ape_beacon.exceptions import BeaconRequestError, LightClientError, ValidatorNotFoundError
+from ape_beacon.index import Reorg, SlotIndex, SlotIndexSettings
+from ape_beacon.light_client import MAX_REQUEST_LIGHT_CLIENT_UPDATES, LightClientStore
+from ape_beacon.registry import ValidatorRegistry
+from ape_beacon.ssz import compute_block_root
+from ape_beacon.store import MISSED_SLOT, BlockStore, BlockStoreSettings
+from ape_beacon.types import SLOTS_PER_EPOCH, convert_block_id
+
+EVENT_TOPICS = ("head", "finalized_checkpoint", "chain_reorg")
+MAX_RECONNECT_DELAY = 30.0
+
+T = TypeVar("T")
 
 
 class BeaconProvider(ProviderAPI, ABC):
@@ -25,20 +68,150 @@ class BeaconProvider(ProviderAPI, ABC):
 
     # NOTE: Read only provider given web3.py Beacon API implementation
 
-    _beacon: Optional[Beacon] = None
+    _beacon: Optional[Beacon] = None  # NOTE: A plain `Beacon` is upgraded on first use
+    _block_cache: Optional[BlockCache] = None
+    _block_store: Optional[BlockStore] = None
     _client_version: Optional[str] = None
+    _finalized_slot: int = -1
+    _finalized_slot_expires_at: float = 0.0
+    _head_slot: Optional[int] = None
+    _light_client: Optional[LightClientStore] = None
+    _slot_index: Optional[SlotIndex] = None
+    _subscribed: bool = False
+    _validator_registry: Optional[ValidatorRegistry] = None
     cached_chain_id: Optional[int] = None
 
     @property
-    def beacon(self) -> Beacon:
+    def beacon(self) -> BeaconClient:
         """
         Access to the ``beacon`` object as if you did ``Beacon(uri)``.
         """
         if not self._beacon:
             raise ProviderNotConnectedError()
+        elif isinstance(self._beacon, Beacon) and not isinstance(self._beacon, BeaconClient):
+            # NOTE: Upgrade a plain web3 `Beacon` still assigned by a subclass in `connect()`
+            self._beacon = self._create_beacon(self._beacon.base_url)
+        elif not isinstance(self._beacon, BeaconClient):
+            raise ProviderError(
+                f"Expected a BeaconClient, got '{type(self._beacon).__name__}'. "
+                "Create the client with `_create_beacon()` in `connect()`."
+            )
 
         return self._beacon
 
+    @property
+    def client_settings(self) -> BeaconClientSettings:
+        """
+        Pooled transport settings (pool size, keep-alive, gzip, timeouts) parsed
+        from the provider settings.
+        """
+        return BeaconClientSettings.parse_obj(self.provider_settings)
+
+    def _create_beacon(self, uri: str) -> BeaconClient:
+        """
+        Creates a beacon client with a pooled session for ``uri``, or one balancing
+        across the endpoints of the ``uris`` provider setting when several are given.
+        Implementations should call this from ``connect()``.
+        """
+        settings = self.client_settings
+        if len(settings.uris) > 1:
+            return MultiBeaconClient(settings.uris, settings=settings, headers=self.request_header)
+
+        uri = settings.uris[0] if settings.uris else uri
+        return BeaconClient(uri, settings=settings, headers=self.request_header)
+
+    def _close_beacon(self):
+        """
+        Releases pooled connections held by the beacon client. Implementations
+        should call this from ``disconnect()``.
+        """
+        if isinstance(self._beacon, BeaconClient):
+            self._beacon.close()
+
+        self._beacon = None
+        self._block_cache = None
+        if self._block_store is not None:
+            self._block_store.close()
+
+        self._block_store = None
+        self._finalized_slot = -1
+        self._finalized_slot_expires_at = 0.0
+        self._head_slot = None
+        self._light_client = None
+        self._slot_index = None
+        self._validator_registry = None
+
+    @property
+    def block_cache(self) -> BlockCache:
+        """
+        The in-memory LRU cache of decoded blocks, sized by the ``block_cache_size``
+        and ``block_cache_ttl`` provider settings.
+        """
+        if self._block_cache is None:
+            settings = BlockCacheSettings.parse_obj(self.provider_settings)
+            self._block_cache = BlockCache(
+                max_size=settings.block_cache_size, ttl=settings.block_cache_ttl
+            )
+
+        return self._block_cache
+
+    @property
+    def block_store(self) -> Optional[BlockStore]:
+        """
+        The on-disk store of finalized blocks, or ``None`` unless enabled with the
+        ``block_store`` provider setting.
+        """
+        if self._block_store is None:
+            settings = BlockStoreSettings.parse_obj(self.provider_settings)
+            if not settings.block_store:
+                return None
+
+            path = settings.block_store_path or self.data_folder / "blocks.sqlite"
+            self._block_store = BlockStore(path)
+
+        return self._block_store
+
+    @property
+    def slot_index(self) -> SlotIndex:
+        """
+        The canonical chain index of the non-finalized blocks returned so far.
+        Reorgs it detects drop the affected cached blocks; subscribe to it to be
+        notified of them too.
+        """
+        if self._slot_index is None:
+            self._slot_index = SlotIndex(finalized_slot=self._finalized_slot)
+            self._slot_index.subscribe(self._invalidate_reorged_blocks)
+
+        return self._slot_index
+
+    @property
+    def slot_index_settings(self) -> SlotIndexSettings:
+        """
+        Slot index settings (whether it tracks reorgs) parsed from the provider settings.
+        """
+        return SlotIndexSettings.parse_obj(self.provider_settings)
+
+    def _invalidate_reorged_blocks(self, reorg: Reorg):
+        self.block_cache.invalidate_slots(set(reorg.reverted) | set(reorg.new))
+
+    @property
+    def finalized_slot(self) -> int:
+        """
+        The latest finalized slot, refreshed at most once every ``block_cache_ttl``
+        seconds. ``-1`` when unknown.
+        """
+        now = time.monotonic()
+        if self._finalized_slot_expires_at <= now:
+            try:
+                resp = self.beacon.get_block_header("finalized")
+                self._finalized_slot = int(resp["data"]["header"]["message"]["slot"])
+            except (requests.exceptions.HTTPError, KeyError):
+                pass  # NOTE: Treat everything as non-finalized until known
+
+            self._finalized_slot_expires_at = now + self.block_cache.ttl
+
+        return self._finalized_slot
+
     @cached_property
     def client_version(self) -> str:
         """
@@ -99,15 +272,40 @@ class BeaconProvider(ProviderAPI, ABC):
 
     @property
     def is_connected(self) -> bool:
+        """
+        Whether the node is fully synced or syncing. Served from the health reported
+        by recent requests, only probing the node once that is older than the
+        ``health_check_interval`` provider setting.
+        """
+        if self._beacon is None:
+            return False
+
+        if isinstance(self._beacon, BeaconClient) and not self._beacon.health_expired:
+            return bool(self._beacon.healthy)
+
+        return self.refresh_health()
+
+    def refresh_health(self) -> bool:
+        """
+        Probes the node's health endpoint, as if you did ``Beacon(uri).get_health()``.
+        """
         if self._beacon is None:
             return False
 
         # treat as connected if node is fully synced or syncing
-        status_code = self._beacon.get_health()
-        return (
+        try:
+            status_code = self._beacon.get_health()
+        except requests.exceptions.RequestException:
+            return False
+
+        healthy = (
             status_code == requests.status_codes.codes.ok
             or status_code == requests.status_codes.codes.partial
         )
+        if isinstance(self._beacon, BeaconClient):
+            self._beacon.record_health(healthy)
+
+        return healthy
 
     def update_settings(self, new_settings: dict):
         self.disconnect()
@@ -148,44 +346,794 @@ class BeaconProvider(ProviderAPI, ABC):
         """
         As if you did ``Beacon(uri).get_block(block_id)``.
         """
-        beacon_block_id = convert_block_id(block_id)
-        if isinstance(beacon_block_id, HexBytes):
-            beacon_block_id = HexStr(beacon_block_id.hex())
+        beacon_block_id = _to_beacon_block_id(block_id)
+        cached_block = self._get_cached_block(beacon_block_id)
+        if cached_block is not None:
+            return cached_block
+
+        stored_block = self._get_stored_block(block_id, beacon_block_id)
+        if stored_block is not None:
+            return stored_block
 
+        finalized_slot = self.finalized_slot
         try:
-            resp = self.beacon.get_block(str(beacon_block_id))
-            if "data" not in resp or "message" not in resp["data"]:
-                raise BlockNotFoundError(block_id)
+            resp = self.beacon.get_block(beacon_block_id)
         except requests.exceptions.HTTPError as err:
+            status_code = _get_status_code(err)
+            if status_code not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(status_code, str(err)) from err
+            elif status_code == 404:
+                self._store_missed_slot(beacon_block_id, finalized_slot)
+
             raise BlockNotFoundError(block_id) from err
 
+        return self._process_block_response(block_id, beacon_block_id, resp, finalized_slot)
+
+    def _process_block_response(
+        self, block_id: BlockID, beacon_block_id: str, resp: Dict, finalized_slot: int
+    ) -> BlockAPI:
+        if "data" not in resp or "message" not in resp["data"]:
+            raise BlockNotFoundError(block_id)
+
         block_data = resp["data"]["message"]
-        return self.network.ecosystem.decode_block(block_data)
+        finalized = int(block_data.get("slot", -1)) <= finalized_slot
+        key = _to_block_cache_key(beacon_block_id)
+        if self.block_store is not None and finalized and not isinstance(key, str):
+            # NOTE: A block fetched by root may be an orphan, so only store by slot fetches.
+            # Roots are filled in from their child's parent root, see `get_blocks()`.
+            self.block_store.put(int(block_data["slot"]), block_data)
+
+        # NOTE: Non-finalized blocks are indexed by root to detect reorgs, which takes
+        # hashing the blocks fetched by slot so is opt-in. The first head is always
+        # hashed to seed the index, so its children fetched by root are indexed too.
+        block_root = None
+        if not finalized and isinstance(key, str):
+            block_root = HexBytes(key)
+        elif not finalized and (
+            self.slot_index_settings.track_reorgs
+            or (beacon_block_id == "head" and self.slot_index.tip is None)
+        ):
+            block_root = _compute_block_root(block_data)
+
+        block = self._decode_block(block_data)
+        self._cache_block(block, beacon_block_id, finalized_slot, block_root=block_root)
+        return block
+
+    def _decode_block(self, block_data: Dict) -> BlockAPI:
+        # NOTE: Data from the connected node (or stored from it) skips re-validation
+        ecosystem = self.network.ecosystem
+        if isinstance(ecosystem, BeaconEcosystem):
+            return ecosystem.decode_block(block_data, trusted=True)
+
+        return ecosystem.decode_block(block_data)
+
+    def _get_stored_block(self, block_id: BlockID, beacon_block_id: str) -> Optional[BlockAPI]:
+        if self.block_store is None:
+            return None
+
+        key = _to_block_cache_key(beacon_block_id)
+        if isinstance(key, int):
+            block_data = self.block_store.get(slot=key)
+        elif isinstance(key, str):
+            block_data = self.block_store.get(root=key)
+        else:
+            return None
+
+        if block_data is None:
+            return None
+        elif block_data is MISSED_SLOT:
+            raise BlockNotFoundError(block_id)
+
+        # NOTE: Only finalized blocks are stored
+        block = self._decode_block(block_data)
+        self._cache_block(block, beacon_block_id, finalized_slot=int(block_data["slot"]))
+        return block
+
+    def _store_missed_slot(self, beacon_block_id: str, finalized_slot: int):
+        if self.block_store is None or not beacon_block_id.isdigit():
+            return
+
+        slot = int(beacon_block_id)
+        if slot <= finalized_slot:
+            self.block_store.put(slot, None)
+
+    def _get_cached_block(self, beacon_block_id: str) -> Optional[BlockAPI]:
+        if beacon_block_id == "head" and self._subscribed and self._head_slot is not None:
+            # NOTE: While streaming, the head block is fetched as soon as it is announced
+            return self.block_cache.get(self._head_slot)
+
+        key = _to_block_cache_key(beacon_block_id)
+        if key is None:
+            return None
+
+        return self.block_cache.get(key)
+
+    def _cache_block(
+        self,
+        block: BlockAPI,
+        beacon_block_id: str,
+        finalized_slot: int,
+        block_root: Optional[HexBytes] = None,
+    ):
+        if block.number is None:
+            return
+
+        key = _to_block_cache_key(beacon_block_id)
+        root = block_root.hex() if block_root is not None else None
+        if isinstance(key, str):
+            root = key
+
+        # NOTE: A new head means non-finalized blocks may have been reorged out, which
+        # the slot index can only rule out if it knows the head's parent
+        if beacon_block_id == "head" and block.number != self._head_slot:
+            self._head_slot = block.number
+            if block_root is None or block.parent_hash not in self.slot_index:
+                self.block_cache.invalidate_unfinalized()
+
+        # NOTE: A block fetched by root may be a non-canonical sibling, so it is only
+        # treated as canonical when it builds on the indexed chain
+        finalized = block.number <= finalized_slot
+        canonical = not isinstance(key, str)
+        if isinstance(key, str) and block_root is not None:
+            tip = self.slot_index.tip
+            canonical = tip is not None and tip[1] == block.parent_hash
+            if not canonical:
+                block_root = None
+
+        if not finalized and block_root is not None:
+            self.slot_index.finalize(finalized_slot)
+            self.slot_index.add(block.number, block_root, block.parent_hash)
+
+        self.block_cache.put(block, finalized=finalized, root=root, canonical=canonical)
+
+    def get_blocks(
+        self, start: int = 0, stop: Optional[int] = None, concurrency: int = 8, step: int = 1
+    ) -> Iterator[BlockAPI]:
+        """
+        Fetches the blocks for every ``step`` slots from ``start`` through ``stop``
+        (inclusive) using a bounded pool of ``concurrency`` worker threads. Blocks
+        are yielded in slot order as soon as they are available, while later slots
+        are still in flight. Missed (empty) slots are skipped.
+        """
+        if stop is None:
+            stop = self._get_head_slot()
+
+        slots = range(start, stop + 1, step)
+        blocks = self._map_slots(self._get_block_or_none, slots, concurrency)
+        if step != 1:
+            yield from blocks
+            return
+
+        parent = None
+        for block in blocks:
+            self._store_parent_root(parent, block)
+            parent = block
+            yield block
+
+        self._mark_stored_range_complete(start, stop)
+
+    def _store_parent_root(self, parent: Optional[BlockAPI], block: BlockAPI):
+        # NOTE: Blocks of a slot range in order are parent and child, so the parent's root
+        # is known without hashing it or requesting its header
+        if self.block_store is None or parent is None or parent.number is None:
+            return
+        elif block.number is not None and block.number <= self._finalized_slot:
+            self.block_store.set_root(parent.number, HexBytes(block.parent_hash).hex())
+
+    def _map_slots(
+        self, fetch: Callable[[int], Optional[T]], slots: Iterable[int], concurrency: int
+    ) -> Iterator[T]:
+        """
+        Calls ``fetch`` for each of ``slots`` on a pool of ``concurrency`` threads,
+        yielding the results that are not ``None`` in slot order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        slots = iter(slots)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # NOTE: Keep a window of in-flight requests so memory stays bounded on long ranges
+            pending: Deque[Future] = deque(
+                executor.submit(fetch, slot) for slot in islice(slots, 2 * concurrency)
+            )
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    next_slot = next(slots, None)
+                    if next_slot is not None:
+                        pending.append(executor.submit(fetch, next_slot))
+
+                    if result is not None:
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _mark_stored_range_complete(self, start: int, stop: int):
+        if self.block_store is None:
+            return
+
+        stop = min(stop, self._finalized_slot)
+        if start <= stop and self.block_store.count(start, stop) == stop - start + 1:
+            self.block_store.mark_complete(start, stop)
+
+    def _get_block_or_none(self, slot: int) -> Optional[BlockAPI]:
+        try:
+            return self.get_block(slot)
+        except BlockNotFoundError:
+            return None
+
+    def get_epoch_summary(self, epoch: int, concurrency: int = 8) -> EpochSummary:
+        """
+        Fetches the slots of ``epoch`` concurrently and summarizes their blocks,
+        with the missed slots listed explicitly.
+        """
+        # NOTE: Slots after the head are yet to come, not missed
+        head_slot = self._get_head_slot()
+        stop = min((epoch + 1) * SLOTS_PER_EPOCH, head_slot + 1)
+        slots = range(epoch * SLOTS_PER_EPOCH, stop)
+        blocks = self._map_slots(self._get_block_or_none, slots, concurrency)
+        return EpochSummary.from_blocks(epoch, blocks, head_slot=head_slot)
+
+    def iter_epoch_summaries(
+        self, start: int = 0, stop: Optional[int] = None, concurrency: int = 8
+    ) -> Iterator[EpochSummary]:
+        """
+        Yields the :class:`~ape_beacon.epochs.EpochSummary` of every epoch from
+        ``start`` through ``stop`` (inclusive, defaults to the last complete epoch),
+        up to the head. Slots are fetched concurrently across epoch boundaries and each
+        epoch is yielded as soon as its last slot is in, so long ranges stream in
+        bounded memory.
+        """
+        head_slot = self._get_head_slot()
+        if stop is None:
+            stop = (head_slot + 1) // SLOTS_PER_EPOCH - 1
+
+        slots = range(start * SLOTS_PER_EPOCH, min((stop + 1) * SLOTS_PER_EPOCH, head_slot + 1))
+        results = self._map_slots(self._get_slot_block, slots, concurrency)
+        for epoch, items in groupby(results, key=lambda item: item[0] // SLOTS_PER_EPOCH):
+            blocks = (block for _, block in items if block is not None)
+            yield EpochSummary.from_blocks(epoch, blocks, head_slot=head_slot)
+
+        if slots:
+            self._mark_stored_range_complete(slots[0], slots[-1])
+
+    def _get_slot_block(self, slot: int) -> Tuple[int, Optional[BlockAPI]]:
+        # NOTE: Missed slots stay in the results, so every epoch is yielded
+        return slot, self._get_block_or_none(slot)
+
+    def get_block_header(self, block_id: BlockID) -> BeaconBlockHeader:
+        """
+        Gets the header of ``block_id``, without downloading the block body.
+        """
+        beacon_block_id = _to_beacon_block_id(block_id)
+        try:
+            resp = self.beacon.get_block_header(beacon_block_id)
+        except requests.exceptions.HTTPError as err:
+            status_code = _get_status_code(err)
+            if status_code not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(status_code, str(err)) from err
+
+            raise BlockNotFoundError(block_id) from err
+
+        if "data" not in resp:
+            raise BlockNotFoundError(block_id)
+
+        return BeaconBlockHeader.from_response(resp["data"])
+
+    def get_block_headers(
+        self, slot: Optional[int] = None, parent_root: Optional[BlockID] = None
+    ) -> List[BeaconBlockHeader]:
+        """
+        Gets the headers at ``slot`` and / or whose parent is ``parent_root`` in one
+        request, including non-canonical ones. Defaults to the head headers.
+        """
+        root = HexBytes(parent_root).hex() if parent_root is not None else None
+        try:
+            resp = self.beacon.get_block_headers(slot=slot, parent_root=root)
+        except requests.exceptions.HTTPError as err:
+            raise BeaconRequestError(_get_status_code(err), str(err)) from err
+
+        return [BeaconBlockHeader.from_response(item) for item in resp.get("data", [])]
+
+    def iter_block_headers(
+        self, start: int = 0, stop: Optional[int] = None, concurrency: int = 8, step: int = 1
+    ) -> Iterator[BeaconBlockHeader]:
+        """
+        Like :meth:`~ape_beacon.providers.BeaconProvider.get_blocks`, but fetches
+        only the canonical headers. Use with ``block_ranges()`` to page through
+        slots when the block bodies are not needed::
+
+            for start, stop in provider.block_ranges(start=0, page=1024):
+                for header in provider.iter_block_headers(start, stop):
+                    ...
+        """
+        if stop is None:
+            stop = self._get_head_slot()
+
+        slots = range(start, stop + 1, step)
+        yield from self._map_slots(self._get_block_header_or_none, slots, concurrency)
+
+    def _get_block_header_or_none(self, slot: int) -> Optional[BeaconBlockHeader]:
+        try:
+            return self.get_block_header(slot)
+        except BlockNotFoundError:
+            return None
+
+    @property
+    def validator_registry(self) -> Optional[ValidatorRegistry]:
+        """
+        The validator snapshot loaded with
+        :meth:`~ape_beacon.providers.BeaconProvider.load_validator_registry`, if any.
+        """
+        return self._validator_registry
+
+    def load_validator_registry(self, state_id: str = "head") -> ValidatorRegistry:
+        """
+        Loads the full validator set of ``state_id`` into a columnar snapshot, streaming
+        the response. Once loaded, ``get_balance`` is served from the snapshot.
+        """
+        items = self.beacon.iter_validators(state_id)
+        self._validator_registry = ValidatorRegistry.from_response(items, state_id=state_id)
+        return self._validator_registry
+
+    def get_randao_mix(self, epoch: Optional[int] = None, state_id: str = "head") -> HexBytes:
+        """
+        Gets the RANDAO mix of ``epoch`` as of ``state_id``, e.g. to seed a
+        :class:`~ape_beacon.committees.CommitteeEngine`.
+        """
+        try:
+            resp = self.beacon.get_randao(state_id=state_id, epoch=epoch)
+        except requests.exceptions.HTTPError as err:
+            raise BeaconRequestError(_get_status_code(err), str(err)) from err
+
+        return HexBytes(resp["data"]["randao"])
+
+    @property
+    def light_client(self) -> Optional[LightClientStore]:
+        """
+        The light client started with
+        :meth:`~ape_beacon.providers.BeaconProvider.start_light_client`, if any.
+        """
+        return self._light_client
+
+    def start_light_client(self, checkpoint_root: BlockID) -> LightClientStore:
+        """
+        Starts tracking verified headers from the trusted block ``checkpoint_root``,
+        e.g. a recent finalized checkpoint root. Call
+        :meth:`~ape_beacon.providers.BeaconProvider.update_light_client` to follow
+        the chain from there.
+        """
+        root = HexBytes(checkpoint_root)
+        beacon = self.beacon
+        try:
+            bootstrap = beacon.get_light_client_bootstrap(root.hex())
+            genesis = beacon.get_genesis()
+            fork_schedule = beacon.get_fork_schedule()
+        except requests.exceptions.HTTPError as err:
+            raise BeaconRequestError(_get_status_code(err), str(err)) from err
+
+        forks = [
+            (int(fork["epoch"]), HexBytes(fork["current_version"]))
+            for fork in fork_schedule["data"]
+        ]
+        self._light_client = LightClientStore.bootstrap(
+            bootstrap["data"],
+            root,
+            HexBytes(genesis["data"]["genesis_validators_root"]),
+            forks,
+        )
+        return self._light_client
+
+    def update_light_client(self) -> LightClientStore:
+        """
+        Fetches the light client updates since the last finalized header, plus the
+        latest finality and optimistic updates, and applies them once all their sync
+        committee signatures verify in one batch.
+        """
+        store = self._light_client
+        if store is None:
+            raise LightClientError("Light client not started.")
+
+        beacon = self.beacon
+        try:
+            items = beacon.get_light_client_updates(store.period, MAX_REQUEST_LIGHT_CLIENT_UPDATES)
+        except requests.exceptions.HTTPError as err:
+            raise BeaconRequestError(_get_status_code(err), str(err)) from err
+
+        updates = [item["data"] for item in items]
+        for get_update in (
+            beacon.get_light_client_finality_update,
+            beacon.get_light_client_optimistic_update,
+        ):
+            try:
+                updates.append(get_update()["data"])
+            except requests.exceptions.HTTPError as err:
+                # NOTE: Not available until the node has seen a sync aggregate
+                status_code = _get_status_code(err)
+                if status_code not in NOT_FOUND_STATUS_CODES:
+                    raise BeaconRequestError(status_code, str(err)) from err
+
+        store.process_updates(updates)
+        return store
 
     def get_balance(self, address: str) -> int:
         """
         Gets the validator balance for validator address or ID on beacon chain.
         """
+        if self._validator_registry is not None:
+            validator = self._validator_registry.get(str(address))
+            if validator is not None:
+                return validator.balance
+
         try:
             resp = self.beacon.get_validator(address)
-            if "data" not in resp or "balance" not in resp["data"]:
-                raise ValidatorNotFoundError(address)
         except requests.exceptions.HTTPError as err:
+            status_code = _get_status_code(err)
+            if status_code not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(status_code, str(err)) from err
+
             raise ValidatorNotFoundError(address) from err
 
+        return self._decode_balance_response(address, resp)
+
+    def _decode_balance_response(self, address: str, resp: Dict) -> int:
+        if "data" not in resp or "balance" not in resp["data"]:
+            raise ValidatorNotFoundError(address)
+
         balance = int(resp["data"]["balance"])
         return balance
 
-    def block_ranges(self, start=0, stop=None, page=None):
+    def stream_blocks(
+        self, start: Optional[int] = None, reconnect_delay: float = 1.0
+    ) -> Iterator[BlockAPI]:
+        """
+        Yields new blocks as the node announces them on its ``/eth/v1/events`` stream,
+        starting from slot ``start`` (defaults to the current head). Reconnects with
+        backoff when the stream drops or the node fails with a 5xx error, and fills in
+        the slots missed meanwhile. Client (4xx) errors are raised. After a chain reorg,
+        the affected slots are fetched and yielded again.
+        """
+        next_slot = start
+        delay = reconnect_delay
+        self._subscribed = True
+        try:
+            while True:
+                try:
+                    events = self.beacon.iter_events(EVENT_TOPICS)
+                    for event, data in events:
+                        delay = reconnect_delay
+                        if event != "head":
+                            next_slot = self._handle_chain_event(event, data, next_slot)
+                            continue
+
+                        self._head_slot = int(data["slot"])
+                        if next_slot is None:
+                            next_slot = self._head_slot
+
+                        for block in self.get_blocks(next_slot, self._head_slot):
+                            yield block
+                            if block.number is not None:
+                                next_slot = block.number + 1
+
+                        next_slot = max(next_slot, self._head_slot + 1)
+
+                except requests.exceptions.HTTPError as err:
+                    status_code = _get_status_code(err)
+                    if status_code is None or status_code < 500:
+                        raise BeaconRequestError(status_code, str(err)) from err
+
+                except BeaconRequestError as err:
+                    # NOTE: A 5xx while filling in slots, resume from `next_slot` after backoff
+                    if err.status_code is None or err.status_code < 500:
+                        raise
+
+                except (
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout,
+                ):
+                    pass
+
+                # NOTE: Stream dropped or was closed, back off before reconnecting
+                time.sleep(delay)
+                delay = min(2 * delay, MAX_RECONNECT_DELAY)
+
+        finally:
+            self._subscribed = False
+
+    def _handle_chain_event(self, event: str, data: Dict, next_slot: Optional[int]):
+        if event == "finalized_checkpoint":
+            self._finalized_slot = int(data["epoch"]) * SLOTS_PER_EPOCH
+            self._finalized_slot_expires_at = time.monotonic() + self.block_cache.ttl
+            self.slot_index.finalize(self._finalized_slot)
+        elif event == "chain_reorg":
+            slot, depth = int(data["slot"]), int(data["depth"])
+            reorg = self.slot_index.reorg(slot, depth, new_head_root=data.get("new_head_block"))
+            if reorg is not None and next_slot is not None:
+                return min(next_slot, reorg.slot)
+
+        return next_slot
+
+    def _get_head_slot(self) -> int:
+        if self._subscribed and self._head_slot is not None:
+            return self._head_slot
+
+        return self.chain_manager.blocks.height
+
+    def get_validators(
+        self, validator_ids: Iterable[str], state_id: str = "head", concurrency: int = 8
+    ) -> Dict[str, Optional[ValidatorSummary]]:
+        """
+        Gets the balance and status of many validators by index or pubkey, using the
+        node's bulk endpoint in chunks of ``validator_chunk_size`` ids fetched in
+        parallel. Validators that are not found map to ``None``.
+        """
+        ids = [str(validator_id) for validator_id in validator_ids]
+        results: Dict[str, Optional[ValidatorSummary]] = {}
+        for chunk, data in self._map_validator_chunks(
+            self._get_validators_chunk, ids, state_id, concurrency
+        ):
+            found = {}
+            for item in data:
+                summary = ValidatorSummary.from_response(item)
+                found[str(summary.validator_index)] = summary
+                found[item["validator"]["pubkey"].lower()] = summary
+
+            for validator_id in chunk:
+                results[validator_id] = found.get(validator_id.lower())
+
+        return results
+
+    def get_balances(
+        self, validator_ids: Iterable[str], state_id: str = "head", concurrency: int = 8
+    ) -> Dict[str, Optional[int]]:
+        """
+        Gets the balances of many validators by index or pubkey. Validators that are
+        not found map to ``None``.
+        """
+        ids = [str(validator_id) for validator_id in validator_ids]
+        if not all(validator_id.isdigit() for validator_id in ids):
+            # NOTE: The balances endpoint only returns indices, so map pubkeys via validators
+            validators = self.get_validators(ids, state_id=state_id, concurrency=concurrency)
+            return {k: v.balance if v is not None else None for k, v in validators.items()}
+
+        results: Dict[str, Optional[int]] = {}
+        for chunk, data in self._map_validator_chunks(
+            self._get_balances_chunk, ids, state_id, concurrency
+        ):
+            found = {str(int(item["index"])): int(item["balance"]) for item in data}
+            for validator_id in chunk:
+                results[validator_id] = found.get(str(int(validator_id)))
+
+        return results
+
+    def _map_validator_chunks(self, get_chunk, ids: List[str], state_id: str, concurrency: int):
+        chunk_size = self.client_settings.validator_chunk_size
+        chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            yield from zip(chunks, executor.map(lambda c: get_chunk(c, state_id), chunks))
+
+    def _get_validators_chunk(self, validator_ids: List[str], state_id: str) -> List[Dict]:
+        try:
+            beacon = self.beacon
+            resp = beacon.get_validators_by_ids(validator_ids, state_id)
+        except requests.exceptions.HTTPError as err:
+            status_code = _get_status_code(err)
+            if status_code not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(status_code, str(err)) from err
+
+            # NOTE: One bad id fails the whole request, so fall back to one request per id
+            return self._get_each_validator(validator_ids, state_id)
+
+        return resp.get("data", [])
+
+    def _get_balances_chunk(self, validator_ids: List[str], state_id: str) -> List[Dict]:
+        try:
+            beacon = self.beacon
+            resp = beacon.get_validator_balances_by_ids(validator_ids, state_id)
+        except requests.exceptions.HTTPError as err:
+            status_code = _get_status_code(err)
+            if status_code not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(status_code, str(err)) from err
+
+            return self._get_each_validator(validator_ids, state_id)
+
+        return resp.get("data", [])
+
+    def _get_each_validator(self, validator_ids: List[str], state_id: str) -> List[Dict]:
+        data = []
+        for validator_id in validator_ids:
+            try:
+                resp = self.beacon.get_validator(validator_id, state_id)
+            except requests.exceptions.HTTPError as err:
+                status_code = _get_status_code(err)
+                if status_code not in NOT_FOUND_STATUS_CODES:
+                    raise BeaconRequestError(status_code, str(err)) from err
+
+                continue
+
+            if "data" in resp:
+                data.append(resp["data"])
+
+        return data
+
+    def block_ranges(self, start=0, stop=None, page=None, skip_stored=False):
         """
         Ranges over beacon chain slot number, which is effectively
-        the block number for the consensus layer.
+        the block number for the consensus layer. If ``skip_stored``, slot ranges
+        already complete in the block store are skipped.
         """
         if stop is None:
-            stop = self.chain_manager.blocks.height
+            stop = self._get_head_slot()
         if page is None:
             page = self.block_page_size
 
-        for start_block in range(start, stop + 1, page):
-            stop_block = min(stop, start_block + page - 1)
-            yield start_block, stop_block
+        ranges = [(start, stop)]
+        if skip_stored and self.block_store is not None:
+            ranges = list(self.block_store.missing_ranges(start, stop))
+
+        for range_start, range_stop in ranges:
+            for start_block in range(range_start, range_stop + 1, page):
+                stop_block = min(range_stop, start_block + page - 1)
+                yield start_block, stop_block
+
+
+class AsyncBeaconProvider(BeaconProvider, ABC):
+    """
+    A base provider mixin class that adds native ``asyncio`` counterparts of the
+    :class:`~ape_beacon.providers.BeaconProvider` read methods, served over a
+    non-blocking, pooled ``aiohttp`` client.
+    """
+
+    _async_beacon: Optional[AsyncBeaconClient] = None
+
+    @property
+    def async_beacon(self) -> AsyncBeaconClient:
+        """
+        Access to the async beacon client, created for the connected ``uri``.
+        """
+        if self._async_beacon is None:
+            self._async_beacon = AsyncBeaconClient(
+                self.beacon.base_url, settings=self.client_settings, headers=self.request_header
+            )
+
+        return self._async_beacon
+
+    def _close_beacon(self):
+        # NOTE: Pooled async connections must be released from the loop with `aclose()`
+        self._async_beacon = None
+        super()._close_beacon()
+
+    async def aclose(self):
+        """
+        Releases pooled connections held by the async beacon client. Call before
+        ``disconnect()`` from the event loop the client was used on.
+        """
+        if self._async_beacon is not None:
+            await self._async_beacon.close()
+
+    async def get_block_async(self, block_id: BlockID) -> BlockAPI:
+        """
+        As if you did ``await AsyncBeaconClient(uri).get_block(block_id)``.
+        """
+        beacon_block_id = _to_beacon_block_id(block_id)
+        cached_block = self._get_cached_block(beacon_block_id)
+        if cached_block is not None:
+            return cached_block
+
+        stored_block = self._get_stored_block(block_id, beacon_block_id)
+        if stored_block is not None:
+            return stored_block
+
+        try:
+            resp = await self.async_beacon.get_block(beacon_block_id)
+        except aiohttp.ClientResponseError as err:
+            if err.status not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(err.status, err.message) from err
+
+            raise BlockNotFoundError(block_id) from err
+
+        # NOTE: Hashing and block store writes are blocking, so run them off the loop
+        finalized_slot = await self._get_finalized_slot_async()
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._process_block_response,
+            block_id,
+            beacon_block_id,
+            resp,
+            finalized_slot,
+        )
+
+    async def _get_finalized_slot_async(self) -> int:
+        # NOTE: Mirrors ``finalized_slot``, refreshed through the async client
+        now = time.monotonic()
+        if self._finalized_slot_expires_at <= now:
+            try:
+                resp = await self.async_beacon.get_block_header("finalized")
+                self._finalized_slot = int(resp["data"]["header"]["message"]["slot"])
+            except (aiohttp.ClientResponseError, KeyError):
+                pass  # NOTE: Treat everything as non-finalized until known
+
+            self._finalized_slot_expires_at = now + self.block_cache.ttl
+
+        return self._finalized_slot
+
+    async def get_balance_async(self, address: str) -> int:
+        """
+        Gets the validator balance for validator address or ID on beacon chain.
+        """
+        try:
+            resp = await self.async_beacon.get_validator(address)
+        except aiohttp.ClientResponseError as err:
+            if err.status not in NOT_FOUND_STATUS_CODES:
+                raise BeaconRequestError(err.status, err.message) from err
+
+            raise ValidatorNotFoundError(address) from err
+
+        return self._decode_balance_response(address, resp)
+
+    async def get_blocks_async(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> AsyncIterator[BlockAPI]:
+        """
+        Fetches the blocks for slots ``start`` through ``stop`` (inclusive)
+        concurrently, yielding them in slot order. Missed (empty) slots are skipped.
+        Concurrency is bounded by the ``max_concurrency`` provider setting.
+        """
+        if stop is None:
+            stop = self._get_head_slot()
+
+        slots = iter(range(start, stop + 1))
+        window = 2 * self.async_beacon.settings.max_concurrency
+        pending: Deque[asyncio.Task] = deque(
+            asyncio.ensure_future(self._get_block_or_none_async(slot))
+            for slot in islice(slots, window)
+        )
+        try:
+            while pending:
+                block = await pending.popleft()
+                next_slot = next(slots, None)
+                if next_slot is not None:
+                    pending.append(asyncio.ensure_future(self._get_block_or_none_async(next_slot)))
+
+                if block is not None:
+                    yield block
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_block_or_none_async(self, slot: int) -> Optional[BlockAPI]:
+        try:
+            return await self.get_block_async(slot)
+        except BlockNotFoundError:
+            return None
+
+
+def _to_beacon_block_id(block_id: BlockID) -> str:
+    beacon_block_id = convert_block_id(block_id)
+    if isinstance(beacon_block_id, HexBytes):
+        beacon_block_id = HexStr(beacon_block_id.hex())
+
+    return str(beacon_block_id)
+
+
+def _to_block_cache_key(beacon_block_id: str) -> Optional[BlockCacheKey]:
+    if beacon_block_id.isdigit():
+        return int(beacon_block_id)
+    elif beacon_block_id.startswith("0x") and len(beacon_block_id) == 66:
+        return beacon_block_id.lower()
+
+    # NOTE: Literals such as "head" are never cached under their own name
+    return None
+
+
+def _compute_block_root(block_data: Dict) -> Optional[HexBytes]:
+    try:
+        return HexBytes(compute_block_root(block_data))
+    except (KeyError, ValueError):
+        return None  # NOTE: e.g. a fork not known here
+
+
+def _get_status_code(err: requests.exceptions.HTTPError) -> Optional[int]:
+    return err.response.status_code if err.response is not None else None
@@ -0,0 +1,131 @@
+import math
+from functools import partial
+from typing import Iterator, Optional
+
+from ape.api.providers import BlockAPI
+from ape.api.query import BlockQuery, QueryAPI, QueryType
+from ape.exceptions import BlockNotFoundError, ProviderNotConnectedError, QueryEngineError
+from ape.utils import singledispatchmethod
+from pydantic import BaseModel
+
+from ape_beacon.client import BeaconClient
+from ape_beacon.providers import BeaconProvider
+from ape_beacon.summaries import BlockSummary
+
+HEADER_COLUMNS = frozenset(("number", "hash", "parent_hash", "proposer_index"))
+"""
+The :class:`~ape_beacon.ecosystem.BeaconBlock` columns served by the ``headers``
+endpoint, without downloading block bodies.
+"""
+
+# NOTE: Rough per-block costs in milliseconds
+CACHE_TIME = 0.01
+STORE_TIME = 0.5
+DECODE_TIME = 0.5
+DEFAULT_LATENCY = 0.1  # NOTE: In seconds, until the client has observed a request
+
+
+class BlockQuerySettings(BaseModel):
+    """
+    Settings for :class:`~ape_beacon.query.BeaconQueryEngine`, read from the provider settings.
+    """
+
+    query_concurrency: int = 8  # worker threads fetching blocks not cached or stored
+
+
+class BeaconQueryEngine(QueryAPI):
+    """
+    Serves block range queries against a :class:`~ape_beacon.providers.BeaconProvider`
+    in bulk: blocks come from the block cache, then the block store, and the rest are
+    fetched concurrently. Queries for only :data:`~ape_beacon.query.HEADER_COLUMNS`
+    use the ``headers`` endpoint instead of downloading full blocks. Missed (empty)
+    slots are skipped.
+    """
+
+    @property
+    def beacon_provider(self) -> Optional[BeaconProvider]:
+        """
+        The connected provider, if it is a beacon provider.
+        """
+        try:
+            provider = self.provider
+        except ProviderNotConnectedError:
+            return None
+
+        return provider if isinstance(provider, BeaconProvider) else None
+
+    @singledispatchmethod
+    def estimate_query(self, query: QueryType) -> Optional[int]:  # type: ignore
+        return None  # can't handle this query
+
+    @estimate_query.register
+    def estimate_block_query(self, query: BlockQuery) -> Optional[int]:
+        provider = self.beacon_provider
+        if provider is None:
+            return None
+
+        start, stop, step = query.start_block, query.stop_block, query.step
+        num_slots = len(range(start, stop + 1, step))
+        cached = min(provider.block_cache.count(start, stop, step=step), num_slots)
+        stored = 0
+        if provider.block_store is not None:
+            # NOTE: Stored slots are only counted per range, so assume they are spread evenly
+            stored = min(provider.block_store.count(start, stop) // step, num_slots - cached)
+
+        remote = num_slots - cached - stored
+        latency = _get_latency(provider)
+        concurrency = BlockQuerySettings.parse_obj(provider.provider_settings).query_concurrency
+        estimate = cached * CACHE_TIME + stored * STORE_TIME
+        estimate += math.ceil(remote / concurrency) * latency * 1000
+        if not _is_header_query(query):
+            estimate += remote * DECODE_TIME
+
+        return math.ceil(estimate)
+
+    @singledispatchmethod
+    def perform_query(self, query: QueryType) -> Iterator:  # type: ignore
+        raise QueryEngineError(f"Cannot handle '{type(query)}'.")
+
+    @perform_query.register
+    def perform_block_query(self, query: BlockQuery) -> Iterator[BlockAPI]:
+        provider = self.beacon_provider
+        if provider is None:
+            raise QueryEngineError("Not connected to a beacon provider.")
+
+        concurrency = BlockQuerySettings.parse_obj(provider.provider_settings).query_concurrency
+        if _is_header_query(query):
+            slots = range(query.start_block, query.stop_block + 1, query.step)
+            fetch = partial(_get_header_block_or_none, provider)
+            return provider._map_slots(fetch, slots, concurrency)
+
+        return provider.get_blocks(
+            query.start_block, query.stop_block, concurrency=concurrency, step=query.step
+        )
+
+
+def _get_header_block_or_none(provider: BeaconProvider, slot: int) -> Optional[BlockAPI]:
+    beacon_block_id = str(slot)
+    block = provider._get_cached_block(beacon_block_id)
+    if block is not None:
+        return block
+
+    try:
+        block = provider._get_stored_block(slot, beacon_block_id)
+    except BlockNotFoundError:
+        return None  # NOTE: Stored as a missed slot
+
+    if block is not None:
+        return block
+
+    header = provider._get_block_header_or_none(slot)
+    return BlockSummary.from_header(header).to_block() if header is not None else None
+
+
+def _is_header_query(query: BlockQuery) -> bool:
+    return set(query.columns) <= HEADER_COLUMNS
+
+
+def _get_latency(provider: BeaconProvider) -> float:
+    beacon = provider._beacon
+    latency = beacon.latency if isinstance(beacon, BeaconClient) else None
+    return latency if latency is not None else DEFAULT_LATENCY
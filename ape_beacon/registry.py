@@ -0,0 +1,169 @@
+from array import array
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+from hexbytes import HexBytes
+
+from ape_beacon.containers import ValidatorSummary
+
+VALIDATOR_STATUSES = (
+    "pending_initialized",
+    "pending_queued",
+    "active_ongoing",
+    "active_exiting",
+    "active_slashed",
+    "exited_unslashed",
+    "exited_slashed",
+    "withdrawal_possible",
+    "withdrawal_done",
+)
+"""
+Validator statuses in the order of their ``status`` column codes.
+"""
+
+PUBKEY_DTYPE = np.dtype("S48")
+
+
+class ValidatorRegistry:
+    """
+    A columnar snapshot of the validators of a beacon state.
+
+    Each field is a NumPy array with one row per validator, so the validator set can
+    be filtered, aggregated and diffed with vectorized operations. Statuses are stored
+    as ``uint8`` codes into :data:`~ape_beacon.registry.VALIDATOR_STATUSES` and pubkeys
+    as fixed-width 48 byte strings.
+    """
+
+    def __init__(
+        self,
+        state_id: str,
+        index: np.ndarray,
+        pubkey: np.ndarray,
+        balance: np.ndarray,
+        effective_balance: np.ndarray,
+        activation_epoch: np.ndarray,
+        exit_epoch: np.ndarray,
+        slashed: np.ndarray,
+        status: np.ndarray,
+    ):
+        self.state_id = state_id
+        self.index = index
+        self.pubkey = pubkey
+        self.balance = balance
+        self.effective_balance = effective_balance
+        self.activation_epoch = activation_epoch
+        self.exit_epoch = exit_epoch
+        self.slashed = slashed
+        self.status = status
+
+        # NOTE: Sorted views for vectorized index and pubkey lookups
+        self._index_order = np.argsort(index, kind="stable")
+        self._pubkey_order = np.argsort(pubkey, kind="stable")
+
+    @classmethod
+    def from_response(cls, items: Iterable[Dict], state_id: str = "head") -> "ValidatorRegistry":
+        """
+        Builds a registry from beacon API validator items, consuming them one at a
+        time into compact column buffers.
+        """
+        status_codes = {status: code for code, status in enumerate(VALIDATOR_STATUSES)}
+        index, balance, effective_balance = array("Q"), array("Q"), array("Q")
+        activation_epoch, exit_epoch = array("Q"), array("Q")
+        slashed, status = array("B"), array("B")
+        pubkeys = bytearray()
+        for item in items:
+            validator = item["validator"]
+            index.append(int(item["index"]))
+            balance.append(int(item["balance"]))
+            effective_balance.append(int(validator["effective_balance"]))
+            activation_epoch.append(int(validator["activation_epoch"]))
+            exit_epoch.append(int(validator["exit_epoch"]))
+            slashed.append(bool(validator["slashed"]))
+            status.append(status_codes[item["status"]])
+            pubkeys += bytes(HexBytes(validator["pubkey"]))
+
+        return cls(
+            state_id=state_id,
+            index=np.frombuffer(index, dtype=np.uint64),
+            pubkey=np.frombuffer(bytes(pubkeys), dtype=PUBKEY_DTYPE),
+            balance=np.frombuffer(balance, dtype=np.uint64),
+            effective_balance=np.frombuffer(effective_balance, dtype=np.uint64),
+            activation_epoch=np.frombuffer(activation_epoch, dtype=np.uint64),
+            exit_epoch=np.frombuffer(exit_epoch, dtype=np.uint64),
+            slashed=np.frombuffer(slashed, dtype=np.uint8).astype(bool),
+            status=np.frombuffer(status, dtype=np.uint8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def position(self, validator_id: str) -> Optional[int]:
+        """
+        Returns the row of validator index or pubkey ``validator_id``, if present.
+        """
+        key: Union[np.uint64, bytes]
+        if validator_id.isdigit():
+            keys, order, key = self.index, self._index_order, np.uint64(int(validator_id))
+        else:
+            pubkey = bytes(HexBytes(validator_id))
+            if len(pubkey) != PUBKEY_DTYPE.itemsize:
+                return None
+
+            keys, order, key = self.pubkey, self._pubkey_order, pubkey
+
+        found = np.searchsorted(keys, key, sorter=order)
+        if found < len(order):
+            row = int(order[found])
+            # NOTE: Compare raw bytes as NumPy strips trailing null bytes from `S48` items
+            if keys[row : row + 1].tobytes() == np.array(key, dtype=keys.dtype).tobytes():
+                return row
+
+        return None
+
+    def get(self, validator_id: str) -> Optional[ValidatorSummary]:
+        """
+        Returns the balance and status of validator index or pubkey ``validator_id``.
+        """
+        row = self.position(validator_id)
+        if row is None:
+            return None
+
+        return ValidatorSummary(
+            validator_index=int(self.index[row]),
+            pubkey=HexBytes(self.pubkey[row : row + 1].tobytes()),
+            balance=int(self.balance[row]),
+            effective_balance=int(self.effective_balance[row]),
+            status=VALIDATOR_STATUSES[self.status[row]],
+        )
+
+    def with_status(self, *statuses: str) -> np.ndarray:
+        """
+        Returns a boolean row mask of validators with any of ``statuses``.
+        """
+        codes = [VALIDATOR_STATUSES.index(status) for status in statuses]
+        return np.isin(self.status, codes)
+
+    def select(self, mask: np.ndarray) -> "ValidatorRegistry":
+        """
+        Returns a registry of the rows selected by boolean ``mask``.
+        """
+        return ValidatorRegistry(
+            state_id=self.state_id,
+            index=self.index[mask],
+            pubkey=self.pubkey[mask],
+            balance=self.balance[mask],
+            effective_balance=self.effective_balance[mask],
+            activation_epoch=self.activation_epoch[mask],
+            exit_epoch=self.exit_epoch[mask],
+            slashed=self.slashed[mask],
+            status=self.status[mask],
+        )
+
+    def diff_balances(self, other: "ValidatorRegistry") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the validator indices present in both registries and their balance
+        change from ``self`` to ``other``.
+        """
+        index, rows, other_rows = np.intersect1d(self.index, other.index, return_indices=True)
+        delta = other.balance[other_rows].astype(np.int64) - self.balance[rows].astype(np.int64)
+        return index, delta
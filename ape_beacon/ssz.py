@@ -0,0 +1,644 @@
+"""
+Minimal `SSZ <https://github.com/ethereum/consensus-specs/blob/dev/ssz/simple-serialize.md>`__
+(de)serializer and ``hash_tree_root`` for beacon blocks.
+
+Decodes into the same shape as the beacon API JSON responses (quantities as decimal
+strings, byte strings and bitfields as ``0x``-prefixed hex) so SSZ responses go through
+the same :meth:`~ape_beacon.ecosystem.Beacon.decode_block` path as JSON ones. Roots are
+computed from that same shape, so they work for JSON and SSZ responses alike.
+"""
+
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from hexbytes import HexBytes
+
+from ape_beacon.exceptions import SSZDecodingError
+from ape_beacon.types import SYNC_COMMITTEE_SIZE
+
+OFFSET_SIZE = 4
+BYTES_PER_CHUNK = 32
+
+ZERO_HASHES = [bytes(BYTES_PER_CHUNK)]
+for _ in range(64):
+    ZERO_HASHES.append(sha256(ZERO_HASHES[-1] + ZERO_HASHES[-1]).digest())
+"""
+Roots of all-zero subtrees by depth, used to pad trees up to their limit.
+"""
+
+
+class SSZType(ABC):
+    fixed_size: Optional[int] = None  # NOTE: `None` for variable-size types
+    is_basic = False
+
+    @abstractmethod
+    def decode(self, data: memoryview) -> Any:
+        ...
+
+    @abstractmethod
+    def serialize(self, value: Any) -> bytes:
+        ...
+
+    @abstractmethod
+    def hash_tree_root(self, value: Any) -> bytes:
+        ...
+
+
+class Uint(SSZType):
+    is_basic = True
+
+    def __init__(self, num_bytes: int):
+        self.fixed_size = num_bytes
+
+    def decode(self, data: memoryview) -> str:
+        return str(int.from_bytes(data, "little"))
+
+    def serialize(self, value: Any) -> bytes:
+        return int(value).to_bytes(self.fixed_size or 0, "little")
+
+    def hash_tree_root(self, value: Any) -> bytes:
+        return self.serialize(value).ljust(BYTES_PER_CHUNK, b"\x00")
+
+
+class ByteVector(SSZType):
+    """
+    Fixed-size bytes; also used for ``Bitvector`` which the beacon API renders as hex.
+    """
+
+    def __init__(self, length: int):
+        self.fixed_size = length
+
+    def decode(self, data: memoryview) -> str:
+        return "0x" + data.hex()
+
+    def serialize(self, value: Any) -> bytes:
+        data = bytes(HexBytes(value))
+        if len(data) != self.fixed_size:
+            raise ValueError(f"Expected {self.fixed_size} bytes, got {len(data)}.")
+
+        return data
+
+    def hash_tree_root(self, value: Any) -> bytes:
+        return merkleize(_pack(self.serialize(value)))
+
+
+class ByteList(SSZType):
+    """
+    Variable-size bytes of at most ``limit`` bytes.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+
+    def decode(self, data: memoryview) -> str:
+        return "0x" + data.hex()
+
+    def serialize(self, value: Any) -> bytes:
+        return bytes(HexBytes(value))
+
+    def hash_tree_root(self, value: Any) -> bytes:
+        data = bytes(HexBytes(value))
+        root = merkleize(_pack(data), limit=_chunk_count(self.limit))
+        return mix_in_length(root, len(data))
+
+
+class Bitlist(ByteList):
+    """
+    A bitlist of at most ``limit`` bits, which the beacon API renders as hex
+    including the length delimiter bit.
+    """
+
+    def hash_tree_root(self, value: Any) -> bytes:
+        data = bytearray(HexBytes(value))
+        if not data or data[-1] == 0:
+            raise ValueError("Bitlist is missing its length delimiter bit.")
+
+        # NOTE: The highest set bit marks the length and is not part of the value
+        length = 8 * (len(data) - 1) + data[-1].bit_length() - 1
+        data[-1] &= ~(1 << (length % 8)) & 0xFF
+        if length % 8 == 0:
+            data.pop()
+
+        root = merkleize(_pack(bytes(data)), limit=(self.limit + 255) // 256)
+        return mix_in_length(root, length)
+
+
+class Vector(SSZType):
+    def __init__(self, element: SSZType, length: int):
+        if element.fixed_size is None:
+            raise ValueError("Vector of variable-size elements is not supported.")
+
+        self.element = element
+        self.length = length
+        self.fixed_size = element.fixed_size * length
+
+    def decode(self, data: memoryview) -> List[Any]:
+        size = self.element.fixed_size or 0
+        return [self.element.decode(data[i * size : (i + 1) * size]) for i in range(self.length)]
+
+    def serialize(self, value: Sequence[Any]) -> bytes:
+        if len(value) != self.length:
+            raise ValueError(f"Vector must have {self.length} elements.")
+
+        return b"".join(self.element.serialize(item) for item in value)
+
+    def hash_tree_root(self, value: Sequence[Any]) -> bytes:
+        if len(value) != self.length:
+            raise ValueError(f"Vector must have {self.length} elements.")
+
+        return merkleize(_element_chunks(self.element, value))
+
+
+class SSZList(SSZType):
+    def __init__(self, element: SSZType, limit: int):
+        self.element = element
+        self.limit = limit
+
+    def decode(self, data: memoryview) -> List[Any]:
+        size = self.element.fixed_size
+        if size is not None:
+            if len(data) % size:
+                raise SSZDecodingError("List length is not a multiple of its element size.")
+
+            return [self.element.decode(data[i : i + size]) for i in range(0, len(data), size)]
+
+        if not data:
+            return []
+
+        first_offset = _read_offset(data, 0)
+        offsets = [_read_offset(data, i) for i in range(0, first_offset, OFFSET_SIZE)]
+        return [self.element.decode(part) for part in _split(data, offsets)]
+
+    def serialize(self, value: Sequence[Any]) -> bytes:
+        if len(value) > self.limit:
+            raise ValueError(f"List has more than {self.limit} elements.")
+
+        return _serialize_parts([(self.element, item) for item in value])
+
+    def hash_tree_root(self, value: Sequence[Any]) -> bytes:
+        if len(value) > self.limit:
+            raise ValueError(f"List has more than {self.limit} elements.")
+
+        if self.element.is_basic:
+            limit = _chunk_count(self.limit * (self.element.fixed_size or 0))
+        else:
+            limit = self.limit
+
+        root = merkleize(_element_chunks(self.element, value), limit=limit)
+        return mix_in_length(root, len(value))
+
+
+class Container(SSZType):
+    def __init__(self, *fields: Tuple[str, SSZType]):
+        self.fields = fields
+        if all(field_type.fixed_size is not None for _, field_type in fields):
+            self.fixed_size = sum(field_type.fixed_size or 0 for _, field_type in fields)
+
+    def extend(self, *fields: Tuple[str, SSZType]) -> "Container":
+        return Container(*self.fields, *fields)
+
+    def decode(self, data: memoryview) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        variable_fields: List[Tuple[str, SSZType]] = []
+        offsets: List[int] = []
+        position = 0
+        for name, field_type in self.fields:
+            if field_type.fixed_size is not None:
+                end = position + field_type.fixed_size
+                if end > len(data):
+                    raise SSZDecodingError(f"Not enough data to decode field '{name}'.")
+
+                values[name] = field_type.decode(data[position:end])
+                position = end
+            else:
+                variable_fields.append((name, field_type))
+                offsets.append(_read_offset(data, position))
+                position += OFFSET_SIZE
+
+        if offsets and offsets[0] != position:
+            raise SSZDecodingError("First variable-size offset does not follow the fixed part.")
+
+        for (name, field_type), part in zip(variable_fields, _split(data, offsets)):
+            values[name] = field_type.decode(part)
+
+        # NOTE: Keep schema field order to match the beacon API JSON
+        return {name: values[name] for name, _ in self.fields}
+
+    def serialize(self, value: Dict[str, Any]) -> bytes:
+        return _serialize_parts([(field_type, value[name]) for name, field_type in self.fields])
+
+    def field_roots(self, value: Dict[str, Any]) -> bytes:
+        """
+        Returns the concatenated roots of the fields of ``value``, the leaves of its tree.
+        """
+        return b"".join(field_type.hash_tree_root(value[name]) for name, field_type in self.fields)
+
+    def hash_tree_root(self, value: Dict[str, Any]) -> bytes:
+        return merkleize(self.field_roots(value))
+
+    def field_index(self, name: str) -> int:
+        for index, (field_name, _) in enumerate(self.fields):
+            if field_name == name:
+                return index
+
+        raise KeyError(name)
+
+    def merkle_proof(
+        self, value: Dict[str, Any], path: Sequence[str]
+    ) -> Tuple[bytes, List[bytes], int]:
+        """
+        Returns the ``(leaf, branch, index)`` proving the root of the field at
+        ``path`` (field names of nested containers) against the root of ``value``,
+        for :func:`~ape_beacon.ssz.is_valid_merkle_branch` with
+        ``depth=len(branch)``.
+        """
+        name, *rest = path
+        field_type = self[name]
+        position = self.field_index(name)
+        branch = merkle_branch(self.field_roots(value), position)
+        if not rest:
+            return field_type.hash_tree_root(value[name]), branch, position
+
+        if not isinstance(field_type, Container):
+            raise ValueError(f"Field '{name}' is not a container.")
+
+        leaf, inner_branch, inner_index = field_type.merkle_proof(value[name], rest)
+        index = (position << len(inner_branch)) + inner_index
+        return leaf, inner_branch + branch, index
+
+    def __getitem__(self, name: str) -> SSZType:
+        return self.fields[self.field_index(name)][1]
+
+
+def merkleize(chunks: bytes, limit: Optional[int] = None) -> bytes:
+    """
+    Returns the root of the tree over 32 byte ``chunks``, padded with zero chunks up
+    to ``limit`` (defaults to the number of chunks). Each level is hashed in one
+    pass over a single buffer, and padding beyond the data uses precomputed
+    :data:`~ape_beacon.ssz.ZERO_HASHES`, so large limits cost nothing extra.
+    """
+    count = len(chunks) // BYTES_PER_CHUNK
+    limit = count if limit is None else limit
+    if count > limit:
+        raise ValueError("More chunks than the limit.")
+
+    if count == 0:
+        return ZERO_HASHES[_depth(limit)]
+
+    level = chunks
+    for depth in range(_depth(limit)):
+        if len(level) == BYTES_PER_CHUNK:
+            # NOTE: Fast path up the sparse right side of deep trees, e.g. byte lists
+            level = sha256(level + ZERO_HASHES[depth]).digest()
+            continue
+        elif (len(level) // BYTES_PER_CHUNK) % 2:
+            level += ZERO_HASHES[depth]
+
+        view = memoryview(level)
+        level = b"".join(sha256(view[i : i + 64]).digest() for i in range(0, len(level), 64))
+
+    return level[:BYTES_PER_CHUNK]
+
+
+def merkle_branch(chunks: bytes, index: int, limit: Optional[int] = None) -> List[bytes]:
+    """
+    Returns the sibling hashes from chunk ``index`` up to the root of
+    :func:`~ape_beacon.ssz.merkleize` over ``chunks``, bottom first.
+    """
+    count = len(chunks) // BYTES_PER_CHUNK
+    limit = count if limit is None else limit
+    if not 0 <= index < max(limit, 1):
+        raise IndexError(index)
+
+    branch = []
+    level = chunks
+    for depth in range(_depth(limit)):
+        if (len(level) // BYTES_PER_CHUNK) % 2:
+            level += ZERO_HASHES[depth]
+
+        sibling = (index ^ 1) * BYTES_PER_CHUNK
+        if sibling < len(level):
+            branch.append(level[sibling : sibling + BYTES_PER_CHUNK])
+        else:
+            branch.append(ZERO_HASHES[depth])
+
+        view = memoryview(level)
+        level = b"".join(sha256(view[i : i + 64]).digest() for i in range(0, len(level), 64))
+        index //= 2
+
+    return branch
+
+
+def is_valid_merkle_branch(
+    leaf: bytes, branch: Sequence[bytes], depth: int, index: int, root: bytes
+) -> bool:
+    """
+    The spec's ``is_valid_merkle_branch``: checks that ``leaf`` is at ``index`` of
+    the tree of ``depth`` with ``root``.
+    """
+    if len(branch) < depth:
+        return False
+
+    value = bytes(leaf)
+    for height in range(depth):
+        if (index >> height) & 1:
+            value = sha256(bytes(branch[height]) + value).digest()
+        else:
+            value = sha256(value + bytes(branch[height])).digest()
+
+    return value == bytes(root)
+
+
+def mix_in_length(root: bytes, length: int) -> bytes:
+    return sha256(root + length.to_bytes(BYTES_PER_CHUNK, "little")).digest()
+
+
+def _depth(limit: int) -> int:
+    return max(limit - 1, 0).bit_length()
+
+
+def _chunk_count(num_bytes: int) -> int:
+    return (num_bytes + BYTES_PER_CHUNK - 1) // BYTES_PER_CHUNK
+
+
+def _pack(data: bytes) -> bytes:
+    return data + bytes(-len(data) % BYTES_PER_CHUNK)
+
+
+def _element_chunks(element: SSZType, values: Sequence[Any]) -> bytes:
+    if isinstance(element, Uint):
+        return _pack(b"".join(element.serialize(value) for value in values))
+
+    return b"".join(element.hash_tree_root(value) for value in values)
+
+
+def _serialize_parts(parts: Sequence[Tuple[SSZType, Any]]) -> bytes:
+    # NOTE: Fixed-size parts are inlined, variable-size ones follow as offsets
+    fixed: List[Optional[bytes]] = []
+    variable: List[bytes] = []
+    for part_type, value in parts:
+        data = part_type.serialize(value)
+        if part_type.fixed_size is None:
+            fixed.append(None)
+            variable.append(data)
+        else:
+            fixed.append(data)
+
+    offset = sum(OFFSET_SIZE if part is None else len(part) for part in fixed)
+    sizes = iter(len(part) for part in variable)
+    head = []
+    for part in fixed:
+        if part is None:
+            head.append(offset.to_bytes(OFFSET_SIZE, "little"))
+            offset += next(sizes)
+        else:
+            head.append(part)
+
+    return b"".join(head + variable)
+
+
+def _read_offset(data: memoryview, position: int) -> int:
+    if position + OFFSET_SIZE > len(data):
+        raise SSZDecodingError("Not enough data to read offset.")
+
+    return int.from_bytes(data[position : position + OFFSET_SIZE], "little")
+
+
+def _split(data: memoryview, offsets: Sequence[int]) -> List[memoryview]:
+    ends = list(offsets[1:]) + [len(data)]
+    parts = []
+    for start, end in zip(offsets, ends):
+        if start > end or end > len(data):
+            raise SSZDecodingError("Invalid variable-size offsets.")
+
+        parts.append(data[start:end])
+
+    return parts
+
+
+# SEE: https://github.com/ethereum/consensus-specs/tree/dev/specs for the fork schemas
+# NOTE: List limits are those of the mainnet preset
+
+MAX_VALIDATORS_PER_COMMITTEE = 2048
+MAX_PROPOSER_SLASHINGS = 16
+MAX_ATTESTER_SLASHINGS = 2
+MAX_ATTESTATIONS = 128
+MAX_DEPOSITS = 16
+MAX_VOLUNTARY_EXITS = 16
+MAX_BLS_TO_EXECUTION_CHANGES = 16
+MAX_BLOB_COMMITMENTS_PER_BLOCK = 4096
+MAX_EXTRA_DATA_BYTES = 32
+MAX_BYTES_PER_TRANSACTION = 2**30
+MAX_TRANSACTIONS_PER_PAYLOAD = 2**20
+MAX_WITHDRAWALS_PER_PAYLOAD = 16
+
+uint64 = Uint(8)
+uint256 = Uint(32)
+Bytes20 = ByteVector(20)
+Bytes32 = ByteVector(32)
+Bytes48 = ByteVector(48)
+Bytes96 = ByteVector(96)
+
+Checkpoint = Container(("epoch", uint64), ("root", Bytes32))
+AttestationData = Container(
+    ("slot", uint64),
+    ("index", uint64),
+    ("beacon_block_root", Bytes32),
+    ("source", Checkpoint),
+    ("target", Checkpoint),
+)
+Attestation = Container(
+    ("aggregation_bits", Bitlist(MAX_VALIDATORS_PER_COMMITTEE)),
+    ("data", AttestationData),
+    ("signature", Bytes96),
+)
+IndexedAttestation = Container(
+    ("attesting_indices", SSZList(uint64, MAX_VALIDATORS_PER_COMMITTEE)),
+    ("data", AttestationData),
+    ("signature", Bytes96),
+)
+BeaconBlockHeader = Container(
+    ("slot", uint64),
+    ("proposer_index", uint64),
+    ("parent_root", Bytes32),
+    ("state_root", Bytes32),
+    ("body_root", Bytes32),
+)
+SignedBeaconBlockHeader = Container(("message", BeaconBlockHeader), ("signature", Bytes96))
+SyncCommittee = Container(
+    ("pubkeys", Vector(Bytes48, SYNC_COMMITTEE_SIZE)), ("aggregate_pubkey", Bytes48)
+)
+ForkData = Container(("current_version", ByteVector(4)), ("genesis_validators_root", Bytes32))
+SigningData = Container(("object_root", Bytes32), ("domain", Bytes32))
+ProposerSlashing = Container(
+    ("signed_header_1", SignedBeaconBlockHeader), ("signed_header_2", SignedBeaconBlockHeader)
+)
+AttesterSlashing = Container(
+    ("attestation_1", IndexedAttestation), ("attestation_2", IndexedAttestation)
+)
+DepositData = Container(
+    ("pubkey", Bytes48),
+    ("withdrawal_credentials", Bytes32),
+    ("amount", uint64),
+    ("signature", Bytes96),
+)
+Deposit = Container(("proof", Vector(Bytes32, 33)), ("data", DepositData))
+VoluntaryExit = Container(("epoch", uint64), ("validator_index", uint64))
+SignedVoluntaryExit = Container(("message", VoluntaryExit), ("signature", Bytes96))
+Eth1Data = Container(("deposit_root", Bytes32), ("deposit_count", uint64), ("block_hash", Bytes32))
+SyncAggregate = Container(
+    ("sync_committee_bits", ByteVector(64)),  # Bitvector[SYNC_COMMITTEE_SIZE]
+    ("sync_committee_signature", Bytes96),
+)
+Withdrawal = Container(
+    ("index", uint64), ("validator_index", uint64), ("address", Bytes20), ("amount", uint64)
+)
+BLSToExecutionChange = Container(
+    ("validator_index", uint64), ("from_bls_pubkey", Bytes48), ("to_execution_address", Bytes20)
+)
+SignedBLSToExecutionChange = Container(("message", BLSToExecutionChange), ("signature", Bytes96))
+
+BellatrixExecutionPayload = Container(
+    ("parent_hash", Bytes32),
+    ("fee_recipient", Bytes20),
+    ("state_root", Bytes32),
+    ("receipts_root", Bytes32),
+    ("logs_bloom", ByteVector(256)),
+    ("prev_randao", Bytes32),
+    ("block_number", uint64),
+    ("gas_limit", uint64),
+    ("gas_used", uint64),
+    ("timestamp", uint64),
+    ("extra_data", ByteList(MAX_EXTRA_DATA_BYTES)),
+    ("base_fee_per_gas", uint256),
+    ("block_hash", Bytes32),
+    (
+        "transactions",
+        SSZList(ByteList(MAX_BYTES_PER_TRANSACTION), MAX_TRANSACTIONS_PER_PAYLOAD),
+    ),
+)
+CapellaExecutionPayload = BellatrixExecutionPayload.extend(
+    ("withdrawals", SSZList(Withdrawal, MAX_WITHDRAWALS_PER_PAYLOAD))
+)
+DenebExecutionPayload = CapellaExecutionPayload.extend(
+    ("blob_gas_used", uint64), ("excess_blob_gas", uint64)
+)
+
+Phase0BeaconBlockBody = Container(
+    ("randao_reveal", Bytes96),
+    ("eth1_data", Eth1Data),
+    ("graffiti", Bytes32),
+    ("proposer_slashings", SSZList(ProposerSlashing, MAX_PROPOSER_SLASHINGS)),
+    ("attester_slashings", SSZList(AttesterSlashing, MAX_ATTESTER_SLASHINGS)),
+    ("attestations", SSZList(Attestation, MAX_ATTESTATIONS)),
+    ("deposits", SSZList(Deposit, MAX_DEPOSITS)),
+    ("voluntary_exits", SSZList(SignedVoluntaryExit, MAX_VOLUNTARY_EXITS)),
+)
+AltairBeaconBlockBody = Phase0BeaconBlockBody.extend(("sync_aggregate", SyncAggregate))
+BellatrixBeaconBlockBody = AltairBeaconBlockBody.extend(
+    ("execution_payload", BellatrixExecutionPayload)
+)
+CapellaBeaconBlockBody = AltairBeaconBlockBody.extend(
+    ("execution_payload", CapellaExecutionPayload),
+    ("bls_to_execution_changes", SSZList(SignedBLSToExecutionChange, MAX_BLS_TO_EXECUTION_CHANGES)),
+)
+DenebBeaconBlockBody = AltairBeaconBlockBody.extend(
+    ("execution_payload", DenebExecutionPayload),
+    ("bls_to_execution_changes", SSZList(SignedBLSToExecutionChange, MAX_BLS_TO_EXECUTION_CHANGES)),
+    ("blob_kzg_commitments", SSZList(Bytes48, MAX_BLOB_COMMITMENTS_PER_BLOCK)),
+)
+
+
+def _signed_beacon_block(body: SSZType) -> Container:
+    block = Container(
+        ("slot", uint64),
+        ("proposer_index", uint64),
+        ("parent_root", Bytes32),
+        ("state_root", Bytes32),
+        ("body", body),
+    )
+    return Container(("message", block), ("signature", Bytes96))
+
+
+SIGNED_BEACON_BLOCKS = {
+    "phase0": _signed_beacon_block(Phase0BeaconBlockBody),
+    "altair": _signed_beacon_block(AltairBeaconBlockBody),
+    "bellatrix": _signed_beacon_block(BellatrixBeaconBlockBody),
+    "capella": _signed_beacon_block(CapellaBeaconBlockBody),
+    "deneb": _signed_beacon_block(DenebBeaconBlockBody),
+}
+
+
+def decode_signed_beacon_block(data: bytes, version: str) -> Dict[str, Any]:
+    """
+    Decodes an SSZ ``SignedBeaconBlock`` for fork ``version`` into the beacon API
+    ``GET /eth/v2/beacon/blocks/{block_id}`` JSON response shape.
+    """
+    schema = SIGNED_BEACON_BLOCKS.get(version.lower())
+    if schema is None:
+        raise SSZDecodingError(f"Unsupported fork version '{version}'.")
+
+    return {"version": version.lower(), "data": schema.decode(memoryview(data))}
+
+
+BEACON_BLOCKS = {
+    version: cast(Container, schema["message"]) for version, schema in SIGNED_BEACON_BLOCKS.items()
+}
+
+
+def detect_version(body: Dict[str, Any]) -> str:
+    """
+    Infers the fork version of beacon API block ``body`` data from the fields present.
+    Raises ``ValueError`` for fields of forks not known here, whose roots would be wrong.
+    """
+    _check_fields(body, DenebBeaconBlockBody, "block body")
+    payload = body.get("execution_payload")
+    if payload is not None:
+        _check_fields(payload, DenebExecutionPayload, "execution payload")
+        if "blob_gas_used" in payload:
+            return "deneb"
+        elif "withdrawals" in payload:
+            return "capella"
+
+        return "bellatrix"
+    elif "sync_aggregate" in body:
+        return "altair"
+
+    return "phase0"
+
+
+def _check_fields(value: Dict[str, Any], schema: Container, name: str):
+    unknown = set(value).difference(field_name for field_name, _ in schema.fields)
+    if unknown:
+        raise ValueError(f"Unsupported {name} fields {sorted(unknown)}, e.g. of a newer fork.")
+
+
+def compute_block_root(message: Dict[str, Any], version: Optional[str] = None) -> bytes:
+    """
+    Returns the ``hash_tree_root`` of beacon API block ``message`` data, the root
+    its child blocks reference as ``parent_root``.
+    """
+    version = version or detect_version(message["body"])
+    return BEACON_BLOCKS[version].hash_tree_root(message)
+
+
+def compute_body_root(body: Dict[str, Any], version: Optional[str] = None) -> bytes:
+    """
+    Returns the ``hash_tree_root`` of beacon API block ``body`` data, the
+    ``body_root`` of its header.
+    """
+    version = version or detect_version(body)
+    return _body_schema(version).hash_tree_root(body)
+
+
+def compute_execution_payload_root(payload: Dict[str, Any], version: Optional[str] = None) -> bytes:
+    """
+    Returns the ``hash_tree_root`` of beacon API ``execution_payload`` data.
+    """
+    version = version or detect_version({"execution_payload": payload})
+    return _body_schema(version)["execution_payload"].hash_tree_root(payload)
+
+
+def _body_schema(version: str) -> Container:
+    return cast(Container, BEACON_BLOCKS[version]["body"])
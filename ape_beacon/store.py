@@ -0,0 +1,160 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+MISSED_SLOT: Dict = {}
+"""
+Sentinel returned by :meth:`~ape_beacon.store.BlockStore.get` for a stored missed slot.
+"""
+
+
+class BlockStoreSettings(BaseModel):
+    """
+    Settings for :class:`~ape_beacon.store.BlockStore`, read from the provider settings.
+    """
+
+    block_store: bool = False  # persist finalized blocks to disk
+    block_store_path: Optional[Path] = None  # defaults to ``<data_folder>/blocks.sqlite``
+
+
+class BlockStore:
+    """
+    A persistent SQLite store of finalized beacon blocks, keyed by slot and block root.
+
+    Blocks are stored as the raw beacon API ``message`` JSON so they decode through
+    :meth:`~ape_beacon.ecosystem.Beacon.decode_block` exactly as if fetched.
+    Missed slots are stored with no data. Each thread gets its own connection and
+    the database runs in WAL mode, so many readers can share it with one writer.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._create_tables()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def _create_tables(self):
+        with self.connection as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS blocks "
+                "(slot INTEGER PRIMARY KEY, root TEXT, data TEXT)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS blocks_root ON blocks (root)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ranges (start INTEGER PRIMARY KEY, stop INTEGER)"
+            )
+
+    def get(self, slot: Optional[int] = None, root: Optional[str] = None) -> Optional[Dict]:
+        """
+        Returns the stored block ``message`` data for ``slot`` or ``root``,
+        :attr:`~ape_beacon.store.MISSED_SLOT` for a stored missed slot, or ``None``
+        if not stored.
+        """
+        if slot is not None:
+            cursor = self.connection.execute("SELECT data FROM blocks WHERE slot = ?", (slot,))
+        elif root is not None:
+            cursor = self.connection.execute("SELECT data FROM blocks WHERE root = ?", (root,))
+        else:
+            return None
+
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        elif row[0] is None:
+            return MISSED_SLOT
+
+        return json.loads(row[0])
+
+    def put(self, slot: int, data: Optional[Dict], root: Optional[str] = None):
+        """
+        Stores the block ``message`` data for finalized ``slot``. Pass ``data=None``
+        to record a missed slot.
+        """
+        value = json.dumps(data, separators=(",", ":")) if data is not None else None
+        with self.connection as connection:
+            connection.execute(
+                "INSERT INTO blocks (slot, root, data) VALUES (?, ?, ?) "
+                "ON CONFLICT (slot) DO UPDATE SET "
+                "root = COALESCE(excluded.root, blocks.root), data = excluded.data",
+                (slot, root, value),
+            )
+
+    def set_root(self, slot: int, root: str):
+        """
+        Records ``root`` as the block root of the stored block at ``slot``, if any.
+        """
+        with self.connection as connection:
+            connection.execute(
+                "UPDATE blocks SET root = ? WHERE slot = ? AND data IS NOT NULL", (root, slot)
+            )
+
+    def count(self, start: int, stop: int) -> int:
+        """
+        Returns the number of stored slots (including missed slots) from ``start``
+        through ``stop`` (inclusive).
+        """
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM blocks WHERE slot BETWEEN ? AND ?", (start, stop)
+        ).fetchone()
+        return row[0]
+
+    def mark_complete(self, start: int, stop: int):
+        """
+        Records that every slot from ``start`` through ``stop`` (inclusive) is stored,
+        merging with overlapping or adjacent complete ranges.
+        """
+        with self.connection as connection:
+            rows = connection.execute(
+                "SELECT start, stop FROM ranges WHERE start <= ? AND stop >= ?",
+                (stop + 1, start - 1),
+            ).fetchall()
+            for row_start, row_stop in rows:
+                start = min(start, row_start)
+                stop = max(stop, row_stop)
+
+            connection.executemany(
+                "DELETE FROM ranges WHERE start = ?", [(row_start,) for row_start, _ in rows]
+            )
+            connection.execute("INSERT INTO ranges (start, stop) VALUES (?, ?)", (start, stop))
+
+    def complete_ranges(self) -> List[Tuple[int, int]]:
+        return self.connection.execute("SELECT start, stop FROM ranges ORDER BY start").fetchall()
+
+    def missing_ranges(self, start: int, stop: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the ``(start, stop)`` sub-ranges of ``start`` through ``stop`` that are
+        not yet complete in the store.
+        """
+        rows = self.connection.execute(
+            "SELECT start, stop FROM ranges WHERE start <= ? AND stop >= ? ORDER BY start",
+            (stop, start),
+        ).fetchall()
+        for row_start, row_stop in rows:
+            if row_start > start:
+                yield start, row_start - 1
+
+            start = max(start, row_stop + 1)
+
+        if start <= stop:
+            yield start, stop
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,217 @@
+from array import array
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+from ape.utils import EMPTY_BYTES32
+from hexbytes import HexBytes
+
+from ape_beacon.containers import BeaconBlockBody, BeaconBlockHeader
+from ape_beacon.ecosystem import BeaconBlock
+
+ROOT_DTYPE = np.dtype("S32")
+
+COUNTERS = (
+    "num_proposer_slashings",
+    "num_attester_slashings",
+    "num_attestations",
+    "num_deposits",
+    "num_voluntary_exits",
+)
+"""
+The ``num_*`` counters of :class:`~ape_beacon.containers.BeaconBlockBody` kept in a summary.
+"""
+
+_BODY_LISTS = (
+    "proposer_slashings",
+    "attester_slashings",
+    "attestations",
+    "deposits",
+    "voluntary_exits",
+)
+
+
+class BlockSummary(NamedTuple):
+    """
+    Compact slot metadata of a beacon block: the header level fields and operation
+    counts of a :class:`~ape_beacon.ecosystem.BeaconBlock` without its body data.
+    """
+
+    slot: int
+    proposer_index: int
+    parent_root: HexBytes
+    state_root: HexBytes
+    timestamp: int  # NOTE: 0 for pre-merge blocks
+    num_proposer_slashings: int = 0
+    num_attester_slashings: int = 0
+    num_attestations: int = 0
+    num_deposits: int = 0
+    num_voluntary_exits: int = 0
+
+    @classmethod
+    def from_response(cls, data: Dict) -> "BlockSummary":
+        """
+        Builds a summary straight from beacon API block ``message`` data, without
+        decoding the block.
+        """
+        body = data.get("body", {})
+        payload = body.get("execution_payload")
+        return cls(
+            int(data["slot"]),
+            int(data["proposer_index"]),
+            HexBytes(data["parent_root"]),
+            HexBytes(data["state_root"]),
+            int(payload["timestamp"]) if payload is not None else 0,
+            *(len(body.get(name, ())) for name in _BODY_LISTS),
+        )
+
+    @classmethod
+    def from_block(cls, block: BeaconBlock) -> "BlockSummary":
+        return cls(
+            block.number or 0,
+            block.proposer_index or 0,
+            HexBytes(block.parent_hash),
+            HexBytes(block.hash or b""),
+            block.timestamp,
+            *(getattr(block.body, name) for name in COUNTERS),
+        )
+
+    @classmethod
+    def from_header(cls, header: BeaconBlockHeader) -> "BlockSummary":
+        """
+        Builds a summary from a block header. Headers carry no timestamp or operation
+        counts, so those are ``0``.
+        """
+        return cls(header.slot, header.proposer_index, header.parent_root, header.state_root, 0)
+
+    def to_block(self) -> BeaconBlock:
+        """
+        Converts back to a :class:`~ape_beacon.ecosystem.BeaconBlock`. Body data not
+        kept in the summary (e.g. ``eth1_data`` or the execution payload) is ``None``;
+        fetch the block by ``slot`` for it.
+        """
+        body = BeaconBlockBody.construct(
+            randao_reveal=None,
+            eth1_data=None,
+            graffiti=EMPTY_BYTES32,
+            **{name: getattr(self, name) for name in COUNTERS},
+        )
+        return BeaconBlock.construct(
+            num_transactions=0,
+            hash=self.state_root,
+            number=self.slot,
+            parent_hash=self.parent_root or EMPTY_BYTES32,
+            size=0,
+            timestamp=self.timestamp,
+            proposer_index=self.proposer_index,
+            body=body,
+        )
+
+
+class BlockSummaries:
+    """
+    Many :class:`~ape_beacon.summaries.BlockSummary` stored as parallel NumPy
+    arrays, about 100 bytes per slot. Roots are stored as fixed-width 32 byte
+    strings and the ``num_*`` counters as ``uint16``.
+    """
+
+    def __init__(
+        self,
+        slot: np.ndarray,
+        proposer_index: np.ndarray,
+        parent_root: np.ndarray,
+        state_root: np.ndarray,
+        timestamp: np.ndarray,
+        counters: Dict[str, np.ndarray],
+    ):
+        self.slot = slot
+        self.proposer_index = proposer_index
+        self.parent_root = parent_root
+        self.state_root = state_root
+        self.timestamp = timestamp
+        self.counters = counters
+
+        # NOTE: Sorted view for vectorized slot lookups
+        self._slot_order = np.argsort(slot, kind="stable")
+
+    @classmethod
+    def from_summaries(cls, summaries: Iterable[BlockSummary]) -> "BlockSummaries":
+        """
+        Builds the arrays from ``summaries``, consuming them one at a time into
+        compact column buffers.
+        """
+        slot, proposer_index, timestamp = array("Q"), array("Q"), array("Q")
+        counters = {name: array("H") for name in COUNTERS}
+        parent_roots, state_roots = bytearray(), bytearray()
+        for summary in summaries:
+            slot.append(summary.slot)
+            proposer_index.append(summary.proposer_index)
+            timestamp.append(summary.timestamp)
+            parent_roots += summary.parent_root.rjust(ROOT_DTYPE.itemsize, b"\x00")
+            state_roots += summary.state_root.rjust(ROOT_DTYPE.itemsize, b"\x00")
+            for name, column in counters.items():
+                column.append(getattr(summary, name))
+
+        return cls(
+            slot=np.frombuffer(slot, dtype=np.uint64),
+            proposer_index=np.frombuffer(proposer_index, dtype=np.uint64),
+            parent_root=np.frombuffer(bytes(parent_roots), dtype=ROOT_DTYPE),
+            state_root=np.frombuffer(bytes(state_roots), dtype=ROOT_DTYPE),
+            timestamp=np.frombuffer(timestamp, dtype=np.uint64),
+            counters={
+                name: np.frombuffer(column, dtype=np.uint16) for name, column in counters.items()
+            },
+        )
+
+    @classmethod
+    def from_response(cls, items: Iterable[Dict]) -> "BlockSummaries":
+        """
+        Builds the arrays straight from beacon API block ``message`` data.
+        """
+        return cls.from_summaries(BlockSummary.from_response(item) for item in items)
+
+    def __len__(self) -> int:
+        return len(self.slot)
+
+    def __iter__(self) -> Iterator[BlockSummary]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> BlockSummary:
+        return BlockSummary(
+            int(self.slot[row]),
+            int(self.proposer_index[row]),
+            # NOTE: Use raw bytes as NumPy strips trailing null bytes from `S32` items
+            HexBytes(self.parent_root[row : row + 1].tobytes()),
+            HexBytes(self.state_root[row : row + 1].tobytes()),
+            int(self.timestamp[row]),
+            *(int(self.counters[name][row]) for name in COUNTERS),
+        )
+
+    def position(self, slot: int) -> Optional[int]:
+        """
+        Returns the row of ``slot``, if present.
+        """
+        found = np.searchsorted(self.slot, np.uint64(slot), sorter=self._slot_order)
+        if found < len(self._slot_order):
+            row = int(self._slot_order[found])
+            if self.slot[row] == slot:
+                return row
+
+        return None
+
+    def get(self, slot: int) -> Optional[BlockSummary]:
+        row = self.position(slot)
+        return self[row] if row is not None else None
+
+    def select(self, mask: np.ndarray) -> "BlockSummaries":
+        """
+        Returns the summaries of the rows selected by boolean ``mask``.
+        """
+        return BlockSummaries(
+            slot=self.slot[mask],
+            proposer_index=self.proposer_index[mask],
+            parent_root=self.parent_root[mask],
+            state_root=self.state_root[mask],
+            timestamp=self.timestamp[mask],
+            counters={name: column[mask] for name, column in self.counters.items()},
+        )
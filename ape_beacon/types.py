@@ -10,6 +10,16 @@ An ID that can match a beacon block, such as the literals ``"genesis"``, ``"head
 or ``"finalized"`` as well as a block number or hash (HexBytes).
 """
 
+SLOTS_PER_EPOCH = 32
+"""
+Number of slots in an epoch on all supported networks.
+"""
+
+SYNC_COMMITTEE_SIZE = 512
+"""
+Number of validators in a sync committee on all supported networks.
+"""
+
 BytesLike = Union[bool, bytearray, bytes, int, str, memoryview]
 """
 hexbytes BytesLike typing
@@ -9,6 +9,7 @@ extras_require = {
         "pytest-cov",  # Coverage analyzer plugin
         "hypothesis>=6.2.0,<7.0",  # Strategy-based fuzzer
         "responses",  # Use for mock beacon provider local testing
+        "aioresponses",  # Use for mock async beacon provider local testing
     ],
     "lint": [
         "black>=22.6.0",  # auto-formatter and linter
@@ -55,8 +56,11 @@ setup(
     url="https://github.com/ApeWorX/ape-beacon",
     include_package_data=True,
     install_requires=[
+        "aiohttp",  # Use same version as web3
         "eth-ape>=0.5.2,<0.6.0",
         "hexbytes",  # Use same version as eth-ape
+        "numpy",  # Use same version as eth-ape
+        "py_ecc",  # Use same version as eth-ape
         "web3",  # Use same version as eth-ape
     ],
     python_requires=">=3.8,<4",
@@ -4,10 +4,9 @@ import responses  # type: ignore
 from ape.api.providers import TestProviderAPI
 from ape.exceptions import APINotImplementedError, ProviderNotConnectedError
 from ape.types import SnapshotID
-from web3.beacon import Beacon
 from web3.providers.eth_tester.defaults import API_ENDPOINTS
 
-from ape_beacon.providers import BeaconProvider
+from ape_beacon.providers import AsyncBeaconProvider
 
 CHAIN_ID = API_ENDPOINTS["eth"]["chainId"]()
 VALIDATORS = {
@@ -16,7 +15,7 @@ VALIDATORS = {
 SLOTS = {"1": "15796864"}
 
 
-class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
+class LocalBeaconProvider(TestProviderAPI, AsyncBeaconProvider):
     """
     Similar to ape_test.providers.LocalProvider but for Beacon API and far less
     flexible. Uses requests mock for backend.
@@ -45,14 +44,14 @@ class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
             return
 
         self._setup_backend()
-        self._beacon = Beacon(self.uri)
+        self._beacon = self._create_beacon(self.uri)
 
     def disconnect(self):
         self.cached_chain_id = None
 
         self._teardown_backend()
         self._beacon_backend = None
-        self._beacon = None
+        self._close_beacon()
 
     @property
     def chain_id(self) -> int:
@@ -89,7 +88,9 @@ class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
         self._add_get_health_endpoint()
         self._add_deposit_contract_endpoint()
         self._add_get_block_endpoint()
+        self._add_get_finalized_header_endpoint()
         self._add_get_validator_endpoint()
+        self._add_get_randao_endpoint()
 
     def _teardown_backend(self):
         if self._beacon_backend is not None:
@@ -210,6 +211,52 @@ class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
             status=500,
         )
 
+    def _add_get_finalized_header_endpoint(self):
+        # NOTE: slot 1 is the finalized slot
+        endpoint_urls = [
+            self.uri + "/eth/v1/beacon/headers/finalized",
+            self.uri + "/eth/v1/beacon/headers/1",
+        ]
+        json = {
+            "execution_optimistic": False,
+            "data": {
+                "root": "0xcf8e0d4e9587369b2301d0790347320302cc0943d5a1884560367e8208d920f2",
+                "canonical": True,
+                "header": {
+                    "message": {
+                        "slot": "1",
+                        "proposer_index": "61090",
+                        "parent_root": "0x6a89af5df908893eedbed10ba4c13fc13d5653ce57db637e3bfded73a987bb87",  # noqa: E501
+                        "state_root": "0x7773ed5a7e944c6238cd0a5c32170663ef2be9efc594fb43ad0f07ecf4c09d2b",  # noqa: E501
+                        "body_root": "0xcf8e0d4e9587369b2301d0790347320302cc0943d5a1884560367e8208d920f2",  # noqa: E501
+                    },
+                    "signature": "0xa30d70b3e62ff776fe97f7f8b3472194af66849238a958880510e698ec3b8a470916680b1a82f9d4753c023153fbe6db10c464ac532c1c9c8919adb242b05ef7152ba3e6cd08b730eac2154b9802203ead6079c8dfb87f1e900595e6c00b4a9a",  # noqa: E501
+                },
+            },
+        }
+        for url in endpoint_urls:
+            self.beacon_backend.get(url, json=json, status=200)
+
+        # add the list form mocks, filtered by slot or parent root
+        parent_root = json["data"]["header"]["message"]["parent_root"]  # type: ignore
+        for query in ("slot=1", f"parent_root={parent_root}"):
+            self.beacon_backend.get(
+                self.uri + f"/eth/v1/beacon/headers?{query}",
+                json={"execution_optimistic": False, "data": [json["data"]]},
+                status=200,
+            )
+
+        self.beacon_backend.get(
+            self.uri + "/eth/v1/beacon/headers?slot=2",
+            json={"execution_optimistic": False, "data": []},
+            status=200,
+        )
+        self.beacon_backend.get(
+            self.uri + "/eth/v1/beacon/headers/2",
+            json={"code": 404, "message": "Block not found"},
+            status=404,
+        )
+
     def _add_get_validator_endpoint(self):
         # add a validator
         endpoint_urls = [
@@ -238,6 +285,35 @@ class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
         for url in endpoint_urls:
             self.beacon_backend.get(url, json=json, status=200)
 
+        # add the full validator set mock with one more validator
+        other = {
+            **json["data"],
+            "index": "110281",
+            "balance": "31000000000",
+            "status": "exited_unslashed",
+            "validator": {**json["data"]["validator"], "pubkey": "0x" + "ab" * 48},
+        }
+        self.beacon_backend.get(
+            self.uri + "/eth/v1/beacon/states/head/validators",
+            json={"execution_optimistic": False, "data": [json["data"], other]},
+            status=200,
+        )
+
+        # add the bulk mocks, which only know about the validator above
+        self.beacon_backend.post(
+            self.uri + "/eth/v1/beacon/states/head/validators",
+            json={"execution_optimistic": False, "data": [json["data"]]},
+            status=200,
+        )
+        self.beacon_backend.post(
+            self.uri + "/eth/v1/beacon/states/head/validator_balances",
+            json={
+                "execution_optimistic": False,
+                "data": [{"index": "110280", "balance": "32000000000"}],
+            },
+            status=200,
+        )
+
         # add the error mock
         # check for 400, 404, and 500 possible responses
         self.beacon_backend.get(
@@ -255,3 +331,10 @@ class LocalBeaconProvider(TestProviderAPI, BeaconProvider):
             json={"code": 500, "message": "Internal server error"},
             status=500,
         )
+
+    def _add_get_randao_endpoint(self):
+        self.beacon_backend.get(
+            self.uri + "/eth/v1/beacon/states/head/randao?epoch=0",
+            json={"execution_optimistic": False, "data": {"randao": "0x" + "42" * 32}},
+            status=200,
+        )
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+import requests
+from aioresponses import aioresponses  # type: ignore
+from ape.exceptions import BlockNotFoundError
+
+from ape_beacon.exceptions import BeaconRequestError, ValidatorNotFoundError
+
+
+@pytest.fixture
+def async_backend(configured_beacon_test_provider):
+    # NOTE: mirror the sync mock backend responses for the aiohttp client
+    uri = configured_beacon_test_provider.uri
+    block = requests.get(uri + "/eth/v2/beacon/blocks/1").json()
+    validator = requests.get(uri + "/eth/v1/beacon/states/head/validators/110280").json()
+    finalized_header = requests.get(uri + "/eth/v1/beacon/headers/finalized").json()
+
+    with aioresponses() as backend:
+        backend.get(uri + "/eth/v2/beacon/blocks/1", payload=block, repeat=True)
+        backend.get(uri + "/eth/v2/beacon/blocks/2", status=404, repeat=True)
+        backend.get(uri + "/eth/v2/beacon/blocks/3", status=500, repeat=True)
+        backend.get(uri + "/eth/v1/beacon/headers/finalized", payload=finalized_header)
+        backend.get(uri + "/eth/v1/beacon/states/head/validators/110280", payload=validator)
+        backend.get(uri + "/eth/v1/beacon/states/head/validators/2", status=404)
+        yield backend
+
+    asyncio.run(configured_beacon_test_provider.aclose())
+
+
+def test_get_block_async(configured_beacon_test_provider, async_backend):
+    actual = asyncio.run(configured_beacon_test_provider.get_block_async(1))
+    expect = configured_beacon_test_provider.get_block(1)
+    assert actual == expect
+
+
+def test_get_block_async_refreshes_finalized_slot(configured_beacon_test_provider, async_backend):
+    provider = configured_beacon_test_provider
+    provider.block_cache.clear()
+    provider._finalized_slot, provider._finalized_slot_expires_at = -1, 0.0
+
+    block = asyncio.run(provider.get_block_async(1))
+    assert provider._finalized_slot == 1
+    assert provider.block_cache.get(1) == block
+
+
+def test_get_block_async_raises_when_not_exists(configured_beacon_test_provider, async_backend):
+    with pytest.raises(BlockNotFoundError):
+        asyncio.run(configured_beacon_test_provider.get_block_async(2))
+
+
+def test_get_block_async_raises_when_request_fails(configured_beacon_test_provider, async_backend):
+    with pytest.raises(BeaconRequestError):
+        asyncio.run(configured_beacon_test_provider.get_block_async(3))
+
+
+def test_get_balance_async(configured_beacon_test_provider, async_backend):
+    actual = asyncio.run(configured_beacon_test_provider.get_balance_async("110280"))
+    expect = configured_beacon_test_provider.get_balance("110280")
+    assert actual == expect
+
+    with pytest.raises(ValidatorNotFoundError):
+        asyncio.run(configured_beacon_test_provider.get_balance_async("2"))
+
+
+def test_get_blocks_async(configured_beacon_test_provider, async_backend):
+    async def collect():
+        return [block async for block in configured_beacon_test_provider.get_blocks_async(1, 2)]
+
+    actual = asyncio.run(collect())
+    expect = [configured_beacon_test_provider.get_block(1)]
+    assert actual == expect
@@ -0,0 +1,116 @@
+import copy
+
+import pytest
+from hexbytes import HexBytes
+
+from ape_beacon.cache import BlockCache
+
+ROOT = "0x6a89af5df908893eedbed10ba4c13fc13d5653ce57db637e3bfded73a987bb87"
+OTHER_ROOT = "0x" + "bb" * 32
+
+
+@pytest.fixture
+def blocks(configured_beacon_test_provider):
+    block = configured_beacon_test_provider.get_block(1)
+    return [block.copy(update={"number": n}) for n in range(4)]
+
+
+def test_get_by_slot_and_root(blocks):
+    cache = BlockCache(max_size=2)
+    cache.put(blocks[1], finalized=True, root=ROOT)
+    assert cache.get(1) is blocks[1]
+    assert cache.get(ROOT) is blocks[1]
+    assert cache.get(2) is None
+    assert cache.stats == (2, 1, 1)
+
+
+def test_evicts_least_recently_used(blocks):
+    cache = BlockCache(max_size=2)
+    cache.put(blocks[0], finalized=True, root=ROOT)
+    cache.put(blocks[1], finalized=True)
+    cache.get(0)
+    cache.put(blocks[2], finalized=True)
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(0) is blocks[0]
+
+    cache.put(blocks[3], finalized=True)
+    cache.put(blocks[1], finalized=True)
+    assert cache.get(ROOT) is None
+
+
+def test_put_replaced_block_drops_old_roots(blocks):
+    cache = BlockCache()
+    cache.put(blocks[1], finalized=False, root=ROOT)
+    cache.put(blocks[1], finalized=False, root=OTHER_ROOT)
+    assert cache.get(ROOT) is blocks[1]
+
+    # NOTE: A different block at the slot, e.g. after a reorg
+    replacement = blocks[1].copy(update={"hash": HexBytes(OTHER_ROOT)})
+    cache.put(replacement, finalized=False)
+    assert cache.get(ROOT) is None
+    assert cache.get(OTHER_ROOT) is None
+    assert cache.get(1) is replacement
+
+
+def test_put_non_canonical_by_root_only(blocks):
+    cache = BlockCache()
+    cache.put(blocks[1], finalized=True)
+    sibling = blocks[1].copy(update={"hash": HexBytes(OTHER_ROOT)})
+    cache.put(sibling, finalized=True, root=OTHER_ROOT, canonical=False)
+    assert cache.get(1) is blocks[1]
+    assert cache.get(OTHER_ROOT) is sibling
+    assert cache.count(0, 3) == 1
+
+    # NOTE: The canonical block fetched by root shares its slot entry
+    cache.put(blocks[1], finalized=True, root=ROOT, canonical=False)
+    assert cache.get(ROOT) is blocks[1]
+    assert len(cache) == 2
+
+    # NOTE: Once known to be canonical, the block takes over the slot
+    cache.put(sibling, finalized=True, root=OTHER_ROOT)
+    assert cache.get(1) is sibling
+    assert cache.get(ROOT) is None
+    assert len(cache) == 1
+
+
+def test_unfinalized_expire(blocks):
+    cache = BlockCache(ttl=0)
+    cache.put(blocks[0], finalized=True)
+    cache.put(blocks[1], finalized=False)
+    assert cache.get(0) is blocks[0]
+    assert cache.get(1) is None
+
+
+def test_invalidate_unfinalized(blocks):
+    cache = BlockCache(ttl=60)
+    cache.put(blocks[0], finalized=True)
+    cache.put(blocks[1], finalized=False)
+    assert cache.get(1) is blocks[1]
+
+    cache.invalidate_unfinalized()
+    assert cache.get(0) is blocks[0]
+    assert cache.get(1) is None
+
+
+def test_provider_caches_finalized_blocks(configured_beacon_test_provider):
+    configured_beacon_test_provider.block_cache.clear()
+    first = configured_beacon_test_provider.get_block(1)
+    second = configured_beacon_test_provider.get_block("1")
+    assert second is first
+    assert configured_beacon_test_provider.finalized_slot == 1
+    assert configured_beacon_test_provider.block_cache.stats == (1, 1, 1)
+
+
+def test_provider_keeps_canonical_block_over_sibling(configured_beacon_test_provider):
+    provider = configured_beacon_test_provider
+    provider.block_cache.clear()
+    expect = provider.get_block(1)
+
+    sibling = copy.deepcopy(provider.beacon.get_block("1"))
+    sibling["data"]["message"]["state_root"] = OTHER_ROOT
+    provider.beacon_backend.upsert(
+        "GET", f"{provider.uri}/eth/v2/beacon/blocks/{ROOT}", json=sibling
+    )
+    assert provider.get_block(ROOT).hash == HexBytes(OTHER_ROOT)
+    assert provider.get_block(1) is expect
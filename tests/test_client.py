@@ -0,0 +1,187 @@
+import pytest
+import requests
+import responses  # type: ignore
+from requests.adapters import HTTPAdapter
+
+from ape_beacon.client import BeaconClient, BeaconClientSettings, MultiBeaconClient, TokenBucket
+
+
+def test_client_settings_from_provider_settings(beacon_test_provider):
+    beacon_test_provider.provider_settings.update({"pool_maxsize": 64, "uri": "http://a"})
+    actual = beacon_test_provider.client_settings
+    assert actual.pool_maxsize == 64
+    assert actual.keep_alive
+
+    beacon_test_provider.provider_settings.pop("pool_maxsize")
+    beacon_test_provider.provider_settings.pop("uri")
+
+
+def test_client_session_is_pooled():
+    settings = BeaconClientSettings(pool_maxsize=8, gzip=False, keep_alive=False)
+    client = BeaconClient("http://localhost:5051", settings=settings, headers={"X-Test": "1"})
+
+    adapter = client.session.get_adapter("http://localhost:5051")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 8
+    assert client.session.headers["Accept-Encoding"] == "identity"
+    assert client.session.headers["Connection"] == "close"
+    assert client.session.headers["X-Test"] == "1"
+    client.close()
+
+
+def test_client_reuses_session(configured_beacon_test_provider):
+    beacon = configured_beacon_test_provider.beacon
+    session = beacon.session
+    configured_beacon_test_provider.get_block(1)
+    configured_beacon_test_provider.get_balance("110280")
+    assert beacon.session is session
+
+
+@responses.activate
+def test_client_iter_validators():
+    url = "http://localhost:5051/eth/v1/beacon/states/head/validators"
+    data = [{"index": str(i), "status": "active_ongoing"} for i in range(3)]
+    responses.get(url, json={"execution_optimistic": False, "data": data})
+
+    client = BeaconClient("http://localhost:5051")
+    assert list(client.iter_validators()) == data
+
+
+@responses.activate
+def test_client_iter_events():
+    url = "http://localhost:5051/eth/v1/events"
+    body = (
+        ": keep-alive\n\n"
+        'event: head\ndata: {"slot": "1"}\n\n'
+        'event: chain_reorg\ndata: {"slot": "1",\ndata: "depth": "1"}\n\n'
+    )
+    responses.get(url, body=body, content_type="text/event-stream")
+
+    client = BeaconClient("http://localhost:5051")
+    actual = list(client.iter_events(["head", "chain_reorg"]))
+    assert actual == [("head", {"slot": "1"}), ("chain_reorg", {"slot": "1", "depth": "1"})]
+    assert responses.calls[0].request.url.endswith("topics=head,chain_reorg")
+
+
+@responses.activate
+def test_client_records_health_passively():
+    responses.get("http://localhost:5051/eth/v1/node/version", json={"data": {}})
+    responses.get("http://localhost:5051/eth/v2/beacon/blocks/2", status=404)
+    responses.get("http://localhost:5051/eth/v2/beacon/blocks/3", status=503)
+
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(max_retries=0))
+    assert client.health_expired
+
+    client.get_version()
+    assert client.healthy and not client.health_expired
+
+    # NOTE: a missing block does not make the node unhealthy
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_block("2")
+    assert client.healthy
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_block("3")
+    assert not client.healthy
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get_block("4")
+    assert not client.healthy
+
+
+@responses.activate
+def test_client_retries_transient_errors(monkeypatch):
+    url = "http://localhost:5051/eth/v1/node/version"
+    responses.get(url, status=503, headers={"Retry-After": "2"})
+    responses.get(url, status=429)
+    responses.get(url, json={"data": {"version": "1"}})
+    delays = []
+    monkeypatch.setattr("ape_beacon.client.time.sleep", delays.append)
+
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(retry_backoff=1))
+    assert client.get_version() == {"data": {"version": "1"}}
+    assert len(responses.calls) == 3
+    assert delays[0] == 2  # NOTE: Retry-After is honored
+    assert 0 <= delays[1] <= 2  # NOTE: Jittered backoff of the second attempt
+
+
+@responses.activate
+def test_client_gives_up_after_max_retries(monkeypatch):
+    url = "http://localhost:5051/eth/v2/beacon/blocks/1"
+    responses.get(url, status=503)
+    monkeypatch.setattr("ape_beacon.client.time.sleep", lambda _: None)
+
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(max_retries=2))
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_block("1")
+
+    assert len(responses.calls) == 3
+
+
+def test_retry_delay_is_capped():
+    settings = BeaconClientSettings(retry_backoff=1, max_retry_backoff=5)
+    assert settings.retry_delay(10) <= 5
+    assert settings.retry_delay(0, "60") == 5
+    assert settings.retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.fixture
+def endpoints():
+    uris = ["http://node-a:5052", "http://node-b:5052"]
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as backend:
+        for uri, head_slot in zip(uris, (100, 90)):
+            syncing = {"head_slot": str(head_slot), "sync_distance": "0", "is_syncing": False}
+            backend.get(uri + "/eth/v1/node/syncing", json={"data": syncing})
+            backend.get(uri + "/eth/v1/node/version", json={"data": {"version": uri}})
+
+        yield uris, backend
+
+
+def test_multi_client_round_robin(endpoints):
+    uris, _ = endpoints
+    client = MultiBeaconClient(uris)
+    actual = [client.get_version()["data"]["version"] for _ in range(4)]
+    assert actual == uris * 2
+    assert all(endpoint.latency is not None for endpoint in client.endpoints)
+    assert client.endpoints[1].head_slot == 90
+
+
+def test_multi_client_fails_over(endpoints):
+    uris, backend = endpoints
+    backend.get(uris[0] + "/eth/v2/beacon/blocks/1", status=503)
+    backend.get(uris[1] + "/eth/v2/beacon/blocks/1", json={"data": {"message": {}}})
+    backend.get(uris[1] + "/eth/v2/beacon/blocks/95", status=404)
+    backend.get(uris[0] + "/eth/v2/beacon/blocks/95", json={"data": {"message": {}}})
+
+    client = MultiBeaconClient(uris, settings=BeaconClientSettings(ssz=False))
+    assert client.get_block("1") == {"data": {"message": {}}}
+    assert not client.endpoints[0].healthy
+    assert client.healthy
+
+    # NOTE: node-b is behind node-a, so its 404 is retried
+    client.endpoints[0].healthy = True
+    client._next_endpoint = 1
+    assert client.get_block("95") == {"data": {"message": {}}}
+
+
+@responses.activate
+def test_client_get_health_is_not_retried(monkeypatch):
+    url = "http://localhost:5051/eth/v1/node/health"
+    responses.get(url, status=503)
+    responses.get(url, status=206)
+    monkeypatch.setattr("ape_beacon.client.time.sleep", lambda _: pytest.fail("Backed off"))
+
+    client = BeaconClient("http://localhost:5051")
+    assert client.get_health() == 503
+    assert not client.healthy
+    assert client.get_health() == 206
+    assert client.healthy
+    assert len(responses.calls) == 2
@@ -0,0 +1,140 @@
+from hashlib import sha256
+
+import numpy as np
+import pytest
+
+from ape_beacon.committees import (
+    DOMAIN_BEACON_ATTESTER,
+    DOMAIN_BEACON_PROPOSER,
+    SHUFFLE_ROUND_COUNT,
+    CommitteeEngine,
+    EpochShuffling,
+    compute_proposer_index,
+    compute_seed,
+    compute_shuffled_indices,
+)
+from ape_beacon.registry import ValidatorRegistry
+from ape_beacon.types import SLOTS_PER_EPOCH
+
+SEED = sha256(b"seed").digest()
+RANDAO_MIX = bytes.fromhex("42" * 32)
+FAR_FUTURE_EPOCH = 2**64 - 1
+
+
+def _spec_shuffled_index(index: int, index_count: int, seed: bytes) -> int:
+    # NOTE: Straight port of the spec's `compute_shuffled_index`
+    for current_round in range(SHUFFLE_ROUND_COUNT):
+        round_seed = seed + bytes([current_round])
+        pivot = int.from_bytes(sha256(round_seed).digest()[:8], "little") % index_count
+        flip = (pivot + index_count - index) % index_count
+        position = max(index, flip)
+        source = sha256(round_seed + (position // 256).to_bytes(4, "little")).digest()
+        byte = source[(position % 256) // 8]
+        if (byte >> (position % 8)) % 2:
+            index = flip
+
+    return index
+
+
+def _spec_proposer_index(indices, effective_balance, seed: bytes) -> int:
+    i = 0
+    while True:
+        candidate = _spec_shuffled_index(i % len(indices), len(indices), seed)
+        random_byte = sha256(seed + (i // 32).to_bytes(8, "little")).digest()[i % 32]
+        if effective_balance[candidate] * 255 >= 32 * 10**9 * random_byte:
+            return indices[candidate]
+
+        i += 1
+
+
+@pytest.fixture(scope="module")
+def registry():
+    count = 5000
+    items = [
+        {
+            "index": str(index),
+            "balance": "32000000000",
+            "status": "active_ongoing",
+            "validator": {
+                "pubkey": "0x" + index.to_bytes(48, "big").hex(),
+                "effective_balance": str((17 + index % 16) * 10**9),
+                "activation_epoch": "0" if index % 10 else "5",
+                "exit_epoch": str(FAR_FUTURE_EPOCH),
+                "slashed": False,
+            },
+        }
+        for index in range(count)
+    ]
+    return ValidatorRegistry.from_response(items)
+
+
+@pytest.mark.parametrize("index_count", (1, 2, 300, 1000))
+def test_compute_shuffled_indices(index_count):
+    actual = compute_shuffled_indices(np.arange(index_count), index_count, SEED)
+    expect = [_spec_shuffled_index(i, index_count, SEED) for i in range(index_count)]
+    assert list(actual) == expect
+
+    # NOTE: A few positions take the sparse path
+    actual = compute_shuffled_indices(np.array([0, index_count - 1]), index_count, SEED)
+    assert list(actual) == [expect[0], expect[-1]]
+
+
+def test_epoch_shuffling():
+    active_indices = np.arange(0, 20000, 2, dtype=np.uint64)
+    shuffling = EpochShuffling(3, active_indices, SEED)
+    assert shuffling.committees_per_slot == 2
+
+    committees = [
+        shuffling.committee(slot, index)
+        for slot in range(3 * SLOTS_PER_EPOCH, 4 * SLOTS_PER_EPOCH)
+        for index in range(2)
+    ]
+    assert sorted(np.concatenate(committees)) == list(active_indices)
+
+    expect = [active_indices[_spec_shuffled_index(i, 10000, SEED)] for i in range(156)]
+    assert list(committees[0]) == expect
+
+    validator_index = int(committees[5][7])
+    assignment = shuffling.find(validator_index)
+    assert assignment.slot == 3 * SLOTS_PER_EPOCH + 2
+    assert assignment.committee_index == 1
+    assert assignment.position == 7
+    assert assignment.committee_size == len(committees[5])
+    assert shuffling.find(1) is None
+
+    validator_index, slot, committee_index = shuffling.assignments()
+    row = list(validator_index).index(int(committees[5][7]))
+    assert (slot[row], committee_index[row]) == (assignment.slot, assignment.committee_index)
+
+    with pytest.raises(ValueError):
+        shuffling.committee(0, 0)
+
+
+def test_compute_proposer_index():
+    indices = np.arange(100, dtype=np.uint64)
+    effective_balance = (np.arange(100, dtype=np.uint64) % 32 + 1) * np.uint64(10**9)
+    for slot in range(8):
+        seed = sha256(SEED + slot.to_bytes(8, "little")).digest()
+        actual = compute_proposer_index(indices, effective_balance, seed)
+        assert actual == _spec_proposer_index(indices, effective_balance, seed)
+
+
+def test_committee_engine(registry):
+    engine = CommitteeEngine(registry, cache_size=1)
+    shuffling = engine.get_shuffling(4, RANDAO_MIX)
+    assert engine.get_shuffling(4, RANDAO_MIX) is shuffling
+    assert shuffling.seed == compute_seed(RANDAO_MIX, 4, DOMAIN_BEACON_ATTESTER)
+
+    # NOTE: Every tenth validator only activates at epoch 5
+    assert len(shuffling.shuffled) == 4500
+    assert len(engine.get_shuffling(5, RANDAO_MIX).shuffled) == 5000
+    assert engine.get_shuffling(4, RANDAO_MIX) is not shuffling
+
+    proposers = engine.get_proposers(4, RANDAO_MIX)
+    assert len(proposers) == SLOTS_PER_EPOCH
+    epoch_seed = compute_seed(RANDAO_MIX, 4, DOMAIN_BEACON_PROPOSER)
+    seed = sha256(epoch_seed + (4 * SLOTS_PER_EPOCH).to_bytes(8, "little")).digest()
+    active = [i for i in range(5000) if i % 10]
+    balances = {i: (17 + i % 16) * 10**9 for i in active}
+    expect = _spec_proposer_index(active, [balances[i] for i in active], seed)
+    assert proposers[0] == expect
@@ -1,4 +1,10 @@
-from ape_beacon.containers import BeaconExecutionPayload
+import json
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from ape_beacon.containers import BeaconExecutionPayload, sync_participation_matrix
 
 # NOTE: testing success cases given time constraints
 # TODO: testing non-success
@@ -133,3 +139,186 @@ def test_decode_block_when_payload(beacon, ethereum):
 
     actual_payload = actual.body.execution_payload
     assert actual_payload == expected_payload
+
+
+@pytest.mark.parametrize("with_payload", (False, True))
+def test_decode_block_when_trusted(beacon, with_payload):
+    block_data = {
+        "slot": "4700013",
+        "proposer_index": "210",
+        "parent_root": "0x6a89af5df908893eedbed10ba4c13fc13d5653ce57db637e3bfded73a987bb87",
+        "state_root": "0x7773ed5a7e944c6238cd0a5c32170663ef2be9efc594fb43ad0f07ecf4c09d2b",
+        "body": {
+            "randao_reveal": "0x" + "8e" * 96,
+            "eth1_data": {
+                "deposit_root": "0x4e910ac762815c13e316e72506141f5b6b441d58af8e0a049cd3341c25728752",  # noqa: E501
+                "deposit_count": "100596",
+                "block_hash": "0x89cb78044843805fb4dab8abd743fc96c2b8e955c58f9b7224d468d85ef57130",  # noqa: E501
+            },
+            "graffiti": "0x74656b752f76302e31322e31342b34342d673863656562663600000000000000",
+            "proposer_slashings": [],
+            "attester_slashings": [],
+            "attestations": [{}, {}],
+            "deposits": [],
+            "voluntary_exits": [{}],
+            "sync_aggregate": {
+                "sync_committee_bits": "0x" + "ff" * 64,
+                "sync_committee_signature": "0x" + "a3" * 96,
+            },
+        },
+    }
+    if with_payload:
+        block_data["body"]["execution_payload"] = {
+            "parent_hash": "0xcb94e150c06faee9ab2bf12a40b0937ac9eab1879c733ebe3249aafbba2f80b1",
+            "fee_recipient": "0x",
+            "prev_randao": "0x6474a9820165be467f1d25ed54f4802f72c4c95a19cf4ba4cdb8894f55d74195",
+            "block_number": "15796864",
+            "gas_limit": "30000000",
+            "gas_used": "12900335",
+            "timestamp": "1660932629",
+            "base_fee_per_gas": "30487386013",
+            "block_hash": "0xd9c6e150c06faee9ab2bf12a40b0937ac9eab1879c733ebe3249aafbba2f80b1",
+            "transactions": ["0x02", "0x02"],
+        }
+
+    original = deepcopy(block_data)
+    actual = beacon.decode_block(block_data, trusted=True)
+    assert block_data == original  # NOTE: input is left untouched
+
+    expect = beacon.decode_block(deepcopy(block_data))
+    assert actual.timestamp == expect.timestamp
+    assert actual == expect
+    assert actual.body == expect.body
+    assert actual.body.execution_payload == expect.body.execution_payload
+
+
+def test_decode_block_when_trusted_and_invalid(beacon):
+    with pytest.raises(ValidationError):
+        beacon.decode_block({"slot": "1"}, trusted=True)
+
+
+def test_decode_block_defers_execution_payload(beacon):
+    payload_data = {
+        "parent_hash": "0xcb94e150c06faee9ab2bf12a40b0937ac9eab1879c733ebe3249aafbba2f80b1",
+        "prev_randao": "0x6474a9820165be467f1d25ed54f4802f72c4c95a19cf4ba4cdb8894f55d74195",
+        "block_number": "15796864",
+        "gas_limit": "30000000",
+        "gas_used": "12900335",
+        "timestamp": "1660932629",
+        "block_hash": "0xd9c6e150c06faee9ab2bf12a40b0937ac9eab1879c733ebe3249aafbba2f80b1",
+        "transactions": ["0x02", "0x02"],
+    }
+    block_data = {
+        "slot": "4700013",
+        "proposer_index": "210",
+        "body": {"eth1_data": {"deposit_count": "1"}, "execution_payload": payload_data},
+    }
+    block = beacon.decode_block(block_data, trusted=True)
+    assert "execution_payload" not in block.body.__dict__
+    # NOTE: Only the fields read on decoding are kept, not the raw transactions
+    assert "transactions" not in block.body._raw_execution_payload
+    assert "gas_limit" not in block.body._raw_execution_payload
+    assert block.timestamp == 1660932629
+    assert block.body.execution_payload.number == 15796864
+    assert block.body.execution_payload == BeaconExecutionPayload.from_response(payload_data)
+    assert block.body.execution_payload.num_transactions == 2
+
+    block = beacon.decode_block(block_data, trusted=True, keep_execution_payload=False)
+    assert block.timestamp == 1660932629
+    assert block.body.execution_payload is None
+    assert block.body.dict()["execution_payload"] is None
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_decode_blocks(beacon, workers):
+    blocks = [
+        {
+            "slot": str(slot),
+            "proposer_index": "210",
+            "parent_root": "0x" + f"{slot:064x}",
+            "body": {"eth1_data": {"deposit_count": "1"}, "attestations": [{}] * slot},
+        }
+        for slot in range(10)
+    ]
+    raw_blocks = [json.dumps({"version": "phase0", "data": {"message": b}}) for b in blocks]
+    raw_blocks[3] = raw_blocks[3].encode()
+    raw_blocks[5] = blocks[5]
+
+    actual = list(beacon.decode_blocks(raw_blocks, workers=workers, chunk_size=3))
+    expect = [beacon.decode_block(deepcopy(b)) for b in blocks]
+    assert actual == expect
+    assert [block.body.num_attestations for block in actual] == list(range(10))
+
+
+def test_decode_blocks_when_invalid(beacon):
+    with pytest.raises(ValidationError):
+        list(beacon.decode_blocks([json.dumps({"slot": "1"})], workers=2))
+
+
+def test_sync_aggregate_participation(beacon):
+    bits = ["0x" + "ff" * 64, "0x05" + "00" * 63]
+    blocks = [
+        beacon.decode_block(
+            {
+                "slot": str(slot),
+                "body": {
+                    "eth1_data": {"deposit_count": "1"},
+                    "sync_aggregate": {"sync_committee_bits": b, "sync_committee_signature": None},
+                },
+            }
+        )
+        for slot, b in zip((10, 11), bits)
+    ]
+    sync_aggregate = blocks[1].body.sync_aggregate
+    assert sync_aggregate.participation_count == 2
+    assert sync_aggregate.participation_rate == 2 / 512
+    assert list(sync_aggregate.participants) == [0, 2]
+
+    # NOTE: Phase 0 blocks have no sync aggregate
+    blocks.append(
+        beacon.decode_block({"slot": "12", "body": {"eth1_data": {"deposit_count": "1"}}})
+    )
+    slots, participation = sync_participation_matrix(blocks)
+    assert list(slots) == [10, 11, 12]
+    assert participation.shape == (3, 512)
+    assert list(participation.sum(axis=1)) == [512, 2, 0]
+
+
+@pytest.mark.parametrize("trusted", (False, True))
+def test_decode_block_computes_root(beacon, trusted):
+    genesis = {
+        "slot": "0",
+        "proposer_index": "0",
+        "parent_root": "0x" + "00" * 32,
+        "state_root": "0x7e76880eb67bbdc86250aa578958e9d0675e64e714337855204fb5abaaf82c2b",
+        "body": {
+            "randao_reveal": "0x" + "00" * 96,
+            "eth1_data": {
+                "deposit_root": "0x" + "00" * 32,
+                "deposit_count": "0",
+                "block_hash": "0x" + "00" * 32,
+            },
+            "graffiti": "0x" + "00" * 32,
+            "proposer_slashings": [],
+            "attester_slashings": [],
+            "attestations": [],
+            "deposits": [],
+            "voluntary_exits": [],
+        },
+    }
+    block = beacon.decode_block(deepcopy(genesis), trusted=trusted, compute_root=True)
+    assert block.root.hex().endswith(
+        "4d611d5b93fdab69013a7f0a2f961caca0c853f87cfe9595fe50038163079360"
+    )
+    assert beacon.decode_block(deepcopy(genesis), trusted=trusted).root is None
+
+    child = deepcopy(genesis)
+    child.update(slot="2", parent_root=block.root.hex())
+    orphan = deepcopy(genesis)
+    orphan.update(slot="3", parent_root="0x" + "ff" * 32)
+    blocks = [
+        beacon.decode_block(deepcopy(data), trusted=trusted, compute_root=True)
+        for data in (genesis, child, orphan)
+    ]
+    assert beacon.verify_parent_roots(blocks[:2]) == []
+    assert beacon.verify_parent_roots(blocks) == [3]
@@ -0,0 +1,72 @@
+import pytest
+
+from ape_beacon.containers import SyncAggregate
+from ape_beacon.epochs import EpochSummary
+from ape_beacon.types import SLOTS_PER_EPOCH
+
+
+@pytest.fixture(scope="module")
+def provider(configured_beacon_test_provider):
+    # NOTE: Every slot of the first two epochs but slot 1 is missed
+    for slot in range(2 * SLOTS_PER_EPOCH):
+        if slot not in (1, 2):
+            configured_beacon_test_provider.beacon_backend.get(
+                f"{configured_beacon_test_provider.uri}/eth/v2/beacon/blocks/{slot}",
+                json={"code": 404, "message": "Block not found"},
+                status=404,
+            )
+
+    # NOTE: A head past both epochs, as if streaming
+    configured_beacon_test_provider._subscribed = True
+    configured_beacon_test_provider._head_slot = 2 * SLOTS_PER_EPOCH + 5
+    yield configured_beacon_test_provider
+    configured_beacon_test_provider._subscribed = False
+    configured_beacon_test_provider._head_slot = None
+
+
+def test_from_blocks(provider):
+    block = provider.get_block(1)
+    sync_aggregate = SyncAggregate(sync_committee_bits=b"\x0f" * 64, sync_committee_signature=None)
+    body = block.body.copy(update={"sync_aggregate": sync_aggregate})
+    blocks = [block, block.copy(update={"number": 5, "body": body})]
+
+    summary = EpochSummary.from_blocks(0, blocks)
+    assert summary.num_proposed == 2
+    assert summary.num_missed == SLOTS_PER_EPOCH - 2
+    assert 1 not in summary.missed_slots and 5 not in summary.missed_slots
+    assert summary.num_attestations == 2 * block.body.num_attestations
+    assert summary.sync_participants == 256
+    assert summary.sync_participation_rate == 0.5
+
+    with pytest.raises(ValueError):
+        EpochSummary.from_blocks(1, blocks)
+
+    summary = EpochSummary.from_blocks(0, blocks, head_slot=6)
+    assert summary.missed_slots == (0, 2, 3, 4, 6)
+
+
+def test_get_epoch_summary(provider):
+    summary = provider.get_epoch_summary(0)
+    assert summary == EpochSummary.from_blocks(0, [provider.get_block(1)])
+    assert summary.missed_slots == (0, *range(2, SLOTS_PER_EPOCH))
+
+
+def test_get_epoch_summary_stops_at_head(provider):
+    provider._head_slot = SLOTS_PER_EPOCH + 3
+    try:
+        summary = provider.get_epoch_summary(1)
+        assert summary.missed_slots == tuple(range(SLOTS_PER_EPOCH, SLOTS_PER_EPOCH + 4))
+        actual = list(provider.iter_epoch_summaries(0, 2))
+        assert [summary.epoch for summary in actual] == [0, 1]
+        assert actual[1] == summary
+    finally:
+        provider._head_slot = 2 * SLOTS_PER_EPOCH + 5
+
+
+def test_iter_epoch_summaries(provider):
+    actual = list(provider.iter_epoch_summaries(0, 1, concurrency=4))
+    assert [summary.epoch for summary in actual] == [0, 1]
+    assert actual[0] == provider.get_epoch_summary(0)
+    assert actual[1].num_proposed == 0
+    assert actual[1].missed_slots == tuple(range(SLOTS_PER_EPOCH, 2 * SLOTS_PER_EPOCH))
+    assert actual[1].sync_participation_rate == 0.0
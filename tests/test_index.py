@@ -0,0 +1,169 @@
+import copy
+
+import pytest
+from ape.exceptions import BlockNotFoundError
+from hexbytes import HexBytes
+
+from ape_beacon.index import Reorg, SlotIndex
+from ape_beacon.ssz import compute_block_root
+
+
+def _root(name: str) -> bytes:
+    return name.encode().ljust(32, b"\x00")
+
+
+@pytest.fixture
+def index():
+    # NOTE: a <- b <- c <- d at slots 10 through 13
+    index = SlotIndex(finalized_slot=10)
+    for slot, name, parent in ((10, "a", "z"), (11, "b", "a"), (12, "c", "b"), (13, "d", "c")):
+        assert index.add(slot, _root(name), _root(parent)) is None
+
+    return index
+
+
+def test_add(index):
+    assert len(index) == 4
+    assert index.get_root(12) == HexBytes(_root("c"))
+    assert index.is_canonical(_root("c"))
+    assert _root("z") not in index
+
+    # NOTE: Blocks may be added out of order, e.g. by concurrent fetches
+    assert index.add(15, _root("f"), _root("e")) is None
+    assert index.add(14, _root("e"), _root("d")) is None
+
+
+def test_add_reveals_skipped_slots(index):
+    reorgs = []
+    index.subscribe(reorgs.append)
+
+    reorg = index.add(14, _root("e"), _root("b"))
+    assert reorg == Reorg(12, (12, 13), (14,))
+    assert reorgs == [reorg]
+    assert index.get_root(12) is None
+    assert not index.is_canonical(_root("d"))
+
+    # NOTE: The orphaned fork is restored if the chain switches back to it
+    reorg = index.add(15, _root("f"), _root("d"))
+    assert reorg == Reorg(12, (14,), (12, 13, 15))
+    assert index.get_root(12) == HexBytes(_root("c"))
+
+    index.unsubscribe(reorgs.append)
+    index.add(16, _root("g"), _root("a"))
+    assert len(reorgs) == 2
+
+
+def test_add_replaces_slot(index):
+    # NOTE: Blocks above that built on the replaced block are reverted too
+    reorg = index.add(12, _root("x"), _root("b"))
+    assert reorg == Reorg(12, (12, 13), (12,))
+    assert index.get_root(13) is None
+
+
+def test_reorg(index):
+    assert index.reorg(13, 2, new_head_root=_root("d")) is None
+
+    reorg = index.reorg(13, 2, new_head_root=_root("y"))
+    assert reorg == Reorg(12, (12, 13), (12, 13))
+    assert len(index) == 2
+
+
+def test_tip(index):
+    assert index.tip == (13, HexBytes(_root("d")))
+    index.add(14, _root("e"), _root("b"))
+    assert index.tip == (14, HexBytes(_root("e")))
+    index.clear()
+    assert index.tip is None
+
+
+def test_finalize(index):
+    index.finalize(12)
+    assert len(index) == 2
+    assert _root("b") not in index
+    assert index.add(11, _root("x"), _root("a")) is None
+    assert index.get_root(11) is None
+
+
+@pytest.fixture
+def provider(configured_beacon_test_provider):
+    configured_beacon_test_provider.block_cache.clear()
+    configured_beacon_test_provider.provider_settings["track_reorgs"] = True
+    yield configured_beacon_test_provider
+    configured_beacon_test_provider.provider_settings.pop("track_reorgs")
+    configured_beacon_test_provider.slot_index.clear()
+
+
+def _add_block(provider, slot: int, parent_root: bytes, graffiti: str = "00") -> bytes:
+    block = copy.deepcopy(provider.beacon.get_block("1"))
+    message = block["data"]["message"]
+    message["body"].pop("execution_payload")  # NOTE: A complete phase0 body
+    message["body"]["graffiti"] = "0x" + graffiti * 32
+    message.update(slot=str(slot), parent_root="0x" + parent_root.hex())
+    root = compute_block_root(message)
+    for block_id in (slot, "0x" + root.hex()):
+        url = f"{provider.uri}/eth/v2/beacon/blocks/{block_id}"
+        provider.beacon_backend.upsert("GET", url, json=block)
+
+    return root
+
+
+def test_provider_detects_reorg(provider):
+    reorgs = []
+    provider.slot_index.subscribe(reorgs.append)
+    root_10 = _add_block(provider, 10, _root("z"))
+    root_11 = _add_block(provider, 11, root_10)
+    provider.get_block(10)
+    provider.get_block(11)
+    assert provider.slot_index.get_root(11) == HexBytes(root_11)
+    assert provider.block_cache.get(HexBytes(root_11).hex()) is not None
+
+    # NOTE: Slot 12 builds on slot 10, so the cached slot 11 block was orphaned
+    _add_block(provider, 12, root_10)
+    provider.beacon_backend.upsert(
+        "GET", f"{provider.uri}/eth/v2/beacon/blocks/11", json={"code": 404}, status=404
+    )
+    provider.get_block(12)
+    assert reorgs == [Reorg(11, (11,), (12,))]
+    with pytest.raises(BlockNotFoundError):
+        provider.get_block(11)
+
+    provider._handle_chain_event("chain_reorg", {"slot": "12", "depth": "1"}, None)
+    assert reorgs[-1] == Reorg(12, (12,), (12,))
+    assert provider.block_cache.get(12) is None
+    assert provider.block_cache.get(10) is not None
+    provider.slot_index.unsubscribe(reorgs.append)
+
+
+def test_provider_indexes_only_canonical_blocks(provider):
+    root_10 = _add_block(provider, 10, _root("z"))
+    sibling_11 = _add_block(provider, 11, _root("y"), graffiti="11")
+    root_11 = _add_block(provider, 11, root_10)
+
+    # NOTE: A sibling fetched by root isn't known to be canonical, a child of the tip is
+    provider.get_block(10)
+    provider.get_block("0x" + sibling_11.hex())
+    assert sibling_11 not in provider.slot_index
+    provider.get_block("0x" + root_11.hex())
+    assert provider.slot_index.get_root(11) == HexBytes(root_11)
+
+
+def test_provider_skips_hashing_unless_tracking_reorgs(provider):
+    provider.provider_settings["track_reorgs"] = False
+    _add_block(provider, 10, _root("z"))
+    provider.get_block(10)
+    assert len(provider.slot_index) == 0
+
+
+def test_provider_seeds_index_from_head(provider):
+    provider.provider_settings["track_reorgs"] = False
+    root_10 = _add_block(provider, 10, _root("z"))
+    root_11 = _add_block(provider, 11, root_10)
+    head = copy.deepcopy(provider.beacon.get_block("10"))
+    provider.beacon_backend.upsert("GET", f"{provider.uri}/eth/v2/beacon/blocks/head", json=head)
+
+    # NOTE: Without tracking reorgs, only the first head is hashed to seed the index
+    provider.get_block("head")
+    assert provider.slot_index.tip == (10, HexBytes(root_10))
+    provider.get_block("0x" + root_11.hex())
+    assert provider.slot_index.get_root(11) == HexBytes(root_11)
+    assert provider.block_cache.get(11) is not None
@@ -0,0 +1,297 @@
+from hashlib import sha256
+
+import numpy as np
+import pytest
+from hexbytes import HexBytes
+from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primitives import G1_to_pubkey
+from py_ecc.optimized_bls12_381 import G1, curve_order, multiply
+
+from ape_beacon import ssz
+from ape_beacon.exceptions import LightClientError
+from ape_beacon.light_client import (
+    LightClientStore,
+    SignatureCheck,
+    SyncCommittee,
+    compute_signing_root,
+    verify_signatures,
+)
+from ape_beacon.types import SLOTS_PER_EPOCH, SYNC_COMMITTEE_SIZE
+
+GENESIS_VALIDATORS_ROOT = bytes.fromhex("11" * 32)
+FORK_SCHEDULE = [(0, bytes.fromhex("00000000")), (100, bytes.fromhex("01000000"))]
+
+# NOTE: A few keys repeated across the committee keeps signing cheap
+CURRENT_KEYS = (1, 2, 3, 4)
+NEXT_KEYS = (5, 6, 7, 8)
+
+
+def _committee(keys):
+    secret_keys = [keys[i % len(keys)] for i in range(SYNC_COMMITTEE_SIZE)]
+    pubkeys = {key: G2ProofOfPossession.SkToPk(key) for key in keys}
+    aggregate = G1_to_pubkey(multiply(G1, sum(secret_keys) % curve_order))
+    data = {
+        "pubkeys": ["0x" + pubkeys[key].hex() for key in secret_keys],
+        "aggregate_pubkey": "0x" + aggregate.hex(),
+    }
+    return secret_keys, data
+
+
+def _state(
+    current_committee, next_committee, finalized_epoch=0, finalized_root=bytes(32), num_leaves=32
+):
+    # NOTE: Only the fields proven by light client data are real, the rest is filler
+    leaves = [sha256(bytes([i])).digest() for i in range(num_leaves)]
+    epoch_chunk = finalized_epoch.to_bytes(32, "little")
+    leaves[20] = sha256(epoch_chunk + finalized_root).digest()
+    leaves[22] = ssz.SyncCommittee.hash_tree_root(current_committee)
+    leaves[23] = ssz.SyncCommittee.hash_tree_root(next_committee)
+    chunks = b"".join(leaves)
+    return ssz.merkleize(chunks), chunks, epoch_chunk
+
+
+def _header(slot, state_root):
+    return {
+        "slot": str(slot),
+        "proposer_index": str(slot % 7),
+        "parent_root": "0x" + sha256(slot.to_bytes(8, "little")).hexdigest(),
+        "state_root": "0x" + state_root.hex(),
+        "body_root": "0x" + "22" * 32,
+    }
+
+
+def _root(header):
+    return ssz.BeaconBlockHeader.hash_tree_root(header)
+
+
+def _hex(branch):
+    return ["0x" + node.hex() for node in branch]
+
+
+def _sign(secret_keys, participants, attested_header, signature_slot):
+    bits = np.zeros(SYNC_COMMITTEE_SIZE, dtype=bool)
+    bits[:participants] = True
+    fork_version = bytes.fromhex("01000000") if signature_slot > 100 * SLOTS_PER_EPOCH else bytes(4)
+    signing_root = compute_signing_root(
+        _root(attested_header), fork_version, GENESIS_VALIDATORS_ROOT
+    )
+    secret_key = sum(secret_keys[:participants]) % curve_order
+    return {
+        "sync_committee_bits": "0x" + np.packbits(bits, bitorder="little").tobytes().hex(),
+        "sync_committee_signature": "0x" + G2ProofOfPossession.Sign(secret_key, signing_root).hex(),
+    }
+
+
+@pytest.fixture(scope="module")
+def chain():
+    """
+    Light client data for a bootstrap in sync committee period 0, the update for
+    period 0 handing over to the next committee, and finality and optimistic
+    updates signed by that committee in period 1.
+    """
+    current_keys, current_committee = _committee(CURRENT_KEYS)
+    next_keys, next_committee = _committee(NEXT_KEYS)
+
+    state_root, chunks, _ = _state(current_committee, next_committee)
+    bootstrap_header = _header(3200, state_root)
+    bootstrap = {
+        "header": {"beacon": bootstrap_header},
+        "current_sync_committee": current_committee,
+        "current_sync_committee_branch": _hex(ssz.merkle_branch(chunks, 22)),
+    }
+
+    finalized_header = _header(8064, state_root)
+    state_root, chunks, epoch_chunk = _state(
+        current_committee, next_committee, 252, _root(finalized_header)
+    )
+    attested_header = _header(8100, state_root)
+    update = {
+        "attested_header": {"beacon": attested_header},
+        "next_sync_committee": next_committee,
+        "next_sync_committee_branch": _hex(ssz.merkle_branch(chunks, 23)),
+        "finalized_header": {"beacon": finalized_header},
+        "finality_branch": _hex([epoch_chunk] + ssz.merkle_branch(chunks, 20)),
+        "sync_aggregate": _sign(current_keys, SYNC_COMMITTEE_SIZE, attested_header, 8101),
+        "signature_slot": "8101",
+    }
+
+    finalized_header = _header(8224, state_root)
+    state_root, chunks, epoch_chunk = _state(
+        next_committee, current_committee, 257, _root(finalized_header)
+    )
+    attested_header = _header(8300, state_root)
+    finality_update = {
+        "attested_header": {"beacon": attested_header},
+        "finalized_header": {"beacon": finalized_header},
+        "finality_branch": _hex([epoch_chunk] + ssz.merkle_branch(chunks, 20)),
+        "sync_aggregate": _sign(next_keys, 400, attested_header, 8301),
+        "signature_slot": "8301",
+    }
+
+    attested_header = _header(8310, state_root)
+    optimistic_update = {
+        "attested_header": {"beacon": attested_header},
+        "sync_aggregate": _sign(next_keys, 300, attested_header, 8311),
+        "signature_slot": "8311",
+    }
+    weak_update = {
+        "attested_header": {"beacon": attested_header},
+        "sync_aggregate": _sign(next_keys, 1, attested_header, 8311),
+        "signature_slot": "8311",
+    }
+    return {
+        "trusted_root": _root(bootstrap_header),
+        "bootstrap": bootstrap,
+        "updates": [update],
+        "finality_update": finality_update,
+        "optimistic_update": optimistic_update,
+        "weak_update": weak_update,
+    }
+
+
+def _bootstrap(chain):
+    return LightClientStore.bootstrap(
+        chain["bootstrap"], chain["trusted_root"], GENESIS_VALIDATORS_ROOT, FORK_SCHEDULE
+    )
+
+
+def test_light_client_store(chain):
+    store = _bootstrap(chain)
+    assert store.finalized_header.slot == 3200
+    assert store.finalized_header.root == chain["trusted_root"]
+    assert store.period == 0
+
+    store.process_updates(chain["updates"] + [chain["finality_update"], chain["optimistic_update"]])
+    assert store.finalized_header.slot == 8224
+    assert store.optimistic_header.slot == 8310
+    assert store.period == 1
+    assert store.current_sync_committee.pubkeys[0] == G2ProofOfPossession.SkToPk(NEXT_KEYS[0])
+    assert store.next_sync_committee is None
+
+
+def test_process_updates_safety_threshold(chain):
+    store = _bootstrap(chain)
+    store.process_updates(chain["updates"] + [chain["finality_update"]])
+    assert store.safety_threshold == SYNC_COMMITTEE_SIZE // 2
+
+    # NOTE: A single member's signature is valid but can't move the optimistic header
+    store.process_updates([chain["weak_update"]])
+    assert store.optimistic_header.slot == 8300
+    assert store.current_max_active_participants == 1
+
+
+def test_bootstrap_electra():
+    # NOTE: The electra state has 64 leaves, so its branches are one node longer
+    _, committee = _committee(CURRENT_KEYS)
+    state_root, chunks, _ = _state(committee, committee, num_leaves=64)
+    header = _header(3200, state_root)
+    data = {
+        "header": {"beacon": header},
+        "current_sync_committee": committee,
+        "current_sync_committee_branch": _hex(ssz.merkle_branch(chunks, 22)),
+    }
+    store = LightClientStore.bootstrap(data, _root(header), GENESIS_VALIDATORS_ROOT, FORK_SCHEDULE)
+    assert store.current_sync_committee.root == ssz.SyncCommittee.hash_tree_root(committee)
+
+
+def test_bootstrap_untrusted_root(chain):
+    with pytest.raises(LightClientError):
+        LightClientStore.bootstrap(
+            chain["bootstrap"], bytes(32), GENESIS_VALIDATORS_ROOT, FORK_SCHEDULE
+        )
+
+
+def test_process_updates_invalid_branch(chain):
+    store = _bootstrap(chain)
+    branch = chain["updates"][0]["finality_branch"]
+    update = dict(chain["updates"][0], finality_branch=["0x" + "00" * 32] + branch[1:])
+    with pytest.raises(LightClientError, match="Invalid finalized header branch"):
+        store.process_updates([update])
+
+    update = dict(chain["updates"][0], finality_branch=branch[1:])
+    with pytest.raises(LightClientError, match="Unsupported fork"):
+        store.process_updates([update])
+
+
+def test_process_updates_invalid_signature(chain):
+    store = _bootstrap(chain)
+    optimistic_update = chain["optimistic_update"]
+    finality_update = dict(
+        chain["finality_update"], sync_aggregate=optimistic_update["sync_aggregate"]
+    )
+    with pytest.raises(LightClientError, match="signature"):
+        store.process_updates(chain["updates"] + [finality_update])
+
+    # NOTE: None of the batch is applied
+    assert store.finalized_header.slot == 3200
+    assert store.next_sync_committee is None
+
+
+def test_sync_committee_aggregate():
+    _, data = _committee(CURRENT_KEYS)
+    committee = SyncCommittee.from_response(data)
+    bits = np.ones(SYNC_COMMITTEE_SIZE, dtype=bool)
+    aggregate = G1_to_pubkey(committee.aggregate(bits))
+    assert aggregate == HexBytes(data["aggregate_pubkey"])
+
+    bits[:500] = False
+    aggregate = G1_to_pubkey(committee.aggregate(bits))
+    secret_key = sum(CURRENT_KEYS[i % 4] for i in range(500, SYNC_COMMITTEE_SIZE))
+    assert aggregate == G2ProofOfPossession.SkToPk(secret_key)
+
+
+def test_verify_signatures():
+    pubkey = multiply(G1, 3)
+    checks = [
+        SignatureCheck(pubkey, message, G2ProofOfPossession.Sign(3, message))
+        for message in (b"\x01" * 32, b"\x02" * 32)
+    ]
+    assert verify_signatures(checks)
+    assert verify_signatures([])
+
+    swapped = [checks[0]._replace(signature=checks[1].signature)]
+    assert not verify_signatures(swapped + checks[1:])
+
+
+def test_provider_light_client(configured_beacon_test_provider, chain):
+    provider = configured_beacon_test_provider
+    backend, uri = provider.beacon_backend, provider.uri
+    trusted_root = "0x" + chain["trusted_root"].hex()
+    backend.get(
+        f"{uri}/eth/v1/beacon/light_client/bootstrap/{trusted_root}",
+        json={"version": "deneb", "data": chain["bootstrap"]},
+    )
+    backend.get(
+        f"{uri}/eth/v1/beacon/genesis",
+        json={"data": {"genesis_validators_root": "0x" + GENESIS_VALIDATORS_ROOT.hex()}},
+    )
+    backend.get(
+        f"{uri}/eth/v1/config/fork_schedule",
+        json={
+            "data": [
+                {"epoch": str(epoch), "current_version": "0x" + version.hex()}
+                for epoch, version in FORK_SCHEDULE
+            ]
+        },
+    )
+    backend.get(
+        f"{uri}/eth/v1/beacon/light_client/updates?start_period=0&count=128",
+        json=[{"version": "deneb", "data": update} for update in chain["updates"]],
+    )
+    backend.get(f"{uri}/eth/v1/beacon/light_client/finality_update", status=404)
+    backend.get(
+        f"{uri}/eth/v1/beacon/light_client/optimistic_update",
+        json={"version": "deneb", "data": chain["optimistic_update"]},
+    )
+
+    with pytest.raises(LightClientError):
+        provider.update_light_client()
+
+    store = provider.start_light_client(trusted_root)
+    assert provider.light_client is store
+
+    # NOTE: The optimistic update is signed in the next period, once handed over
+    provider.update_light_client()
+    assert store.finalized_header.slot == 8064
+    assert store.optimistic_header.slot == 8310
+    assert store.next_sync_committee is not None
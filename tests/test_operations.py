@@ -0,0 +1,74 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+
+def _attestation(slot: int, index: int, bits: str):
+    checkpoint = {"epoch": "0", "root": "0x" + "00" * 32}
+    return {
+        "aggregation_bits": bits,
+        "data": {
+            "slot": str(slot),
+            "index": str(index),
+            "beacon_block_root": "0x" + "ab" * 32,
+            "source": checkpoint,
+            "target": dict(checkpoint, epoch="1"),
+        },
+        "signature": "0x" + "00" * 96,
+    }
+
+
+BLOCK_DATA = {
+    "slot": "40",
+    "proposer_index": "210",
+    "body": {
+        "eth1_data": {"deposit_count": "1"},
+        "attestations": [
+            # NOTE: committee of 10, bits 0, 2 and 9 set, then 2 and 9 set
+            _attestation(38, 1, "0x0506"),
+            _attestation(38, 1, "0x0406"),
+            # NOTE: committee of 3, bit 1 set
+            _attestation(39, 0, "0x0a"),
+        ],
+        "deposits": [{"proof": [], "data": {"pubkey": "0x" + "11" * 48, "amount": "32"}}],
+        "voluntary_exits": [{"message": {"epoch": "1", "validator_index": "7"}}],
+        "proposer_slashings": [{"signed_header_1": {"message": {"proposer_index": "9"}}}],
+        "attester_slashings": [
+            {
+                "attestation_1": {"attesting_indices": ["1", "2", "3"]},
+                "attestation_2": {"attesting_indices": ["2", "3", "4"]},
+            }
+        ],
+    },
+}
+
+
+@pytest.mark.parametrize("trusted", (False, True))
+def test_decode_block_keeps_operations(beacon, trusted):
+    block = beacon.decode_block(deepcopy(BLOCK_DATA), trusted=trusted, keep_operations=True)
+    assert block.body.num_attestations == 3
+
+    operations = block.body.operations
+    assert list(operations.deposit_amount) == [32]
+    assert list(operations.exit_validator_index) == [7]
+    assert list(operations.proposer_slashed_index) == [9]
+    assert list(operations.attester_slashed_index) == [2, 3]
+
+    attestations = operations.attestations
+    assert len(attestations) == 3
+    assert list(attestations.inclusion_delay) == [2, 2, 1]
+    assert list(attestations.bits_length) == [10, 10, 3]
+    assert list(attestations.participation()) == [3, 2, 1]
+    assert list(np.flatnonzero(attestations.aggregation_bits(1))) == [2, 9]
+
+    slot, index, participants, size = attestations.committee_participation()
+    assert list(slot) == [38, 39]
+    assert list(index) == [1, 0]
+    assert list(participants) == [3, 1]
+    assert list(size) == [10, 3]
+
+
+def test_decode_block_drops_operations_by_default(beacon):
+    block = beacon.decode_block(deepcopy(BLOCK_DATA), trusted=True)
+    assert block.body.operations is None
@@ -1,9 +1,13 @@
 import pytest
 import requests
-from ape.exceptions import BlockNotFoundError, ProviderNotConnectedError
+from ape.exceptions import BlockNotFoundError, ProviderError, ProviderNotConnectedError
 from eth_typing import HexStr
+from web3.beacon import Beacon
 
-from ape_beacon.exceptions import ValidatorNotFoundError
+from ape_beacon.client import BeaconClient
+from ape_beacon.exceptions import BeaconRequestError, ValidatorNotFoundError
+
+from .helpers.mock.provider import VALIDATORS  # type: ignore
 
 
 def test_beacon(beacon_test_provider):
@@ -18,6 +22,18 @@ def test_beacon(beacon_test_provider):
         beacon_test_provider.beacon
 
 
+def test_beacon_upgrades_plain_beacon(beacon_test_provider, monkeypatch):
+    monkeypatch.setattr(beacon_test_provider, "_beacon", Beacon("http://localhost:5051"))
+    actual = beacon_test_provider.beacon
+    assert isinstance(actual, BeaconClient)
+    assert actual.base_url == "http://localhost:5051"
+    assert beacon_test_provider.beacon is actual
+
+    monkeypatch.setattr(beacon_test_provider, "_beacon", object())
+    with pytest.raises(ProviderError, match="BeaconClient"):
+        beacon_test_provider.beacon
+
+
 def test_is_connected(beacon_test_provider):
     # before connected
     actual = beacon_test_provider.is_connected
@@ -53,12 +69,18 @@ def test_get_block(configured_beacon_test_provider, block_id):
     assert actual == expect
 
 
-@pytest.mark.parametrize("block_id", ("s", 2, -1))
+@pytest.mark.parametrize("block_id", ("s", 2))
 def test_get_block_raises_when_not_exists(configured_beacon_test_provider, block_id):
     with pytest.raises(BlockNotFoundError):
         configured_beacon_test_provider.get_block(block_id)
 
 
+def test_get_block_raises_when_request_fails(configured_beacon_test_provider):
+    # NOTE: A server error must not be mistaken for a missed slot
+    with pytest.raises(BeaconRequestError):
+        configured_beacon_test_provider.get_block(-1)
+
+
 @pytest.mark.parametrize(
     "validator_id",
     (
@@ -77,12 +99,17 @@ def test_get_balance(configured_beacon_test_provider, validator_id):
     assert actual == expect
 
 
-@pytest.mark.parametrize("validator_id", ("s", "2", "-1"))
+@pytest.mark.parametrize("validator_id", ("s", "2"))
 def test_get_balance_raises_when_not_exists(configured_beacon_test_provider, validator_id):
     with pytest.raises(ValidatorNotFoundError):
         configured_beacon_test_provider.get_balance(validator_id)
 
 
+def test_get_balance_raises_when_request_fails(configured_beacon_test_provider):
+    with pytest.raises(BeaconRequestError):
+        configured_beacon_test_provider.get_balance("-1")
+
+
 def test_block_ranges_when_stop_not_none(configured_beacon_test_provider):
     expect = [(0, 1), (2, 3), (4, 5)]
     actual = [
@@ -93,3 +120,142 @@ def test_block_ranges_when_stop_not_none(configured_beacon_test_provider):
 
 
 # TODO: test_block_ranges with chain height when fix test network provider
+
+
+@pytest.mark.parametrize("concurrency", (1, 4))
+def test_get_blocks(configured_beacon_test_provider, concurrency):
+    # NOTE: slot 2 is a missed slot in the mock backend
+    actual = list(configured_beacon_test_provider.get_blocks(1, 2, concurrency=concurrency))
+    expect = [configured_beacon_test_provider.get_block(1)]
+    assert actual == expect
+
+
+def test_get_blocks_raises_when_concurrency_invalid(configured_beacon_test_provider):
+    with pytest.raises(ValueError):
+        list(configured_beacon_test_provider.get_blocks(1, 2, concurrency=0))
+
+
+def test_get_block_header(configured_beacon_test_provider):
+    actual = configured_beacon_test_provider.get_block_header(1)
+    expect = configured_beacon_test_provider.get_block(1)
+    assert actual.slot == expect.number
+    assert actual.proposer_index == expect.proposer_index
+    assert actual.parent_root == expect.parent_hash
+    assert actual.state_root == expect.hash
+    assert actual.canonical
+
+    with pytest.raises(BlockNotFoundError):
+        configured_beacon_test_provider.get_block_header(2)
+
+
+def test_get_block_headers(configured_beacon_test_provider):
+    expect = configured_beacon_test_provider.get_block_header(1)
+    assert configured_beacon_test_provider.get_block_headers(slot=1) == [expect]
+    assert configured_beacon_test_provider.get_block_headers(slot=2) == []
+
+    actual = configured_beacon_test_provider.get_block_headers(parent_root=expect.parent_root)
+    assert actual == [expect]
+
+
+def test_iter_block_headers(configured_beacon_test_provider):
+    # NOTE: slot 2 is a missed slot in the mock backend
+    actual = list(configured_beacon_test_provider.iter_block_headers(1, 2))
+    assert actual == [configured_beacon_test_provider.get_block_header(1)]
+
+
+def test_get_validators(configured_beacon_test_provider):
+    pubkey = VALIDATORS["110280"]
+    actual = configured_beacon_test_provider.get_validators(["110280", pubkey, "2"])
+    assert actual["2"] is None
+    assert actual["110280"] == actual[pubkey]
+    assert actual["110280"].validator_index == 110280
+    assert actual["110280"].balance == 32000000000
+    assert actual["110280"].status == "active_ongoing"
+
+
+def test_get_balances(configured_beacon_test_provider):
+    pubkey = VALIDATORS["110280"]
+    actual = configured_beacon_test_provider.get_balances(["110280", "2"])
+    assert actual == {"110280": 32000000000, "2": None}
+
+    actual = configured_beacon_test_provider.get_balances([pubkey, "2"])
+    assert actual == {pubkey: 32000000000, "2": None}
+
+
+def test_stream_blocks(configured_beacon_test_provider):
+    events = (
+        ": keep-alive\n\n"
+        'event: finalized_checkpoint\ndata: {"epoch": "0", "block": "0x00"}\n\n'
+        'event: head\ndata: {"slot": "1", "block": "0x00"}\n\n'
+    )
+    configured_beacon_test_provider.beacon_backend.get(
+        configured_beacon_test_provider.uri + "/eth/v1/events",
+        body=events,
+        content_type="text/event-stream",
+    )
+    stream = configured_beacon_test_provider.stream_blocks()
+    actual = next(stream)
+    assert actual == configured_beacon_test_provider.get_block(1)
+    assert configured_beacon_test_provider.get_block("head") is actual
+
+    stream.close()
+    assert not configured_beacon_test_provider._subscribed
+
+
+def test_stream_blocks_reconnects_only_on_server_errors(configured_beacon_test_provider):
+    backend = configured_beacon_test_provider.beacon_backend
+    url = configured_beacon_test_provider.uri + "/eth/v1/events"
+    backend.remove("GET", url)
+    backend.get(url, status=500)
+    backend.get(url, body='event: head\ndata: {"slot": "1"}\n\n', content_type="text/event-stream")
+    stream = configured_beacon_test_provider.stream_blocks(reconnect_delay=0)
+    assert next(stream) == configured_beacon_test_provider.get_block(1)
+    stream.close()
+
+    backend.upsert("GET", url, status=401)
+    with pytest.raises(BeaconRequestError):
+        next(configured_beacon_test_provider.stream_blocks(reconnect_delay=0))
+
+
+def test_stream_blocks_resumes_after_server_error_filling_slots(configured_beacon_test_provider):
+    provider = configured_beacon_test_provider
+    backend = provider.beacon_backend
+    events_url = provider.uri + "/eth/v1/events"
+    block_url = provider.uri + "/eth/v2/beacon/blocks/1"
+    expect = provider.get_block(1)
+    provider.block_cache.clear()
+    backend.remove("GET", events_url)
+    for _ in range(2):
+        backend.get(
+            events_url,
+            body='event: head\ndata: {"slot": "1"}\n\n',
+            content_type="text/event-stream",
+        )
+
+    registered = [r for r in backend.registered() if r.url == block_url]
+    backend.remove("GET", block_url)
+    backend.get(block_url, status=500)
+    for response in registered:
+        backend.add(response)
+
+    stream = provider.stream_blocks(reconnect_delay=0)
+    assert next(stream) == expect
+    stream.close()
+
+
+def test_is_connected_uses_cached_health(configured_beacon_test_provider):
+    health_url = configured_beacon_test_provider.uri + "/eth/v1/node/health"
+    calls = configured_beacon_test_provider.beacon_backend.calls
+
+    configured_beacon_test_provider.get_balance("110280")
+    num_calls = len(calls)
+    assert configured_beacon_test_provider.is_connected
+    assert len(calls) == num_calls
+
+    assert configured_beacon_test_provider.refresh_health()
+    assert calls[-1].request.url == health_url
+
+
+def test_get_randao_mix(configured_beacon_test_provider):
+    actual = configured_beacon_test_provider.get_randao_mix(0)
+    assert actual == bytes.fromhex("42" * 32)
@@ -0,0 +1,53 @@
+import pytest
+from ape.api.query import BlockQuery
+
+from ape_beacon.query import BeaconQueryEngine
+
+
+@pytest.fixture
+def engine(networks, configured_beacon_test_provider, monkeypatch):
+    monkeypatch.setattr(networks, "active_provider", configured_beacon_test_provider)
+    configured_beacon_test_provider.block_cache.clear()
+    return BeaconQueryEngine()
+
+
+def test_registered(chain):
+    assert isinstance(chain.query_manager.engines["beacon"], BeaconQueryEngine)
+
+
+def test_estimate_query(engine, configured_beacon_test_provider):
+    query = BlockQuery(columns=["number", "timestamp"], start_block=1, stop_block=16)
+    remote = engine.estimate_query(query)
+    assert remote < 16 * 100  # NOTE: Less than ape's default estimate of one request per slot
+
+    configured_beacon_test_provider.get_block(1)
+    assert engine.estimate_query(query) <= remote
+
+    header_query = BlockQuery(columns=["number", "hash"], start_block=1, stop_block=16)
+    assert engine.estimate_query(header_query) < remote
+
+
+def test_estimate_query_when_not_beacon_provider(engine, networks, monkeypatch):
+    monkeypatch.setattr(networks, "active_provider", None)
+    query = BlockQuery(columns=["number"], start_block=1, stop_block=2)
+    assert engine.estimate_query(query) is None
+
+
+def test_perform_query(engine, configured_beacon_test_provider):
+    # NOTE: slot 2 is a missed slot in the mock backend
+    query = BlockQuery(columns=["number", "timestamp"], start_block=1, stop_block=2)
+    actual = list(engine.perform_query(query))
+    assert actual == [configured_beacon_test_provider.get_block(1)]
+
+
+def test_perform_query_headers_only(engine, configured_beacon_test_provider):
+    query = BlockQuery(columns=["number", "hash", "parent_hash"], start_block=1, stop_block=2)
+    actual = list(engine.perform_query(query))
+    assert len(actual) == 1
+    assert len(configured_beacon_test_provider.block_cache) == 0  # NOTE: No full block fetched
+
+    expect = configured_beacon_test_provider.get_block(1)
+    assert actual[0].number == expect.number
+    assert actual[0].hash == expect.hash
+    assert actual[0].parent_hash == expect.parent_hash
+    assert actual[0].proposer_index == expect.proposer_index
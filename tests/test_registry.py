@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from ape_beacon.registry import ValidatorRegistry
+
+from .helpers.mock.provider import VALIDATORS  # type: ignore
+
+
+def _item(index: int, balance: int, status: str = "active_ongoing"):
+    return {
+        "index": str(index),
+        "balance": str(balance),
+        "status": status,
+        "validator": {
+            # NOTE: trailing null byte must survive fixed-width storage
+            "pubkey": "0x" + f"{index:02x}" * 47 + "00",
+            "effective_balance": "32000000000",
+            "slashed": False,
+            "activation_epoch": "1",
+            "exit_epoch": "18446744073709551615",
+        },
+    }
+
+
+@pytest.fixture
+def registry():
+    statuses = ("exited_unslashed", "active_ongoing")
+    items = [_item(i, 32000000000 + i, statuses[i % 2]) for i in range(6)]
+    return ValidatorRegistry.from_response(iter(items))
+
+
+def test_lookup(registry):
+    pubkey = "0x" + "03" * 47 + "00"
+    assert len(registry) == 6
+    assert registry.position("3") == 3
+    assert registry.position(pubkey) == 3
+    assert registry.position("0x" + "03" * 47) is None
+    assert registry.get("7") is None
+
+    actual = registry.get(pubkey)
+    assert actual.validator_index == 3
+    assert actual.pubkey.hex().endswith("0300")
+    assert actual.balance == 32000000003
+    assert actual.status == "active_ongoing"
+
+
+def test_filter_and_diff(registry):
+    active = registry.select(registry.with_status("active_ongoing"))
+    assert list(active.index) == [1, 3, 5]
+    assert active.balance.sum() == 3 * 32000000000 + 9
+
+    later = ValidatorRegistry.from_response([_item(i, 32000000010 + i) for i in range(2, 8)])
+    index, delta = registry.diff_balances(later)
+    assert list(index) == [2, 3, 4, 5]
+    assert np.all(delta == 10)
+
+
+def test_provider_serves_balance_from_registry(configured_beacon_test_provider):
+    registry = configured_beacon_test_provider.load_validator_registry()
+    assert configured_beacon_test_provider.validator_registry is registry
+    assert len(registry) == 2
+    assert registry.get(VALIDATORS["110280"]).balance == 32000000000
+    assert configured_beacon_test_provider.get_balance("110281") == 31000000000
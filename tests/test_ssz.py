@@ -0,0 +1,306 @@
+from copy import deepcopy
+from hashlib import sha256
+
+import pytest
+import responses  # type: ignore
+
+from ape_beacon.client import SSZ_ACCEPT, BeaconClient, BeaconClientSettings
+from ape_beacon.exceptions import SSZDecodingError
+from ape_beacon.ssz import (
+    BEACON_BLOCKS,
+    SIGNED_BEACON_BLOCKS,
+    ZERO_HASHES,
+    Bitlist,
+    ByteList,
+    Container,
+    SSZList,
+    compute_block_root,
+    compute_body_root,
+    decode_signed_beacon_block,
+    detect_version,
+    is_valid_merkle_branch,
+    merkleize,
+    uint64,
+)
+
+# NOTE: The mainnet genesis block and its well known root
+GENESIS_BLOCK = {
+    "slot": "0",
+    "proposer_index": "0",
+    "parent_root": "0x" + "00" * 32,
+    "state_root": "0x7e76880eb67bbdc86250aa578958e9d0675e64e714337855204fb5abaaf82c2b",
+    "body": {
+        "randao_reveal": "0x" + "00" * 96,
+        "eth1_data": {
+            "deposit_root": "0x" + "00" * 32,
+            "deposit_count": "0",
+            "block_hash": "0x" + "00" * 32,
+        },
+        "graffiti": "0x" + "00" * 32,
+        "proposer_slashings": [],
+        "attester_slashings": [],
+        "attestations": [],
+        "deposits": [],
+        "voluntary_exits": [],
+    },
+}
+GENESIS_ROOT = "4d611d5b93fdab69013a7f0a2f961caca0c853f87cfe9595fe50038163079360"
+PARENT_ROOT = "0x" + "11" * 32
+STATE_ROOT = "0x" + "22" * 32
+RANDAO_REVEAL = "0x" + "33" * 96
+SIGNATURE = "0x" + "44" * 96
+
+
+def _hex(byte: int, length: int) -> str:
+    return "0x" + bytes([byte]).hex() * length
+
+
+def _block(version: str):
+    # NOTE: A block with an attestation and, from bellatrix, transactions, in the JSON shape
+    checkpoint = {"epoch": "3", "root": _hex(0x55, 32)}
+    body = deepcopy(GENESIS_BLOCK["body"])
+    body["attestations"] = [
+        {
+            "aggregation_bits": "0xff0d",
+            "data": {
+                "slot": "100",
+                "index": "2",
+                "beacon_block_root": _hex(0x66, 32),
+                "source": checkpoint,
+                "target": dict(checkpoint, epoch="4"),
+            },
+            "signature": SIGNATURE,
+        }
+    ]
+    body["voluntary_exits"] = [
+        {"message": {"epoch": "5", "validator_index": "42"}, "signature": SIGNATURE}
+    ]
+    body["sync_aggregate"] = {
+        "sync_committee_bits": _hex(0xF0, 64),
+        "sync_committee_signature": SIGNATURE,
+    }
+    if version == "altair":
+        return {"message": dict(GENESIS_BLOCK, slot="101", body=body), "signature": SIGNATURE}
+
+    body["execution_payload"] = {
+        "parent_hash": _hex(0x01, 32),
+        "fee_recipient": _hex(0x02, 20),
+        "state_root": _hex(0x03, 32),
+        "receipts_root": _hex(0x04, 32),
+        "logs_bloom": _hex(0x05, 256),
+        "prev_randao": _hex(0x06, 32),
+        "block_number": "17000000",
+        "gas_limit": "30000000",
+        "gas_used": "21000",
+        "timestamp": "1681338455",
+        "extra_data": "0x6265617665726275696c64",
+        "base_fee_per_gas": "28000000000",
+        "block_hash": _hex(0x07, 32),
+        "transactions": ["0x02f87001", "0x", "0x" + "ab" * 300],
+    }
+    if version == "deneb":
+        body["execution_payload"].update(
+            withdrawals=[
+                {"index": "1", "validator_index": "7", "address": _hex(0x08, 20), "amount": "9"}
+            ],
+            blob_gas_used="131072",
+            excess_blob_gas="0",
+        )
+        body["bls_to_execution_changes"] = []
+        body["blob_kzg_commitments"] = [_hex(0x09, 48), _hex(0x0A, 48)]
+
+    return {"message": dict(GENESIS_BLOCK, slot="101", body=body), "signature": SIGNATURE}
+
+
+def _uint64(value: int) -> bytes:
+    return value.to_bytes(8, "little")
+
+
+def _offset(value: int) -> bytes:
+    return value.to_bytes(4, "little")
+
+
+@pytest.fixture
+def phase0_block_ssz():
+    # NOTE: SignedBeaconBlock(message offset, signature) then BeaconBlock with empty body lists
+    body = (
+        bytes.fromhex(RANDAO_REVEAL[2:])
+        + bytes(32)  # eth1_data.deposit_root
+        + _uint64(100596)  # eth1_data.deposit_count
+        + bytes(32)  # eth1_data.block_hash
+        + bytes(32)  # graffiti
+        + _offset(220) * 5  # empty proposer_slashings ... voluntary_exits
+    )
+    message = (
+        _uint64(1)
+        + _uint64(61090)
+        + bytes.fromhex(PARENT_ROOT[2:])
+        + bytes.fromhex(STATE_ROOT[2:])
+        + _offset(84)
+        + body
+    )
+    return _offset(100) + bytes.fromhex(SIGNATURE[2:]) + message
+
+
+def test_decode_signed_beacon_block(phase0_block_ssz):
+    actual = decode_signed_beacon_block(phase0_block_ssz, "phase0")
+    assert actual["version"] == "phase0"
+    assert actual["data"]["signature"] == SIGNATURE
+
+    message = actual["data"]["message"]
+    assert message["slot"] == "1"
+    assert message["proposer_index"] == "61090"
+    assert message["parent_root"] == PARENT_ROOT
+    assert message["state_root"] == STATE_ROOT
+    assert message["body"]["randao_reveal"] == RANDAO_REVEAL
+    assert message["body"]["eth1_data"]["deposit_count"] == "100596"
+    assert message["body"]["attestations"] == []
+    assert SIGNED_BEACON_BLOCKS["phase0"].serialize(actual["data"]) == phase0_block_ssz
+
+
+def test_decode_signed_beacon_block_raises_when_invalid(phase0_block_ssz):
+    with pytest.raises(SSZDecodingError):
+        decode_signed_beacon_block(phase0_block_ssz[:200], "phase0")
+
+    with pytest.raises(SSZDecodingError):
+        decode_signed_beacon_block(phase0_block_ssz, "unknown")
+
+
+@pytest.mark.parametrize("version", ("altair", "bellatrix", "deneb"))
+def test_serialize_round_trip(version):
+    block = _block(version)
+    schema = SIGNED_BEACON_BLOCKS[version]
+    data = schema.serialize(block)
+    assert decode_signed_beacon_block(data, version) == {"version": version, "data": block}
+
+    # NOTE: Decoded blocks hash to the same root as the JSON they round-trip with
+    decoded = schema.decode(memoryview(data))["message"]
+    assert compute_block_root(decoded) == compute_block_root(block["message"])
+
+
+def test_decode_variable_size_list():
+    schema = Container(("index", uint64), ("items", SSZList(ByteList(16), 4)))
+    items = _offset(8) + _offset(10) + b"\x01\x02" + b"\x03"
+    data = _uint64(7) + _offset(12) + items
+    assert schema.decode(memoryview(data)) == {"index": "7", "items": ["0x0102", "0x03"]}
+
+
+@responses.activate
+def test_client_get_block_when_ssz(phase0_block_ssz):
+    url = "http://localhost:5051/eth/v2/beacon/blocks/1"
+    responses.get(
+        url,
+        body=phase0_block_ssz,
+        content_type="application/octet-stream",
+        headers={"Eth-Consensus-Version": "phase0"},
+    )
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(ssz=True))
+    actual = client.get_block("1")
+    assert actual == decode_signed_beacon_block(phase0_block_ssz, "phase0")
+    assert responses.calls[0].request.headers["Accept"].startswith("application/octet-stream")
+
+
+@responses.activate
+def test_client_get_block_falls_back_to_json():
+    url = "http://localhost:5051/eth/v2/beacon/blocks/1"
+    responses.get(url, status=406)
+    responses.get(url, json={"version": "phase0", "data": {"message": {"slot": "1"}}})
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(ssz=True))
+    actual = client.get_block("1")
+    assert actual["data"]["message"]["slot"] == "1"
+
+
+@responses.activate
+def test_client_get_block_stops_ssz_for_unknown_fork(phase0_block_ssz):
+    url = "http://localhost:5051/eth/v2/beacon/blocks/1"
+    responses.get(
+        url,
+        body=phase0_block_ssz,
+        content_type="application/octet-stream",
+        headers={"Eth-Consensus-Version": "electra"},
+    )
+    responses.get(url, json={"version": "electra", "data": {"message": {"slot": "1"}}})
+    client = BeaconClient("http://localhost:5051", settings=BeaconClientSettings(ssz=True))
+    assert client.get_block("1")["version"] == "electra"
+
+    # NOTE: Blocks of later forks are requested as JSON only, not downloaded twice
+    client.get_block("1")
+    assert len(responses.calls) == 3
+    assert responses.calls[2].request.headers["Accept"] != SSZ_ACCEPT
+
+
+def _hash(left: bytes, right: bytes) -> bytes:
+    return sha256(left + right).digest()
+
+
+def test_compute_block_root():
+    assert compute_block_root(GENESIS_BLOCK).hex() == GENESIS_ROOT
+
+
+@pytest.mark.parametrize("version", ("altair", "bellatrix", "deneb"))
+def test_detect_version(version):
+    assert detect_version(_block(version)["message"]["body"]) == version
+
+
+def test_detect_version_raises_when_unknown_fields():
+    # NOTE: Electra adds `execution_requests`, which would be left out of the root
+    body = dict(_block("deneb")["message"]["body"], execution_requests={})
+    with pytest.raises(ValueError, match="execution_requests"):
+        detect_version(body)
+
+    del body["execution_requests"]
+    payload = dict(body.pop("execution_payload"), unknown="0x")
+    with pytest.raises(ValueError, match="unknown"):
+        compute_body_root(dict(body, execution_payload=payload))
+
+
+def test_merkleize():
+    chunks = [bytes([i]) * 32 for i in range(3)]
+    expect = _hash(_hash(chunks[0], chunks[1]), _hash(chunks[2], ZERO_HASHES[0]))
+    assert merkleize(b"".join(chunks)) == expect
+
+    # NOTE: Padding up to the limit uses the zero subtree roots
+    expect = _hash(_hash(expect, ZERO_HASHES[2]), ZERO_HASHES[3])
+    assert merkleize(b"".join(chunks), limit=16) == expect
+    assert merkleize(b"", limit=16) == ZERO_HASHES[4]
+
+    with pytest.raises(ValueError):
+        merkleize(b"".join(chunks), limit=2)
+
+
+def test_bitlist_hash_tree_root():
+    # NOTE: Bits 1, 0, 1 then the delimiter bit
+    root = merkleize(b"\x05".ljust(32, b"\x00"), limit=8)
+    expect = _hash(root, (3).to_bytes(32, "little"))
+    assert Bitlist(2048).hash_tree_root("0x0d") == expect
+
+    # NOTE: A delimiter in its own byte
+    root = merkleize(b"\xff".ljust(32, b"\x00"), limit=8)
+    assert Bitlist(2048).hash_tree_root("0xff01") == _hash(root, (8).to_bytes(32, "little"))
+
+
+def test_list_hash_tree_root():
+    schema = SSZList(uint64, 8)
+    root = merkleize((1).to_bytes(8, "little") + (2).to_bytes(8, "little") + bytes(16), limit=2)
+    assert schema.hash_tree_root(["1", "2"]) == _hash(root, (2).to_bytes(32, "little"))
+
+    with pytest.raises(ValueError):
+        schema.hash_tree_root(["1"] * 9)
+
+
+def test_merkle_proof():
+    block = deepcopy(GENESIS_BLOCK)
+    block["body"]["graffiti"] = "0x" + "ab" * 32
+    root = compute_block_root(block)
+    schema = BEACON_BLOCKS["phase0"]
+
+    leaf, branch, index = schema.merkle_proof(block, ["body"])
+    assert leaf == compute_body_root(block["body"])
+    assert is_valid_merkle_branch(leaf, branch, len(branch), index, root)
+
+    leaf, branch, index = schema.merkle_proof(block, ["body", "graffiti"])
+    assert leaf == bytes.fromhex("ab" * 32)
+    assert len(branch) == 3 + 3  # NOTE: 5 block fields then 8 phase0 body fields
+    assert is_valid_merkle_branch(leaf, branch, len(branch), index, root)
+    assert not is_valid_merkle_branch(leaf, branch, len(branch), index ^ 1, root)
+    assert not is_valid_merkle_branch(bytes(32), branch, len(branch), index, root)
@@ -0,0 +1,97 @@
+from copy import deepcopy
+
+import pytest
+from ape.api.networks import LOCAL_NETWORK_NAME
+
+from ape_beacon.store import MISSED_SLOT, BlockStore
+
+from .helpers.mock.provider import LocalBeaconProvider  # type: ignore
+
+ROOT = "0x6a89af5df908893eedbed10ba4c13fc13d5653ce57db637e3bfded73a987bb87"
+CHILD_ROOT = "0x" + "cc" * 32
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "blocks.sqlite"
+
+
+@pytest.fixture
+def storing_beacon_test_provider(beacon, store_path):
+    network = beacon.networks[LOCAL_NETWORK_NAME]
+    provider = LocalBeaconProvider(
+        name="adhoc",
+        network=network,
+        provider_settings={"block_store": True, "block_store_path": store_path},
+        data_folder=network.data_folder,
+        request_header=network.request_header,
+    )
+    provider.connect()
+    yield provider
+    provider.disconnect()
+
+
+def test_put_and_get(store_path):
+    store = BlockStore(store_path)
+    store.put(1, {"slot": "1"}, root=ROOT)
+    store.put(2, None)
+    assert store.get(slot=1) == {"slot": "1"}
+    assert store.get(root=ROOT) == {"slot": "1"}
+    assert store.get(slot=2) is MISSED_SLOT
+    assert store.get(slot=3) is None
+    assert store.count(0, 3) == 2
+    store.close()
+
+
+def test_missing_ranges(store_path):
+    store = BlockStore(store_path)
+    store.mark_complete(1, 2)
+    store.mark_complete(5, 6)
+    store.mark_complete(3, 3)
+    assert store.complete_ranges() == [(1, 3), (5, 6)]
+    assert list(store.missing_ranges(0, 10)) == [(0, 0), (4, 4), (7, 10)]
+    assert list(store.missing_ranges(1, 3)) == []
+    store.close()
+
+
+def test_provider_persists_finalized_blocks(storing_beacon_test_provider, store_path):
+    calls = storing_beacon_test_provider.beacon_backend.calls
+    num_calls = len(calls)
+    expect = storing_beacon_test_provider.get_block(1)
+    assert BlockStore(store_path).get(slot=1) is not None
+    urls = [call.request.url for call in calls[num_calls:]]
+    assert urls[-1] == storing_beacon_test_provider.uri + "/eth/v2/beacon/blocks/1"
+    assert not any("/eth/v1/beacon/headers/1" in url for url in urls)
+
+    # NOTE: a fresh cache must be served from the store
+    storing_beacon_test_provider.block_cache.clear()
+    actual = storing_beacon_test_provider.get_block(1)
+    assert actual == expect
+    assert storing_beacon_test_provider.block_cache.stats.misses == 1
+
+
+def test_block_ranges_skip_stored(storing_beacon_test_provider):
+    list(storing_beacon_test_provider.get_blocks(1, 1))
+    actual = list(storing_beacon_test_provider.block_ranges(0, 3, page=10, skip_stored=True))
+    assert actual == [(0, 0), (2, 3)]
+
+
+def test_get_blocks_stores_roots_from_children(storing_beacon_test_provider, store_path):
+    provider = storing_beacon_test_provider
+    block = deepcopy(provider.beacon.get_block("1"))
+    block["data"]["message"].update(slot="3", parent_root=ROOT)
+    provider.beacon_backend.get(f"{provider.uri}/eth/v2/beacon/blocks/3", json=block)
+    provider._finalized_slot, provider._finalized_slot_expires_at = 3, float("inf")
+
+    list(provider.get_blocks(1, 3))
+    assert BlockStore(store_path).get(root=ROOT)["slot"] == "1"
+    assert BlockStore(store_path).get(root=CHILD_ROOT) is None
+
+
+def test_provider_stores_only_blocks_fetched_by_slot(storing_beacon_test_provider, store_path):
+    provider = storing_beacon_test_provider
+    block = deepcopy(provider.beacon.get_block("1"))
+    provider.beacon_backend.get(f"{provider.uri}/eth/v2/beacon/blocks/{CHILD_ROOT}", json=block)
+
+    provider.get_block(CHILD_ROOT)
+    assert BlockStore(store_path).get(slot=1) is None
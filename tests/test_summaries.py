@@ -0,0 +1,61 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from ape_beacon.summaries import BlockSummaries, BlockSummary
+
+
+def _message(slot: int):
+    return {
+        "slot": str(slot),
+        "proposer_index": str(100 + slot),
+        "parent_root": "0x" + f"{slot:02x}" * 31 + "00",  # NOTE: trailing null byte must survive
+        "state_root": "0x" + f"{slot + 1:02x}" * 32,
+        "body": {
+            "eth1_data": {"deposit_count": "1"},
+            "attestations": [{}] * slot,
+            "voluntary_exits": [{}],
+            "execution_payload": {"timestamp": str(1660000000 + 12 * slot), "transactions": []},
+        },
+    }
+
+
+@pytest.fixture
+def summaries():
+    return BlockSummaries.from_response(_message(slot) for slot in (5, 3, 4, 8))
+
+
+def test_lookup(summaries):
+    assert len(summaries) == 4
+    assert summaries.position(4) == 2
+    assert summaries.get(6) is None
+
+    actual = summaries.get(3)
+    assert actual.proposer_index == 103
+    assert actual.parent_root.hex().endswith("0300")
+    assert actual.timestamp == 1660000036
+    assert actual.num_attestations == 3
+    assert actual.num_voluntary_exits == 1
+    assert list(summaries)[1] == actual
+
+
+def test_select(summaries):
+    selected = summaries.select(summaries.counters["num_attestations"] > 4)
+    assert list(selected.slot) == [5, 8]
+    assert selected.timestamp.dtype == np.uint64
+
+
+def test_to_block(beacon):
+    message = _message(7)
+    summary = BlockSummary.from_response(message)
+    expect = beacon.decode_block(deepcopy(message), trusted=True)
+    assert BlockSummary.from_block(expect) == summary
+
+    actual = summary.to_block()
+    assert actual.number == expect.number
+    assert actual.hash == expect.hash
+    assert actual.parent_hash == expect.parent_hash
+    assert actual.timestamp == expect.timestamp
+    assert actual.proposer_index == expect.proposer_index
+    assert actual.body.num_attestations == 7